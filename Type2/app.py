@@ -3,19 +3,25 @@ AI 뉴스 어시스턴트 - 리팩터링된 메인 애플리케이션
 """
 import streamlit as st
 import pandas as pd
-from datetime import datetime
+from datetime import datetime, timedelta
 
 # 로컬 모듈 임포트
 from database import NewsDatabase
 from news_scraper import NewsScraper
+from batch_runner import CRAWL, run_crawl_batch, run_summary_batch, start_crawl_run, start_summary_run
 
 from enhanced_news_summarizer import EnhancedNewsSummarizer
+from story_clustering import collapse_story_clusters
 from ui_components import (
     render_header, render_navigation, render_sidebar,
     render_news_table, render_summary_result,
     render_detailed_news_summary,
-    render_db_news_selection, render_grouped_agency_buttons
+    render_db_news_selection, render_grouped_agency_buttons,
+    render_related_summaries
 )
+# 저장된 뉴스 보기 페이지 크기
+DB_NEWS_PAGE_SIZE = 100
+
 # PPT 스타일 전역 CSS 적용
 st.markdown("""
 <style>
@@ -236,7 +242,147 @@ def initialize_session_state():
     # AI 요약기 초기화 (API 키가 있는 경우)
     if 'enhanced_summarizer' not in st.session_state and st.session_state.get('api_key'):
         from enhanced_news_summarizer import EnhancedNewsSummarizer
-        st.session_state.enhanced_summarizer = EnhancedNewsSummarizer(st.session_state.api_key)
+        st.session_state.enhanced_summarizer = EnhancedNewsSummarizer(st.session_state.api_key, db=st.session_state.db)
+
+def get_summarizer():
+    """세션의 AI 요약기 (없으면 생성)"""
+    if 'enhanced_summarizer' not in st.session_state:
+        from enhanced_news_summarizer import EnhancedNewsSummarizer
+        st.session_state.enhanced_summarizer = EnhancedNewsSummarizer(st.session_state.api_key, db=st.session_state.db)
+    return st.session_state.enhanced_summarizer
+
+def execute_summary_run(db, summarizer, run_id, retry_failed=False):
+    """요약 작업 실행 (진행 상황 표시) - 본문 가져오기 / 요약 단계마다 기록하므로 중단되면 남은 단계부터 이어서 실행
+
+    반환: (요약 결과 목록, 실패한 기사 설명 목록)
+    """
+    results = []
+    failed = []
+    if run_id is None:
+        st.error("❌ 요약 작업을 만들지 못했습니다.")
+        return results, failed
+    total = db.get_batch_run(run_id)['total']
+    progress_bar = st.progress(0)
+    status_text = st.empty()
+    for i, (news, result, error) in enumerate(run_summary_batch(db, run_id, summarizer, retry_failed)):
+        status_text.text(f"🪄 요약 처리 완료 ({i+1}/{total}): {news['title'][:20]}...")
+        if result:
+            results.append(result)
+        else:
+            failed.append(f"{news['title']} ({error or '요약 실패'})")
+        progress_bar.progress((i + 1) / total)
+    status_text.text("✅ 작업 완료!")
+    return results, failed
+
+def render_summary_batch_results(results, failed, key="btn_refresh_after_summary"):
+    """요약 작업 결과 표시"""
+    if results:
+        st.success(f"총 {len(results)}개의 요약이 준비되었습니다.")
+        for res in results:
+            with st.expander(f"📄 {res['title']} ({res['source_name']})", expanded=True):
+                st.markdown(f"**URL:** {res['url']}")
+                st.markdown(f"**카테고리:** {res['category']} | **작성일:** {res['created_at']}")
+                if res.get('reused_from'):
+                    st.caption(f"♻️ 본문이 거의 같은 기사의 요약본을 재사용했습니다: {res['reused_from']}")
+                st.markdown("### 📝 요약 내용")
+                st.write(res['summary'])
+        if st.button("🔄 테이블 상태 새로고침", key=key):
+            st.rerun()
+    if failed:
+        st.error(f"⚠️ 다음 {len(failed)}건 처리에 실패했습니다: " + ", ".join(failed))
+
+def render_unfinished_runs(db):
+    """중단된 일괄 작업 목록과 이어하기 / 취소 버튼"""
+    runs = db.get_unfinished_batch_runs()
+    if not runs:
+        return
+    resume_run = None
+    with st.expander(f"⏯️ 중단된 작업 {len(runs)}건 (새로고침 / 오류로 끝나지 않은 수집·요약)", expanded=False):
+        for run in runs:
+            counts = run['counts']
+            remaining = counts.get('pending', 0) + counts.get('extracted', 0)
+            label = "뉴스 수집" if run['kind'] == CRAWL else "기사 요약"
+            col_info, col_resume, col_cancel = st.columns([4, 1, 1])
+            with col_info:
+                info = f"**{label}** #{run['id']} · 시작 {run['created_at']}(UTC) · 남은 항목 {remaining}/{run['total']}"
+                if counts.get('failed'):
+                    info += f" · 실패 {counts['failed']}건 (이어하기 시 재시도)"
+                st.markdown(info)
+            with col_resume:
+                if st.button("▶️ 이어하기", key=f"btn_resume_run_{run['id']}", use_container_width=True):
+                    resume_run = run
+            with col_cancel:
+                if st.button("🗑️ 취소", key=f"btn_cancel_run_{run['id']}", use_container_width=True):
+                    db.finish_batch_run(run['id'], "cancelled")
+                    st.rerun()
+
+    if resume_run is None:
+        return
+    if resume_run['kind'] == CRAWL:
+        execute_crawl_run(db, resume_run['id'], retry_failed=True)
+    elif not st.session_state.get('api_key'):
+        st.error("❌ OpenAI API 키가 필요합니다.")
+    else:
+        results, failed = execute_summary_run(db, get_summarizer(), resume_run['id'], retry_failed=True)
+        render_summary_batch_results(results, failed, key="btn_refresh_after_resume")
+
+def execute_crawl_run(db, run_id, retry_failed=False):
+    """수집 작업 실행 (진행 상황 표시) - 중단되었던 작업은 아직 수집하지 않은 소스부터 이어서 실행"""
+    if run_id is None:
+        st.error("❌ 수집 작업을 만들지 못했습니다.")
+        return
+    with st.spinner("🔍 뉴스를 수집하는 중입니다... 잠시만 기다려주세요."):
+        scraper = NewsScraper(db=db)
+        run = db.get_batch_run(run_id)
+        all_news = []
+        new_count = 0
+
+        # 진행 상황 표시
+        progress_bar = st.progress(0)
+        status_text = st.empty()
+
+        total_sources = run['counts'].get('pending', 0) + (run['counts'].get('failed', 0) if retry_failed else 0)
+        failed_sources = 0
+
+        # 뉴스 수집 (소스별 병렬, 같은 언론사 요청은 호스트별로 조절) - 소스마다 저장 후 진행 상태 기록
+        for idx, (source, news_items, added_count) in enumerate(run_crawl_batch(db, run_id, scraper, retry_failed)):
+            status_text.text(f"📡 수집 완료 ({idx+1}/{total_sources}): {source['source_name']} - {source['category']}")
+            if news_items is None:
+                failed_sources += 1
+            elif news_items:
+                new_count += added_count
+                all_news.extend(news_items)
+            progress_bar.progress((idx + 1) / total_sources)
+
+        if all_news:
+            # 동일 사건 클러스터 ID 부여 (대표 기사 묶기용)
+            cluster_ids = db.get_cluster_ids([n['url'] for n in all_news])
+            for news in all_news:
+                news['cluster_id'] = cluster_ids.get(news['url'])
+            st.session_state.news_list = all_news
+            st.session_state.news_cursor = None
+            st.session_state.view_filter = None # 필터 초기화
+
+            msg = f"✅ 총 {len(all_news)}개의 뉴스를 가져왔습니다!"
+            if new_count > 0:
+                msg += f" (새로운 뉴스 {new_count}개 저장)"
+            else:
+                msg += " (모두 이미 저장된 뉴스입니다)"
+            cache_stats = scraper.http_cache.stats()
+            if cache_stats['hits'] or cache_stats['revalidated']:
+                msg += f" · HTTP 캐시 적중률 {cache_stats['hit_ratio']:.0%}"
+
+            st.success(msg)
+            st.rerun()
+        elif total_sources and failed_sources == total_sources:
+            st.error("❌ 선택한 언론사에서 뉴스를 가져오지 못했습니다. 잠시 후 다시 시도해주세요.")
+            progress_bar.empty()
+            status_text.empty()
+        else:
+            # 수집기는 새 기사만 돌려주므로 빈 결과는 '마지막 수집 이후 새 기사 없음'
+            st.info("ℹ️ 마지막 수집 이후 새로 올라온 뉴스가 없습니다. 기존 뉴스는 '저장된 뉴스 보기'에서 확인하세요.")
+            progress_bar.empty()
+            status_text.empty()
 
 def show_news_page():
     """뉴스 요약 페이지"""
@@ -274,26 +420,24 @@ def show_news_page():
     col_db, col_fetch = st.columns(2)
     
     with col_db:
+        period_options = {"전체 기간": None, "최근 24시간": 1, "최근 7일": 7, "최근 30일": 30}
+        selected_period = st.selectbox("수집 기간", list(period_options.keys()), key="db_period_select", label_visibility="collapsed")
         if st.button("📂 저장된 뉴스 보기 (DB)", use_container_width=True):
             with st.spinner("💾 저장된 뉴스를 불러오는 중..."):
-                saved_news = db.get_scraped_news(limit=300) # 최근 300개
+                # 사이드바 필터를 SQL 조건으로 전달하고 페이지 단위로 조회
+                days = period_options[selected_period]
+                st.session_state.db_news_filters = {
+                    'category': selected_categories,
+                    'source_name': selected_sources,
+                    'since': (datetime.utcnow() - timedelta(days=days)).strftime("%Y-%m-%d %H:%M:%S") if days else None,
+                }
+                saved_news = db.get_scraped_news(limit=DB_NEWS_PAGE_SIZE, **st.session_state.db_news_filters)
                 
-                # 현재 선택된 필터 적용 (옵션)
-                # 만약 사이드바 필터에 맞춰서 보여주고 싶다면 여기서 필터링
-                filtered_saved = []
-                for news in saved_news:
-                    # 카테고리 필터
-                    if "전체" not in selected_categories and news['category'] not in selected_categories:
-                        continue
-                    # 소스 필터
-                    if "전체" not in selected_sources and news['source_name'] not in selected_sources:
-                        continue
-                    filtered_saved.append(news)
-                
-                if filtered_saved:
-                    st.session_state.news_list = filtered_saved
+                if saved_news:
+                    st.session_state.news_list = list(saved_news)
+                    st.session_state.news_cursor = saved_news.next_cursor
                     st.session_state.view_filter = None
-                    st.success(f"✅ 저장된 뉴스 {len(filtered_saved)}개를 불러왔습니다.")
+                    st.success(f"✅ 저장된 뉴스 {len(saved_news)}개를 불러왔습니다.")
                     st.rerun()
                 else:
                     st.warning("⚠️ 조건에 맞는 저장된 뉴스가 없습니다.")
@@ -303,50 +447,44 @@ def show_news_page():
             if not target_sources:
                 st.warning("⚠️ 선택된 조건에 맞는 뉴스 소스가 없습니다.")
             else:
-                with st.spinner("🔍 뉴스를 수집하는 중입니다... 잠시만 기다려주세요."):
-                    scraper = NewsScraper()
-                    all_news = []
-                    new_count = 0
-                    
-                    # 진행 상황 표시
-                    progress_bar = st.progress(0)
-                    status_text = st.empty()
-                    
-                    total_sources = len(target_sources)
-                    
-                    for idx, source in enumerate(target_sources):
-                        status_text.text(f"📡 수집 중 ({idx+1}/{total_sources}): {source['source_name']} - {source['category']}")
-                        try:
-                            # 1. 뉴스 수집
-                            news_items = scraper.get_news_by_category(source['category'], source['source_name'])
-                            
-                            if news_items:
-                                # 2. DB 저장 (Bulk)
-                                added_count = db.save_crawled_news(news_items)
-                                new_count += added_count
-                                
-                                all_news.extend(news_items)
-                        except Exception as e:
-                            print(f"Error scraping {source['source_name']}: {e}")
-                        
-                        progress_bar.progress((idx + 1) / total_sources)
-                    
-                    if all_news:
-                        st.session_state.news_list = all_news
-                        st.session_state.view_filter = None # 필터 초기화
-                        
-                        msg = f"✅ 총 {len(all_news)}개의 뉴스를 가져왔습니다!"
-                        if new_count > 0:
-                            msg += f" (새로운 뉴스 {new_count}개 저장)"
-                        else:
-                            msg += " (모두 이미 저장된 뉴스입니다)"
-                        
-                        st.success(msg)
-                        st.rerun()
-                    else:
-                        st.warning("⚠️ 뉴스를 찾을 수 없습니다.")
-                        progress_bar.empty()
-                        status_text.empty()
+                execute_crawl_run(db, start_crawl_run(db, target_sources))
+
+    # [중단된 수집 / 요약 작업 이어하기]
+    render_unfinished_runs(db)
+
+    # [저장된 뉴스 전문 검색]
+    search_query = st.text_input("🔎 저장된 뉴스 검색", placeholder="제목, 요약 내용으로 검색 (예: 원내대표 선출)", key="news_search_query")
+    if search_query:
+        search_results = db.search(search_query, limit=50)
+        with st.expander(f"🔎 '{search_query}' 검색 결과 ({len(search_results)}건)", expanded=True):
+            if not search_results:
+                st.info("ℹ️ 검색 결과가 없습니다.")
+            for result in search_results:
+                label = "📝 요약본" if result['type'] == 'summary' else "📰 수집 뉴스"
+                st.markdown(f"{label} | **[{result['title']}]({result['url']})** ({result['source_name']} · {result['category']})")
+                if result['snippet'] and result['snippet'] != result['title']:
+                    st.caption(result['snippet'])
+
+            scraped_hits = [r for r in search_results if r['type'] == 'scraped']
+            if scraped_hits and st.button(f"📥 검색된 수집 뉴스 {len(scraped_hits)}건 목록으로 보기", key="btn_load_search_results"):
+                st.session_state.news_list = [
+                    {'title': r['title'], 'url': r['url'], 'source_name': r['source_name'], 'category': r['category']}
+                    for r in scraped_hits
+                ]
+                st.session_state.news_cursor = None
+                st.session_state.view_filter = None
+                st.rerun()
+
+    # [저장된 뉴스 다음 페이지 불러오기]
+    if st.session_state.get('news_cursor'):
+        if st.button(f"⬇️ 저장된 뉴스 {DB_NEWS_PAGE_SIZE}개 더 불러오기", use_container_width=True, key="btn_load_more_news"):
+            next_page = db.get_scraped_news(
+                limit=DB_NEWS_PAGE_SIZE, cursor=st.session_state.news_cursor,
+                **st.session_state.get('db_news_filters', {})
+            )
+            st.session_state.news_list = st.session_state.news_list + list(next_page)
+            st.session_state.news_cursor = next_page.next_cursor
+            st.rerun()
 
     st.markdown("---")
 
@@ -414,17 +552,22 @@ def show_news_page():
         else:
             sidebar_active = ("전체" not in selected_categories) or ("전체" not in selected_sources)
             filter_info = "사이드바 필터 적용됨" if sidebar_active else "전체"
+
+        # 4. 동일 사건 기사 묶기 (대표 기사만 표시)
+        if st.checkbox("🧩 같은 사건 기사는 대표 기사만 보기", value=False, key="collapse_story_clusters"):
+            display_list = collapse_story_clusters(display_list)
             
         if not display_list:
              st.info(f"ℹ️ '{filter_info}'에 해당하는 수집된 뉴스가 없습니다. (전체 {len(news_list)}개 중)")
         else:
-            # [요약 상태 확인] 각 뉴스 항목에 대해 DB 확인 (성능 고려하여 이 시점에 수행)
+            # [요약 상태 확인] 표시할 뉴스 전체를 한 번의 쿼리로 확인 (요약 본문은 상세보기에서 지연 로딩)
             db = st.session_state.db
+            summary_status = db.get_summary_status_by_urls([news['url'] for news in display_list])
             for news in display_list:
-                existing = db.get_news_by_url(news['url'])
+                existing = summary_status.get(news['url'])
                 news['is_summarized'] = True if existing else False
                 if existing:
-                    news['summary_content'] = existing.get('summary') # 종합 분석용으로 저장
+                    news['summary_id'] = existing['id']
 
             with st.expander(f"📊 검색 결과 ({len(display_list)}건) - {filter_info}", expanded=True):
                 # 카테고리 표시 문자열 생성
@@ -458,56 +601,15 @@ def show_news_page():
                             else:
                                 progress_container = st.container()
                                 with progress_container:
-                                    progress_bar = st.progress(0)
-                                    status_text = st.empty()
-                                    if 'enhanced_summarizer' not in st.session_state:
-                                        from enhanced_news_summarizer import EnhancedNewsSummarizer
-                                        st.session_state.enhanced_summarizer = EnhancedNewsSummarizer(st.session_state.api_key)
-                                    summarizer = st.session_state.enhanced_summarizer
+                                    summarizer = get_summarizer()
                                     db = st.session_state.db
-                                    results = []
-                                    failed = []
-                                    for i, (_, row) in enumerate(selected_rows_for_action.iterrows()):
-                                        title = row['제목']
-                                        url = row['URL']
-                                        source_name = row['뉴스 업체']
-                                        category = row['카테고리']
-                                        status_text.text(f"📝 요약 확인 중 ({i+1}/{selected_count}): {title[:20]}...")
-                                        existing_news = db.get_news_by_url(url)
-                                        if existing_news and existing_news.get('summary'):
-                                            results.append({
-                                                'title': title, 'url': url, 'source_name': source_name,
-                                                'category': category, 'summary': existing_news['summary'],
-                                                'created_at': existing_news['created_at']
-                                            })
-                                        else:
-                                            status_text.text(f"🪄 요약 생성 중 ({i+1}/{selected_count}): {title[:20]}...")
-                                            try:
-                                                result = summarizer.summarize_news_detailed(url, title)
-                                                if isinstance(result, dict):
-                                                    db.save_news_summary(title=title, url=url, category=category, source_name=source_name, summary=result['summary'])
-                                                    result['source_name'] = source_name
-                                                    result['category'] = category
-                                                    result['created_at'] = result['scraped_at']
-                                                    results.append(result)
-                                                else:
-                                                    failed.append(f"{title} (요약 실패)")
-                                            except Exception as e:
-                                                failed.append(f"{title} (오류: {str(e)})")
-                                        progress_bar.progress((i + 1) / selected_count)
-                                    status_text.text("✅ 작업 완료!")
-                                    if results:
-                                        st.success(f"총 {len(results)}개의 요약이 준비되었습니다.")
-                                        for res in results:
-                                            with st.expander(f"📄 {res['title']} ({res['source_name']})", expanded=True):
-                                                st.markdown(f"**URL:** {res['url']}")
-                                                st.markdown(f"**카테고리:** {res['category']} | **작성일:** {res['created_at']}")
-                                                st.markdown("### 📝 요약 내용")
-                                                st.write(res['summary'])
-                                        if st.button("🔄 테이블 상태 새로고침"):
-                                            st.rerun()
-                                    if failed:
-                                        st.error(f"⚠️ 다음 {len(failed)}건 처리에 실패했습니다: " + ", ".join(failed))
+                                    selected_news = [
+                                        {'title': row['제목'], 'url': row['URL'], 'source_name': row['뉴스 업체'], 'category': row['카테고리']}
+                                        for _, row in selected_rows_for_action.iterrows()
+                                    ]
+                                    # 요약 작업을 DB에 기록하면서 실행 (중단되면 '중단된 작업'에서 이어하기)
+                                    results, failed = execute_summary_run(db, summarizer, start_summary_run(db, selected_news))
+                                    render_summary_batch_results(results, failed)
                     else:
                         st.info("👆 위 목록에서 요약할 뉴스를 선택(체크)해주세요.")
 
@@ -524,8 +626,12 @@ def show_news_page():
                         )
                         if selected_for_view:
                             st.markdown(f"### 🎯 요약 리포트: {selected_for_view['title']}")
-                            st.info(selected_for_view.get('summary_content', "요약 내용을 불러오는 중..."))
+                            if not selected_for_view.get('summary_content') and selected_for_view.get('summary_id'):
+                                selected_for_view['summary_content'] = db.get_news_summary_text(selected_for_view['summary_id'])
+                            st.info(selected_for_view.get('summary_content') or "요약 내용을 불러오는 중...")
                             st.caption(f"출처: {selected_for_view['source_name']} | URL: {selected_for_view['url']}")
+                            if selected_for_view.get('summary_id'):
+                                render_related_summaries(db.get_related_summaries(selected_for_view['summary_id']))
                     else:
                         st.info("💡 아직 요약된 뉴스가 없습니다. 요약할 항목을 선택하고 버튼을 눌러주세요.")
 
@@ -541,39 +647,25 @@ def show_news_page():
                         if not st.session_state.get('api_key'):
                             st.error("❌ OpenAI API 키가 필요합니다.")
                         else:
-                            if 'enhanced_summarizer' not in st.session_state:
-                                from enhanced_news_summarizer import EnhancedNewsSummarizer
-                                st.session_state.enhanced_summarizer = EnhancedNewsSummarizer(st.session_state.api_key)
-                            summarizer = st.session_state.enhanced_summarizer
+                            summarizer = get_summarizer()
                             db = st.session_state.db
                             unsummarized_items = []
                             ready_items = []
+                            cluster_by_url = {n['url']: n.get('cluster_id') for n in display_list}
                             for _, row in selected_rows_for_action.iterrows():
                                 url = row['URL']
                                 title = row['제목']
                                 existing = db.get_news_by_url(url)
                                 if existing and existing.get('summary'):
-                                    ready_items.append({'title': title, 'summary': existing['summary']})
+                                    ready_items.append({'title': title, 'summary': existing['summary'], 'source_name': row['뉴스 업체'], 'cluster_id': cluster_by_url.get(url)})
                                 else:
-                                    unsummarized_items.append({'title': title, 'url': url, 'category': row['카테고리'], 'source_name': row['뉴스 업체']})
+                                    unsummarized_items.append({'title': title, 'url': url, 'category': row['카테고리'], 'source_name': row['뉴스 업체'], 'cluster_id': cluster_by_url.get(url)})
 
                             if unsummarized_items:
                                 st.info(f"⏳ {len(unsummarized_items)}건의 기사에 요약이 없어 요약을 먼저 생성합니다...")
-                                summarize_progress = st.progress(0)
-                                summarize_status = st.empty()
-                                for i, item in enumerate(unsummarized_items):
-                                    summarize_status.text(f"🪄 요약 생성 중 ({i+1}/{len(unsummarized_items)}): {item['title'][:20]}...")
-                                    try:
-                                        result = summarizer.summarize_news_detailed(item['url'], item['title'])
-                                        if isinstance(result, dict):
-                                            db.save_news_summary(title=item['title'], url=item['url'], category=item['category'], source_name=item['source_name'], summary=result['summary'])
-                                            ready_items.append({'title': item['title'], 'summary': result['summary']})
-                                        else:
-                                            ready_items.append({'title': item['title'], 'summary': "(요약 실패)"})
-                                    except Exception as e:
-                                        ready_items.append({'title': item['title'], 'summary': f"(Error: {str(e)})"})
-                                    summarize_progress.progress((i + 1) / len(unsummarized_items))
-                                summarize_status.text("✅ 요약 완료!")
+                                results, failed = execute_summary_run(db, summarizer, start_summary_run(db, unsummarized_items))
+                                ready_items.extend({'title': res['title'], 'summary': res['summary'], 'source_name': res['source_name'], 'cluster_id': res.get('cluster_id')} for res in results)
+                                ready_items.extend({'title': title, 'summary': "(요약 실패)"} for title in failed)
 
                             with st.spinner("🧐 종합 분석 중..."):
                                 analysis_result = summarizer.analyze_multi_news(ready_items)
@@ -627,10 +719,12 @@ def show_sources_page():
         category = st.selectbox("카테고리", categories)
     
     url = st.text_input("뉴스 페이지 URL", placeholder="https://example.com/news/category")
+    feed_url = st.text_input("RSS / 사이트맵 URL (선택)", placeholder="https://example.com/rss/category.xml",
+                             help="등록하면 뉴스 페이지보다 먼저 피드에서 기사 목록을 가져옵니다.")
     
     if st.button("💾 언론사 등록", use_container_width=True):
         if source_name and category and url:
-            success = db.add_news_source(source_name, category, url)
+            success = db.add_news_source(source_name, category, url, feed_url.strip() or None)
             if success:
                 st.success(f"✅ {source_name}의 {category} 카테고리가 등록되었습니다!")
                 st.rerun()
@@ -673,6 +767,7 @@ def show_sources_page():
                     '언론사': source['source_name'],
                     '카테고리': source['category'],
                     'URL': source['url'],
+                    '피드': source.get('feed_url') or '',
                     '등록일': source['created_at'][:10]
                 })
             
@@ -0,0 +1,201 @@
+"""
+재개 가능한 일괄 작업 (선택한 소스 전체 수집, 선택한 기사 요약)
+
+작업을 시작할 때 항목 목록(manifest)을 batch_runs / batch_run_items에 저장하고, 항목마다 단계가 끝날 때마다
+상태를 기록합니다 (수집: pending → fetched, 요약: pending → extracted → summarized, 실패하면 failed).
+브라우저 새로고침이나 프로세스 종료로 중단되어도 같은 실행 ID로 다시 호출하면 끝나지 않은 항목의 남은 단계만 실행하므로,
+이미 받은 본문을 다시 내려받거나 이미 만든 요약에 LLM 비용을 다시 쓰지 않습니다.
+
+요약 작업은 가져오기 → 파싱 → 본문 저장 → 요약 → 요약 저장 단계를 크기가 제한된 큐로 연결한 파이프라인으로 실행하여,
+단계마다 병목(네트워크 / CPU / DB 쓰기 / API 할당량)에 맞는 작업자 수로 동시에 진행합니다.
+"""
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from pipeline import Pipeline, Stage
+
+CRAWL = "crawl"
+SUMMARIZE = "summarize"
+
+
+def _source_key(source: Dict) -> str:
+    return f"{source['source_name']}/{source['category']}"
+
+
+def _finish_if_done(db, run_id: int):
+    run = db.get_batch_run(run_id)
+    if run and run['status'] == "running":
+        # fetched(수집 완료)와 summarized / failed는 끝난 상태
+        if not run['counts'].get('pending') and not run['counts'].get('extracted'):
+            db.finish_batch_run(run_id)
+
+
+def start_crawl_run(db, sources: List[Dict]) -> Optional[int]:
+    """소스(news_sources 행) 목록 수집 작업 생성"""
+    return db.create_batch_run(CRAWL, {_source_key(source): dict(source) for source in sources})
+
+
+def _crawl_item(db, run_id: int, scraper, source: Dict) -> Tuple[Dict, Optional[List[Dict]], int]:
+    news_list = scraper.scrape_source(source)
+    if news_list is None:
+        db.update_batch_run_item(run_id, _source_key(source), "failed", error="목록 수집 실패")
+        return source, None, 0
+    # 새 기사가 없어도 목록에서 본 URL은 소스별 최근 링에 기록
+    added = db.save_crawled_news(news_list, source)
+    if added is None:
+        db.update_batch_run_item(run_id, _source_key(source), "failed", error="목록 저장 실패")
+        return source, None, 0
+    db.update_batch_run_item(run_id, _source_key(source), "fetched", {'found': len(news_list), 'saved': added})
+    return source, news_list, added
+
+
+def run_crawl_batch(db, run_id: int, scraper, retry_failed: bool = False,
+                    max_workers: int = 8) -> Iterator[Tuple[Dict, Optional[List[Dict]], int]]:
+    """수집 작업의 남은 소스를 병렬 수집하여 끝나는 순서대로 (source, 새 기사 목록, 새로 저장된 건수) 반환
+
+    저장과 상태 기록은 작업 스레드에서 하므로, 호출한 쪽이 중간에 멈춰도(화면 새로고침) 이미 수집한 결과는 남고
+    아직 시작하지 않은 소스는 pending으로 남아 다음 실행에서 이어집니다. 실패한 소스는 새 기사 목록이 None입니다.
+    """
+    states = ["pending", "failed"] if retry_failed else ["pending"]
+    sources = [item['payload'] for item in db.get_batch_run_items(run_id, states)]
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures = [executor.submit(_crawl_item, db, run_id, scraper, source) for source in sources]
+        for future in as_completed(futures):
+            yield future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+    _finish_if_done(db, run_id)
+
+
+def start_summary_run(db, news_list: List[Dict]) -> Optional[int]:
+    """기사 목록(title, url, category, source_name) 요약 작업 생성"""
+    items = {
+        news['url']: {key: news.get(key) for key in ('title', 'url', 'category', 'source_name', 'cluster_id')}
+        for news in news_list
+    }
+    return db.create_batch_run(SUMMARIZE, items)
+
+
+def _saved_summary(news: Dict, saved: Dict) -> Dict:
+    return {
+        'title': news['title'], 'url': news['url'], 'source_name': news['source_name'],
+        'category': news['category'], 'cluster_id': news.get('cluster_id'), 'summary': saved['summary'],
+        'created_at': saved['created_at'], 'summary_id': saved['id'],
+    }
+
+
+class _SummaryStages:
+    """요약 작업 파이프라인 단계 함수 (작업 dict: news, item_key, state, page, content_data, result)"""
+
+    def __init__(self, db, run_id: int, summarizer, content_scraper):
+        self.db = db
+        self.run_id = run_id
+        self.summarizer = summarizer
+        self.content_scraper = content_scraper
+
+    def fetch(self, job: Dict) -> Dict:
+        """네트워크 단계: 저장된 본문이 없으면 원본 페이지 내려받기"""
+        url = job['news']['url']
+        job['content_data'] = self.db.get_article_content(url)
+        if job['content_data'] and job['content_data'].get('content'):
+            return job
+        failure = self.db.get_url_failure(url)
+        if failure:
+            raise RuntimeError(f"최근 추출에 실패한 URL ({failure['retry_at']} UTC 이후 재시도)")
+        job['page'] = self.content_scraper.fetch_page(url)
+        return job
+
+    def parse(self, job: Dict) -> Dict:
+        """CPU 단계: 페이지에서 본문 추출 (실패하면 Selenium으로 재시도)"""
+        page = job.pop('page', None)
+        if job['content_data'] and job['content_data'].get('content'):
+            return job
+        job['content_data'] = self.content_scraper.extract_content(job['news']['url'], page)
+        if not job['content_data']:
+            raise RuntimeError("본문을 가져올 수 없음")
+        job['content_data'].setdefault('url', job['news']['url'])
+        job['new_content'] = True
+        return job
+
+    def store(self, job: Dict) -> Dict:
+        """DB 쓰기 단계: 추출한 본문 저장 후 extracted로 기록"""
+        if job.pop('new_content', False):
+            self.db.save_article_content(job['content_data'])
+        if job['state'] != "extracted":
+            self.db.update_batch_run_item(self.run_id, job['item_key'], "extracted")
+        return job
+
+    def summarize(self, job: Dict) -> Dict:
+        """API 단계: LLM 요약 (DB에 쓰지 않고 결과만 다음 단계로 넘김)"""
+        news = job['news']
+        result = self.summarizer.summarize_article(news['url'], news['title'], job.pop('content_data'))
+        if not isinstance(result, dict):
+            raise RuntimeError(str(result))
+        job['result'] = result
+        return job
+
+    def save(self, job: Dict) -> Dict:
+        """DB 쓰기 단계: 요약 저장 후 summarized로 기록"""
+        news = job['news']
+        result = job.pop('result')
+        summary_id = self.db.save_news_summary(title=news['title'], url=news['url'], category=news['category'],
+                                               source_name=news['source_name'], summary=result['summary'],
+                                               content=result.get('full_content'),
+                                               published_at=result.get('published_at'))
+        if summary_id is None:
+            raise RuntimeError("요약 저장 실패")
+        self.db.update_batch_run_item(self.run_id, job['item_key'], "summarized", {'summary_id': summary_id})
+        result.update({'source_name': news['source_name'], 'category': news['category'],
+                       'cluster_id': news.get('cluster_id'), 'created_at': result['scraped_at'],
+                       'summary_id': summary_id})
+        job['result'] = result
+        return job
+
+
+def run_summary_batch(db, run_id: int, summarizer, retry_failed: bool = False, fetch_workers: int = 6,
+                      parse_workers: int = 2, summarize_workers: int = 3,
+                      content_scraper=None) -> Iterator[Tuple[Dict, Optional[Dict], Optional[str]]]:
+    """요약 작업의 남은 항목을 파이프라인으로 처리하여 끝나는 순서대로 (기사, 요약 결과, 오류) 반환
+
+    이미 요약된 항목은 저장된 요약을, 실패한 항목은 retry_failed가 아니면 기록된 오류를 먼저 그대로 반환합니다.
+    fetch_workers / parse_workers / summarize_workers: 네트워크 / CPU / LLM API 단계 작업자 수
+    (본문 저장 / 요약 저장 단계는 각각 작업자 1개 - 요약 작업자는 DB에 쓰지 않음)
+    """
+    if content_scraper is None:
+        from news_content_scraper import NewsContentScraper
+        content_scraper = NewsContentScraper(db=db)
+
+    jobs = []
+    items = db.get_batch_run_items(run_id)
+    # 이 실행이나 다른 화면에서 이미 요약한 기사는 저장된 요약 사용 (한 번에 조회)
+    saved_summaries = db.get_news_by_urls([item['payload']['url'] for item in items])
+    for item in items:
+        news = item['payload']
+        if item['state'] == "failed" and not retry_failed:
+            yield news, None, item['error']
+            continue
+        saved = saved_summaries.get(news['url'])
+        if saved and saved.get('summary'):
+            if item['state'] != "summarized":
+                db.update_batch_run_item(run_id, item['item_key'], "summarized", {'summary_id': saved['id']})
+            yield news, _saved_summary(news, saved), None
+            continue
+        jobs.append({'news': news, 'item_key': item['item_key'], 'state': item['state']})
+
+    if jobs:
+        stages = _SummaryStages(db, run_id, summarizer, content_scraper)
+        pipeline = Pipeline([
+            Stage("fetch", stages.fetch, workers=fetch_workers),
+            Stage("parse", stages.parse, workers=parse_workers),
+            Stage("store", stages.store, workers=1),
+            Stage("summarize", stages.summarize, workers=summarize_workers),
+            Stage("save", stages.save, workers=1),
+        ])
+        for job in pipeline.run(jobs):
+            if job.get('error'):
+                db.update_batch_run_item(run_id, job['item_key'], "failed", error=job['error'])
+            yield job['news'], job.get('result'), job.get('error')
+        # 관련 기사 검색용 임베딩은 저장할 때마다가 아니라 작업이 끝난 뒤 한 번에 생성
+        db.index_summary_embeddings()
+    _finish_if_done(db, run_id)
@@ -0,0 +1,136 @@
+"""
+호스트별 회로 차단기 (closed / open / half-open)
+
+연속 실패가 failure_threshold번 쌓이면 회로를 열어(open) 해당 호스트 요청을 즉시 실패시키고,
+reset_timeout이 지나면 요청 하나만 시험 삼아 보내(half-open) 성공하면 닫고 실패하면 대기 시간을 두 배로 늘려 다시 엽니다.
+"""
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+
+class CircuitOpenError(requests.ConnectionError):
+    """회로가 열려 있어 요청을 보내지 않음 (기존 requests 예외 처리 경로로 처리되도록 ConnectionError 상속)"""
+
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 60.0, max_reset_timeout: float = 900.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_until = 0.0
+        self.current_timeout = reset_timeout
+        self.trial_in_flight = False
+        self.rejected = 0
+        self._lock = threading.Lock()
+
+    def available(self) -> bool:
+        """요청을 보낼 수 있는 상태인지 (시험 요청 기회를 소비하지 않음)"""
+        with self._lock:
+            if self.state == OPEN:
+                return time.monotonic() >= self.opened_until
+            return not (self.state == HALF_OPEN and self.trial_in_flight)
+
+    def allow(self) -> bool:
+        """요청 허용 여부 (half-open이면 시험 요청 하나만 허용)"""
+        with self._lock:
+            if self.state == OPEN and time.monotonic() >= self.opened_until:
+                self.state = HALF_OPEN
+                self.trial_in_flight = False
+            if self.state == CLOSED:
+                return True
+            if self.state == HALF_OPEN and not self.trial_in_flight:
+                self.trial_in_flight = True
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.state = CLOSED
+            self.failures = 0
+            self.current_timeout = self.reset_timeout
+            self.trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN:
+                # 시험 요청 실패 - 대기 시간을 늘려 다시 열기
+                self.current_timeout = min(self.current_timeout * 2, self.max_reset_timeout)
+                self._open()
+            elif self.state == CLOSED and self.failures >= self.failure_threshold:
+                self._open()
+
+    def _open(self):
+        self.state = OPEN
+        self.opened_until = time.monotonic() + self.current_timeout
+        self.trial_in_flight = False
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                'state': self.state,
+                'failures': self.failures,
+                'retry_in': max(0.0, self.opened_until - time.monotonic()) if self.state == OPEN else 0.0,
+                'rejected': self.rejected,
+            }
+
+
+class CircuitBreakerRegistry:
+    """URL의 호스트별 회로 차단기 모음"""
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 60.0, max_reset_timeout: float = 900.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> CircuitBreaker:
+        host = (urlsplit(url).hostname or "").lower()
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = CircuitBreaker(self.failure_threshold, self.reset_timeout, self.max_reset_timeout)
+                self._breakers[host] = breaker
+            return breaker
+
+    def available(self, url: str) -> bool:
+        return self.get(url).available()
+
+    def allow(self, url: str) -> bool:
+        return self.get(url).allow()
+
+    def record_success(self, url: str):
+        self.get(url).record_success()
+
+    def record_failure(self, url: str):
+        self.get(url).record_failure()
+
+    def stats(self) -> Dict[str, Dict]:
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {host: breaker.stats() for host, breaker in breakers.items()}
+
+
+_default_registry: Optional[CircuitBreakerRegistry] = None
+_default_lock = threading.Lock()
+
+
+def get_breakers() -> CircuitBreakerRegistry:
+    """프로세스 전체에서 공유하는 기본 회로 차단기 모음"""
+    global _default_registry
+    with _default_lock:
+        if _default_registry is None:
+            _default_registry = CircuitBreakerRegistry()
+        return _default_registry
@@ -0,0 +1,112 @@
+"""
+기사 본문 MinHash 지문 및 LSH 기반 통신사 전재(轉載) 기사 감지
+"""
+import hashlib
+import re
+import zlib
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from url_canonicalizer import canonicalize_url
+
+# 2^61 - 1 (메르센 소수) - 해시 순열 계산용
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+
+class MinHashFingerprinter:
+    def __init__(self, num_perm: int = 128, bands: int = 32, shingle_size: int = 5, seed: int = 42):
+        """MinHash 지문 생성기 초기화 (num_perm = bands * rows)"""
+        if num_perm % bands != 0:
+            raise ValueError("num_perm은 bands의 배수여야 합니다.")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, 1 << 31, size=num_perm).astype(np.uint64)
+        self._b = rng.randint(0, 1 << 31, size=num_perm).astype(np.uint64)
+
+    def _shingles(self, text: str) -> np.ndarray:
+        """공백/기호를 제거한 본문에서 문자 단위 shingle 해시 추출"""
+        normalized = re.sub(r'[^\w가-힣]', '', text or '').lower()
+        k = self.shingle_size
+        if len(normalized) < k:
+            return np.array([], dtype=np.uint64)
+        hashes = {zlib.crc32(normalized[i:i + k].encode('utf-8')) for i in range(len(normalized) - k + 1)}
+        return np.fromiter(hashes, dtype=np.uint64, count=len(hashes))
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """본문 텍스트의 MinHash 서명 계산 (본문이 너무 짧으면 None)"""
+        shingles = self._shingles(text)
+        if shingles.size == 0:
+            return None
+        # (a * x + b) mod p 를 shingle x 순열 행렬로 한 번에 계산
+        hashed = (np.outer(shingles, self._a) + self._b) % _MERSENNE_PRIME
+        return (hashed & _MAX_HASH).min(axis=0).astype(np.uint32)
+
+    def band_hashes(self, signature: np.ndarray) -> List[int]:
+        """LSH 밴드별 버킷 해시 (SQLite INTEGER 범위의 부호 있는 64비트)"""
+        buckets = []
+        for band in range(self.bands):
+            chunk = signature[band * self.rows:(band + 1) * self.rows].tobytes()
+            digest = hashlib.blake2b(chunk, digest_size=8).digest()
+            buckets.append(int.from_bytes(digest, 'big', signed=True))
+        return buckets
+
+    @staticmethod
+    def similarity(sig_a: np.ndarray, sig_b: np.ndarray) -> float:
+        """두 서명의 추정 Jaccard 유사도"""
+        return float(np.mean(sig_a == sig_b))
+
+    @staticmethod
+    def to_bytes(signature: np.ndarray) -> bytes:
+        return signature.astype('<u4').tobytes()
+
+    @staticmethod
+    def from_bytes(data: bytes) -> np.ndarray:
+        return np.frombuffer(data, dtype='<u4')
+
+
+class SyndicationDetector:
+    def __init__(self, db, threshold: float = 0.8, fingerprinter: MinHashFingerprinter = None):
+        """거의 같은 본문(통신사 전재 기사)을 찾아 기존 요약본을 재사용하기 위한 감지기"""
+        self.db = db
+        self.threshold = threshold
+        self.fingerprinter = fingerprinter or MinHashFingerprinter()
+
+    def find_summarized_duplicate(self, url: str, content: str) -> Optional[Dict]:
+        """본문이 거의 같은 기사 중 이미 요약된 기사의 요약본 조회"""
+        url = canonicalize_url(url) or url
+        signature = self.fingerprinter.signature(content)
+        if signature is None:
+            return None
+
+        candidates = self.db.find_fingerprint_candidates(self.fingerprinter.band_hashes(signature))
+        scored = []
+        for candidate in candidates:
+            if candidate['url'] == url:
+                continue
+            score = self.fingerprinter.similarity(signature, self.fingerprinter.from_bytes(candidate['signature']))
+            if score >= self.threshold:
+                scored.append((score, candidate['url']))
+
+        for score, candidate_url in sorted(scored, reverse=True):
+            existing = self.db.get_news_by_url(candidate_url)
+            if existing and existing.get('summary'):
+                print(f"♻️ 유사 기사 요약본 재사용 (유사도 {score:.2f}): {candidate_url}")
+                existing['similarity'] = score
+                return existing
+        return None
+
+    def remember(self, url: str, content: str) -> bool:
+        """기사 본문 지문을 LSH 인덱스에 저장 (URL은 정규화 - m. / utm_ 변형이 같은 지문을 공유)"""
+        url = canonicalize_url(url) or url
+        signature = self.fingerprinter.signature(content)
+        if signature is None:
+            return False
+        return self.db.save_content_fingerprint(
+            url, self.fingerprinter.to_bytes(signature), self.fingerprinter.band_hashes(signature)
+        )
@@ -0,0 +1,225 @@
+"""
+분산 수집 작업자 - crawl_tasks 큐에서 작업을 임대(lease)하여 처리
+
+여러 프로세스(같은 DB 파일을 공유하는 여러 장비 포함)가 동시에 실행되어도 작업 하나는 한 작업자만 가져갑니다.
+처리 중에는 하트비트로 임대를 연장하고, 작업자가 죽어 임대가 만료되면 다른 작업자가 다시 가져갑니다.
+실패한 작업은 지수 백오프로 재시도하고, max_attempts번 시도해도 끝나지 않은 작업은 격리(quarantined)합니다.
+
+작업 종류:
+    source  - news_sources 행 하나의 목록 수집 → save_crawled_news, 새 기사마다 article 작업 등록
+    article - 기사 본문 추출 → article_contents 저장
+
+사용 예:
+    python crawl_worker.py --enqueue-sources        # 모든 소스를 source 작업으로 등록
+    python crawl_worker.py                          # 작업자 실행 (여러 프로세스 / 장비에서 동시에 실행 가능)
+    python crawl_worker.py --kind article --threads 4
+    python crawl_worker.py --parse-workers 0        # 작업자 프로세스가 많을 때 파싱 프로세스 풀 없이 실행
+    python crawl_worker.py --stats                  # 큐 상태 / 작업자별 처리량
+    python crawl_worker.py --requeue-quarantined    # 격리된 작업 다시 등록
+"""
+import argparse
+import os
+import signal
+import socket
+import threading
+import time
+import uuid
+from typing import Dict, List
+
+from database import NewsDatabase
+from extraction_pool import configure_extraction_pool
+from news_content_scraper import NewsContentScraper
+from news_scraper import NewsScraper
+
+TASK_KINDS = ["source", "article"]
+
+
+def enqueue_sources(db: NewsDatabase, category: str = None) -> int:
+    """news_sources 행을 source 작업으로 등록 (이미 대기 / 처리 중인 소스는 건너뜀)"""
+    tasks = {f"{source['source_name']}/{source['category']}": dict(source)
+             for source in db.get_news_sources(category)}
+    return db.enqueue_crawl_tasks("source", tasks)
+
+
+def enqueue_articles(db: NewsDatabase, news_list: List[Dict]) -> int:
+    """기사 목록을 article 작업으로 등록"""
+    tasks = {news['url']: {'url': news['url'], 'title': news.get('title')} for news in news_list if news.get('url')}
+    return db.enqueue_crawl_tasks("article", tasks)
+
+
+class CrawlWorker:
+    def __init__(self, db: NewsDatabase, worker_id: str = None, kinds: List[str] = None, threads: int = 1,
+                 lease_seconds: float = 120, idle_sleep: float = 5, fetch_articles: bool = True):
+        """worker_id: 작업자 ID (기본값: 호스트명:PID:임의값)
+        kinds: 처리할 작업 종류 (기본값: 모두) - Selenium이 있는 장비만 article 작업을 맡기는 식으로 분리
+        threads: 프로세스 안에서 동시에 처리할 작업 수
+        lease_seconds: 임대 시간 - 하트비트는 그 1/3 간격으로 보냄
+        idle_sleep: 가져갈 작업이 없을 때 기다리는 시간(초)
+        fetch_articles: source 작업에서 찾은 새 기사를 article 작업으로 등록
+        """
+        self.db = db
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self.kinds = kinds or TASK_KINDS
+        self.threads = max(1, threads)
+        self.lease_seconds = lease_seconds
+        self.idle_sleep = idle_sleep
+        self.fetch_articles = fetch_articles
+        self._active: Dict[int, bool] = {}  # 처리 중인 작업 ID -> 임대 유지 여부
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._stop = threading.Event()
+        self._finished = threading.Event()
+
+    def stop(self, *_):
+        """처리 중인 작업을 마치면 종료 (시그널 핸들러로도 사용)"""
+        if not self._stop.is_set():
+            print(f"🛑 {self.worker_id}: 종료 요청 - 처리 중인 작업을 마치고 종료합니다.")
+        self._stop.set()
+
+    def _scrapers(self):
+        """스레드별 스크래퍼 (requests 세션을 스레드끼리 공유하지 않도록)"""
+        if not hasattr(self._local, 'scraper'):
+            self._local.scraper = NewsScraper(db=self.db)
+            self._local.content_scraper = NewsContentScraper(db=self.db)
+        return self._local.scraper, self._local.content_scraper
+
+    def _process(self, task: Dict):
+        """작업 하나 처리 (실패하면 예외)"""
+        scraper, content_scraper = self._scrapers()
+        payload = task['payload']
+        if task['kind'] == "source":
+            news_list = scraper.scrape_source(payload)
+            if news_list is None:
+                raise RuntimeError("목록 수집 실패")
+            inserted = self.db.insert_crawled_news(news_list, payload)
+            if inserted is None:
+                raise RuntimeError("목록 저장 실패")
+            if self.fetch_articles and inserted:
+                enqueue_articles(self.db, inserted)
+        elif task['kind'] == "article":
+            article = content_scraper.scrape_news_content(payload['url'])
+            if not article or not article.get('content'):
+                raise RuntimeError("본문 추출 실패")
+            if not self.db.save_article_content(article):
+                raise RuntimeError("본문 저장 실패")
+        else:
+            raise ValueError(f"알 수 없는 작업 종류: {task['kind']}")
+
+    def _heartbeat_loop(self):
+        """처리 중인 작업들의 임대를 주기적으로 연장"""
+        interval = self.lease_seconds / 3
+        while not self._finished.wait(interval):
+            with self._lock:
+                task_ids = [task_id for task_id, held in self._active.items() if held]
+            for task_id in task_ids:
+                if not self.db.heartbeat_crawl_task(task_id, self.worker_id, self.lease_seconds):
+                    print(f"⚠️ {self.worker_id}: 작업 #{task_id} 임대를 잃었습니다 (다른 작업자가 다시 처리).")
+                    with self._lock:
+                        if task_id in self._active:
+                            self._active[task_id] = False
+
+    def _work_loop(self, max_tasks: int = None, exit_when_idle: bool = False):
+        processed = 0
+        while not self._stop.is_set() and (max_tasks is None or processed < max_tasks):
+            task = self.db.claim_crawl_task(self.worker_id, self.kinds, self.lease_seconds)
+            if task is None:
+                if exit_when_idle:
+                    break
+                self._stop.wait(self.idle_sleep)
+                continue
+
+            with self._lock:
+                self._active[task['id']] = True
+            started = time.monotonic()
+            try:
+                self._process(task)
+                error = None
+            except Exception as e:
+                error = str(e) or type(e).__name__
+            busy = time.monotonic() - started
+            with self._lock:
+                self._active.pop(task['id'], None)
+
+            label = f"#{task['id']} {task['kind']} {task['task_key']}"
+            if error is None:
+                if self.db.complete_crawl_task(task['id'], self.worker_id, busy):
+                    print(f"✅ {label} 완료 ({busy:.1f}초)")
+                else:
+                    print(f"⚠️ {label} 완료했지만 임대가 만료되어 다른 작업자가 다시 처리합니다.")
+            else:
+                status = self.db.fail_crawl_task(task['id'], self.worker_id, error, busy)
+                if status == "quarantined":
+                    print(f"☣️ {label} {task['attempts']}회 실패 - 격리: {error}")
+                else:
+                    print(f"❌ {label} 실패 ({task['attempts']}/{task['max_attempts']}회): {error}")
+            processed += 1
+
+    def run(self, max_tasks: int = None, exit_when_idle: bool = False):
+        """종료 요청까지 작업 처리
+
+        max_tasks: 스레드마다 처리할 최대 작업 수 / exit_when_idle: 가져갈 작업이 없으면 종료
+        """
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGINT, self.stop)
+            signal.signal(signal.SIGTERM, self.stop)
+
+        self.db.register_crawl_worker(self.worker_id, socket.gethostname(), os.getpid())
+        print(f"🚀 수집 작업자 {self.worker_id} 시작: 작업 종류 {', '.join(self.kinds)}, 스레드 {self.threads}개")
+
+        heartbeat = threading.Thread(target=self._heartbeat_loop, daemon=True)
+        heartbeat.start()
+        workers = [threading.Thread(target=self._work_loop, args=(max_tasks, exit_when_idle))
+                   for _ in range(self.threads)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        self._finished.set()
+        heartbeat.join()
+        print(f"🏁 수집 작업자 {self.worker_id} 종료")
+
+
+def print_stats(db: NewsDatabase):
+    stats = db.get_crawl_queue_stats()
+    for kind, counts in sorted(stats['tasks'].items()):
+        print(f"📋 {kind}: " + ", ".join(f"{status} {count}건" for status, count in sorted(counts.items())))
+    for worker in stats['workers']:
+        print(f"👷 {worker['worker_id']}: 완료 {worker['tasks_done']}건, 실패 {worker['tasks_failed']}건, "
+              f"분당 {worker['tasks_per_minute']:.2f}건, 마지막 응답 {worker['last_heartbeat_at']}(UTC)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="분산 수집 작업자 (crawl_tasks 큐 처리)")
+    parser.add_argument("--db", default="news_assistant.db", help="DB 파일 경로 (작업자끼리 공유)")
+    parser.add_argument("--kind", choices=TASK_KINDS, action="append", help="처리할 작업 종류 (여러 번 지정 가능, 기본값: 모두)")
+    parser.add_argument("--threads", type=int, default=1, help="프로세스 안에서 동시에 처리할 작업 수")
+    parser.add_argument("--lease", type=float, default=120, help="작업 임대 시간(초)")
+    parser.add_argument("--worker-id", help="작업자 ID (기본값: 호스트명:PID:임의값)")
+    parser.add_argument("--no-articles", action="store_true", help="source 작업에서 찾은 기사를 article 작업으로 등록하지 않음")
+    parser.add_argument("--exit-when-idle", action="store_true", help="가져갈 작업이 없으면 종료")
+    parser.add_argument("--enqueue-sources", action="store_true", help="모든 소스를 source 작업으로 등록하고 종료")
+    parser.add_argument("--requeue-quarantined", action="store_true", help="격리된 작업을 다시 등록하고 종료")
+    parser.add_argument("--stats", action="store_true", help="큐 / 작업자 통계를 출력하고 종료")
+    parser.add_argument("--parse-workers", type=int,
+                        help="HTML 파싱 프로세스 수 (기본값: CPU 수와 4 중 작은 값, 0이면 이 프로세스에서 파싱)")
+    args = parser.parse_args()
+
+    db = NewsDatabase(args.db)
+    if args.enqueue_sources or args.requeue_quarantined or args.stats:
+        if args.enqueue_sources:
+            print(f"📥 source 작업 {enqueue_sources(db)}건 등록")
+        if args.requeue_quarantined:
+            print(f"♻️ 격리 작업 {db.requeue_quarantined_tasks()}건 재등록")
+        if args.stats:
+            print_stats(db)
+        return
+
+    if args.parse_workers is not None:
+        configure_extraction_pool(args.parse_workers)
+    worker = CrawlWorker(db, args.worker_id, args.kind, args.threads, args.lease,
+                         fetch_articles=not args.no_articles)
+    worker.run(exit_when_idle=args.exit_when_idle)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+"""
+뉴스 소스별 적응형 폴링 수집 데몬
+
+소스(news_sources 행)마다 새 기사가 올라오는 빈도를 지수 이동 평균으로 학습하여 폴링 간격을 정합니다.
+새 기사가 자주 올라오는 정치 면은 min_interval(기본 1분)에 가깝게, 조용한 문화 면은 max_interval(기본 1시간)에 가깝게
+폴링하며, 여러 소스가 같은 시각에 몰리지 않도록 간격에 지터를 더합니다.
+동시에 수집하는 소스 수는 concurrency로 제한하고, 수집 결과는 메인 스레드에서 바로 save_crawled_news로 저장합니다.
+학습된 간격은 source_poll_state 테이블에 저장되어 재시작해도 이어집니다.
+
+사용 예:
+    python crawler_daemon.py                    # Ctrl+C / SIGTERM으로 종료할 때까지 계속 수집
+    python crawler_daemon.py --once             # 모든 소스를 한 번씩 수집하고 종료
+    python crawler_daemon.py --concurrency 8 --min-interval 30 --max-interval 7200
+"""
+import argparse
+import random
+import signal
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timezone
+from typing import Dict, Optional, Tuple
+
+from database import NewsDatabase
+from date_parser import DB_TIME_FORMAT
+from news_scraper import NewsScraper
+
+SourceKey = Tuple[str, str]
+
+
+def _to_db_time(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime(DB_TIME_FORMAT)
+
+
+def _from_db_time(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, DB_TIME_FORMAT).replace(tzinfo=timezone.utc).timestamp()
+    except ValueError:
+        return None
+
+
+class CrawlerDaemon:
+    def __init__(self, db: NewsDatabase, scraper: NewsScraper = None, concurrency: int = 4,
+                 min_interval: float = 60.0, max_interval: float = 3600.0, target_new_items: float = 1.0,
+                 smoothing: float = 0.3, jitter: float = 0.1, refresh_interval: float = 300.0):
+        """concurrency: 동시에 수집하는 소스 수 (전체 예산, 호스트별 요청 속도는 스크래퍼의 스케줄러가 따로 조절)
+        min_interval / max_interval: 폴링 간격 하한 / 상한(초)
+        target_new_items: 폴링 한 번에 기대하는 새 기사 수 - 간격 = target_new_items / 시간당 새 기사 수
+        smoothing: 시간당 새 기사 수 이동 평균에서 최근 관측값의 가중치
+        jitter: 간격에 더하는 무작위 변동 비율 (±)
+        refresh_interval: news_sources 목록을 다시 읽는 주기(초) - 앱에서 추가한 소스 반영
+        """
+        self.db = db
+        self.scraper = scraper or NewsScraper(db=db)
+        self.concurrency = max(1, concurrency)
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        self.target_new_items = target_new_items
+        self.smoothing = smoothing
+        self.jitter = jitter
+        self.refresh_interval = refresh_interval
+        self.sources: Dict[SourceKey, Dict] = {}
+        self.states: Dict[SourceKey, Dict] = {}
+        self.stats = {'polls': 0, 'failures': 0, 'save_failures': 0, 'saved': 0}
+        self._stop = threading.Event()
+
+    def stop(self, *_):
+        """진행 중인 수집이 끝나면 종료 (시그널 핸들러로도 사용)"""
+        if not self._stop.is_set():
+            print("🛑 종료 요청 - 진행 중인 수집을 마치고 종료합니다.")
+        self._stop.set()
+
+    def load_sources(self):
+        """news_sources 목록과 저장된 폴링 상태 읽기 (삭제된 소스는 제외, 새 소스는 바로 수집 대상)"""
+        sources = self.db.get_news_sources()
+        if not sources and self.sources:
+            return  # 조회 실패로 보고 기존 목록 유지
+        self.sources = {(source['source_name'], source['category']): source for source in sources}
+        saved = self.db.get_source_poll_states()
+        now = time.time()
+        for key in self.sources:
+            if key in self.states:
+                continue
+            row = saved.get(key)
+            if row:
+                self.states[key] = {
+                    'interval': row['interval_seconds'] or self.min_interval,
+                    'rate': row['new_items_per_hour'],
+                    'last_polled': _from_db_time(row['last_polled_at']),
+                    'failures': row['consecutive_failures'] or 0,
+                    'due': _from_db_time(row['next_poll_at']) or now,
+                }
+            else:
+                # 처음 보는 소스는 시작 시각을 조금씩 흩어서 한꺼번에 요청하지 않도록 함
+                self.states[key] = {
+                    'interval': self.min_interval, 'rate': None, 'last_polled': None, 'failures': 0,
+                    'due': now + random.uniform(0, self.min_interval * self.jitter),
+                }
+        for key in list(self.states):
+            if key not in self.sources:
+                del self.states[key]
+
+    def _next_interval(self, state: Dict, new_count: Optional[int], now: float) -> float:
+        """수집 결과로 시간당 새 기사 수를 갱신하고 다음 폴링까지의 간격(지터 전) 계산"""
+        if new_count is None:
+            # 실패하면 학습된 간격은 그대로 두고 연속 실패 횟수만큼 지수 백오프
+            state['failures'] += 1
+            return min(self.max_interval, state['interval'] * 2 ** state['failures'])
+
+        state['failures'] = 0
+        if state['last_polled'] is not None:
+            # 첫 수집은 쌓여 있던 기사까지 한꺼번에 들어오므로 빈도 학습에서 제외
+            hours = max(now - state['last_polled'], self.min_interval) / 3600
+            observed = new_count / hours
+            state['rate'] = observed if state['rate'] is None else \
+                self.smoothing * observed + (1 - self.smoothing) * state['rate']
+        state['last_polled'] = now
+
+        if state['rate'] is None:
+            interval = self.min_interval
+        elif state['rate'] <= 0:
+            interval = self.max_interval
+        else:
+            interval = self.target_new_items * 3600 / state['rate']
+        state['interval'] = min(self.max_interval, max(self.min_interval, interval))
+        return state['interval']
+
+    def _handle_result(self, key: SourceKey, future):
+        """수집 결과 저장 후 다음 폴링 시각을 정하고 상태 기록 (메인 스레드)"""
+        try:
+            news_list = future.result()
+        except Exception as e:
+            print(f"❌ {key[0]} [{key[1]}] 수집 실패: {e}")
+            news_list = None
+
+        saved = None
+        if news_list is not None:
+            saved = self.db.save_crawled_news(news_list, {'source_name': key[0], 'category': key[1]})
+            if saved is None:
+                # 저장하지 못한 수집은 성공이 아님 - 빈도 학습에서 빼고 실패와 같이 백오프 후 재시도
+                self.stats['save_failures'] += 1
+        state = self.states.get(key)
+        if state is None:
+            return  # 수집 중에 삭제된 소스
+
+        now = time.time()
+        delay = self._next_interval(state, saved, now)
+        delay *= 1 + random.uniform(-self.jitter, self.jitter)
+        state['due'] = now + delay
+
+        self.stats['polls'] += 1
+        if saved is None:
+            self.stats['failures'] += 1
+            reason = "저장 실패" if news_list is not None else "수집 실패"
+            print(f"⚠️ {key[0]} [{key[1]}] {reason} {state['failures']}회 연속 - {delay / 60:.1f}분 후 재시도")
+        else:
+            self.stats['saved'] += saved
+            print(f"🗞️ {key[0]} [{key[1]}] 새 기사 {saved}건 저장 - 다음 수집 {delay / 60:.1f}분 후")
+
+        self.db.save_source_poll_state(key[0], key[1], state['interval'], state['rate'],
+                                       _to_db_time(state['last_polled'] or now), saved, state['failures'],
+                                       _to_db_time(state['due']))
+
+    def run(self, once: bool = False) -> Dict:
+        """종료 요청(또는 once이면 모든 소스를 한 번씩 수집)까지 폴링 (누적 통계 반환)"""
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGINT, self.stop)
+            signal.signal(signal.SIGTERM, self.stop)
+
+        self.load_sources()
+        if once:
+            for state in self.states.values():
+                state['due'] = 0
+        polled = set()
+        next_refresh = time.monotonic() + self.refresh_interval
+        running = {}
+        print(f"🚀 수집 데몬 시작: 소스 {len(self.sources)}개, 동시 수집 {self.concurrency}개")
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            while not self._stop.is_set():
+                if not once and time.monotonic() >= next_refresh:
+                    self.load_sources()
+                    next_refresh = time.monotonic() + self.refresh_interval
+
+                # 폴링 시각이 지난 소스를 오래 기다린 순서대로 예산만큼 제출 (같은 소스는 한 번에 하나)
+                now = time.time()
+                in_flight = set(running.values())
+                due = sorted((state['due'], key) for key, state in self.states.items()
+                             if state['due'] <= now and key not in in_flight and not (once and key in polled))
+                for _, key in due[:self.concurrency - len(running)]:
+                    running[executor.submit(self.scraper.scrape_source, self.sources[key])] = key
+                    polled.add(key)
+
+                if once and not running and polled >= set(self.states):
+                    break
+
+                # 예산이 다 찼으면 폴링 시각이 지난 소스가 있어도 수집 하나가 끝날 때까지 기다림 (timeout 0으로 헛돌지 않도록)
+                in_flight = set(running.values())
+                waiting = [] if len(running) >= self.concurrency else \
+                    [state['due'] for key, state in self.states.items()
+                     if key not in in_flight and not (once and key in polled)]
+                timeout = min([self.refresh_interval] + [max(0.0, due_at - now) for due_at in waiting])
+                if running:
+                    done, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        self._handle_result(running.pop(future), future)
+                else:
+                    self._stop.wait(timeout)
+
+            # 종료 요청 후에도 이미 시작한 수집 결과는 저장
+            for future in list(running):
+                future.exception()
+                self._handle_result(running.pop(future), future)
+
+        print(f"🏁 수집 데몬 종료: 폴링 {self.stats['polls']}회, 실패 {self.stats['failures']}회 "
+              f"(저장 실패 {self.stats['save_failures']}회), "
+              f"새 기사 {self.stats['saved']}건 저장")
+        return self.stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="뉴스 소스별 적응형 폴링 수집 데몬")
+    parser.add_argument("--db", default="news_assistant.db", help="DB 파일 경로")
+    parser.add_argument("--concurrency", type=int, default=4, help="동시에 수집하는 소스 수")
+    parser.add_argument("--min-interval", type=float, default=60, help="폴링 간격 하한(초)")
+    parser.add_argument("--max-interval", type=float, default=3600, help="폴링 간격 상한(초)")
+    parser.add_argument("--jitter", type=float, default=0.1, help="폴링 간격 무작위 변동 비율 (±)")
+    parser.add_argument("--once", action="store_true", help="모든 소스를 한 번씩 수집하고 종료")
+    args = parser.parse_args()
+
+    db = NewsDatabase(args.db)
+    daemon = CrawlerDaemon(db, concurrency=args.concurrency, min_interval=args.min_interval,
+                           max_interval=args.max_interval, jitter=args.jitter)
+    daemon.run(once=args.once)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,149 @@
 import sqlite3
 import json
-from datetime import datetime
-from typing import List, Dict, Optional
+import os
+import re
+import base64
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Optional, Tuple
+from story_clustering import StoryClusterer
+from embedding_index import HashingEmbedder, VectorIndex
+from news_records import FavoriteNews, NewsSource, NewsSummary, Record, ScrapedNews, SearchHit
+from text_compression import TextCompressor, train_dictionary
+from url_bloom import ScalableBloomFilter
+from url_canonicalizer import canonicalize_url, lookup_urls
+from date_parser import DB_TIME_FORMAT
+
+# 요약본 조회 프로젝션 - 목록 화면은 큰 TEXT 컬럼(summary, content)을 읽지 않음
+SUMMARY_PROJECTIONS = {
+    "list": ["id", "title", "url", "category", "source_name", "created_at", "published_at", "is_favorite"],
+    "detail": ["id", "title", "url", "category", "source_name", "created_at", "published_at", "is_favorite", "summary"],
+    "full": ["id", "title", "url", "category", "source_name", "created_at", "published_at", "is_favorite", "summary",
+             "content"],
+}
+
+
+# 압축 저장되는 컬럼 (조회 시 decompress_text SQL 함수로 복원)
+COMPRESSED_SUMMARY_COLUMNS = ("content",)
+
+# 압축 사전 학습에 필요한 최소 본문 수
+DICTIONARY_TRAIN_MIN_SAMPLES = 64
+
+# 검색 인덱스 테이블 -> 색인 컬럼 (rowid는 원본 테이블 id)
+SEARCH_TABLES = {
+    "scraped_news_search": ("title",),
+    "news_summaries_search": ("title", "summary", "content"),
+}
+
+# 검색 토큰을 만드는 단어 (unicode61 토크나이저처럼 밑줄은 구분자로 취급)
+_WORD_PATTERN = re.compile(r'[^\W_]+')
+
+
+def _projection(name: str, alias: str = None) -> str:
+    prefix = f"{alias}." if alias else ""
+    return ", ".join(
+        f"decompress_text({prefix}{column}) AS {column}" if column in COMPRESSED_SUMMARY_COLUMNS else prefix + column
+        for column in SUMMARY_PROJECTIONS[name]
+    )
+
+
+class ResultPage(list):
+    """목록 조회 결과 (list) + 다음 페이지를 위한 불투명 커서"""
+
+    def __init__(self, rows=(), next_cursor: Optional[str] = None):
+        super().__init__(rows)
+        self.next_cursor = next_cursor
+
+
+def _encode_cursor(sort_value, row_id: int) -> str:
+    return base64.urlsafe_b64encode(json.dumps([sort_value, row_id]).encode('utf-8')).decode('ascii')
+
+
+def _decode_cursor(cursor: str):
+    sort_value, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8'))
+    return sort_value, row_id
+
+
+def _lookup_map(urls: List[str]) -> Dict[str, List[str]]:
+    """DB에 저장되어 있을 수 있는 URL(정규화 / 원본) -> 조회를 요청한 URL 목록"""
+    mapping = {}
+    for url in urls:
+        for candidate in lookup_urls(url):
+            mapping.setdefault(candidate, []).append(url)
+    return mapping
+
+
+def bigram_tokens(text: Optional[str]) -> List[str]:
+    """검색 색인용 토큰: 단어마다 글자 bigram + 마지막 글자
+
+    '경제정책' -> ['경제', '제정', '정책', '책']. 두 글자 이상 검색어는 bigram 구(phrase)로,
+    한 글자 검색어는 접두사 검색으로 찾으므로 길이와 관계없이 모든 부분 문자열 검색이 인덱스를 사용합니다.
+    """
+    tokens = []
+    for word in _WORD_PATTERN.findall((text or "").lower()):
+        tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        tokens.append(word[-1])
+    return tokens
+
+
+def bigram_match_query(terms: List[str]) -> str:
+    """검색어 목록을 bigram 인덱스 MATCH 식으로 변환 (모든 검색어 포함, 빈 문자열이면 검색할 글자 없음)"""
+    parts = []
+    for term in terms:
+        for word in _WORD_PATTERN.findall(term.lower()):
+            if len(word) == 1:
+                parts.append(f'"{word}"*')
+            else:
+                parts.append('"' + " ".join(word[i:i + 2] for i in range(len(word) - 1)) + '"')
+    return " AND ".join(parts)
+
+
+def _snippet(text: str, terms: List[str], width: int = 40) -> str:
+    """검색어가 처음 나오는 위치 주변 텍스트 (검색어는 **로 강조)"""
+    lowered = text.lower()
+    positions = [position for position in (lowered.find(term.lower()) for term in terms) if position >= 0]
+    start = max(0, min(positions) - width) if positions else 0
+    end = min(len(text), start + width * 3)
+    fragment = re.sub("|".join(re.escape(term) for term in terms), lambda m: f"**{m.group(0)}**",
+                      text[start:end], flags=re.IGNORECASE)
+    return ("…" if start > 0 else "") + fragment + ("…" if end < len(text) else "")
+
+
+def _as_list(value) -> List:
+    """단일 값 / 목록 필터 값을 목록으로 통일 ("전체"는 필터 없음)"""
+    if value is None:
+        return []
+    values = [value] if isinstance(value, str) else list(value)
+    return [] if "전체" in values else values
+
 
 class NewsDatabase:
-    def __init__(self, db_path: str = "news_assistant.db"):
-        """데이터베이스 초기화"""
+    # 같은 DB 파일을 쓰는 인스턴스끼리 클러스터링 상태 공유
+    _story_clusterers: Dict[str, StoryClusterer] = {}
+    # 같은 DB 파일을 쓰는 인스턴스끼리 수집 URL 블룸 필터 공유
+    _url_filters: Dict[str, ScalableBloomFilter] = {}
+
+    def __init__(self, db_path: str = "news_assistant.db", embedder=None):
+        """데이터베이스 초기화 (embedder: 관련 기사 검색용 임베딩 생성기, 기본값은 로컬 해싱)"""
         self.db_path = db_path
+        self.embedder = embedder or HashingEmbedder()
+        self._vector_index = None
+        self._vector_index_lock = threading.Lock()
+        self.compressor = TextCompressor(dictionary_loader=self._load_compression_dictionary)
         self.init_database()
+
+    def _connect(self) -> sqlite3.Connection:
+        """DB 연결 (압축 컬럼 복원용 decompress_text SQL 함수 등록)
+
+        여러 수집 작업자 프로세스가 같은 DB 파일을 쓰므로 쓰기 잠금은 최대 30초까지 기다립니다.
+        """
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.create_function("decompress_text", 1, self.compressor.decompress, deterministic=True)
+        return conn
     
     def init_database(self):
         """데이터베이스 테이블 생성"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             # 뉴스 업체별 카테고리 링크 테이블
@@ -65,19 +197,339 @@ class NewsDatabase:
                 )
             """)
 
+            # 기사 본문 MinHash 지문 테이블 (유사 기사 감지용)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS content_fingerprints (
+                    url TEXT PRIMARY KEY,
+                    signature BLOB NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+
+            # 지문 LSH 밴드 버킷 인덱스
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS fingerprint_lsh (
+                    band INTEGER NOT NULL,
+                    bucket INTEGER NOT NULL,
+                    url TEXT NOT NULL,
+                    PRIMARY KEY (band, bucket, url)
+                ) WITHOUT ROWID
+            """)
+
+            # 요약본 임베딩 행 번호 매핑 (벡터 자체는 메모리 맵 파일에 저장)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS summary_embeddings (
+                    embedder TEXT NOT NULL,
+                    summary_id INTEGER NOT NULL,
+                    row_index INTEGER NOT NULL,
+                    PRIMARY KEY (embedder, summary_id),
+                    UNIQUE (embedder, row_index)
+                )
+            """)
+
+            # 소스별 최근 발견 URL 링 (목록 페이지 증분 수집용)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS source_seen_urls (
+                    source_name TEXT NOT NULL,
+                    category TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    seen_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (source_name, category, url)
+                ) WITHOUT ROWID
+            """)
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_source_seen_urls_time ON source_seen_urls (source_name, category, seen_at)")
+
+            # 수집 데몬의 소스별 폴링 상태 (새 기사 발생률로 주기 조정)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS source_poll_state (
+                    source_name TEXT NOT NULL,
+                    category TEXT NOT NULL,
+                    interval_seconds REAL NOT NULL,
+                    new_items_per_hour REAL,
+                    last_polled_at TIMESTAMP,
+                    last_new_count INTEGER,
+                    consecutive_failures INTEGER NOT NULL DEFAULT 0,
+                    next_poll_at TIMESTAMP,
+                    PRIMARY KEY (source_name, category)
+                ) WITHOUT ROWID
+            """)
+
+            # 본문 추출에 실패한 URL (지수 백오프로 재시도 시각까지 건너뜀)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS failed_urls (
+                    url TEXT PRIMARY KEY,
+                    failures INTEGER NOT NULL DEFAULT 1,
+                    last_error TEXT,
+                    last_failed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    retry_at TIMESTAMP NOT NULL
+                ) WITHOUT ROWID
+            """)
+
+            # 분산 수집 작업 큐 - 작업자가 임대(lease)하여 처리하고 하트비트로 연장, 임대가 만료되면 다른 작업자가 회수
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS crawl_tasks (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    kind TEXT NOT NULL,
+                    task_key TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    max_attempts INTEGER NOT NULL DEFAULT 3,
+                    available_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    lease_owner TEXT,
+                    lease_expires_at TIMESTAMP,
+                    last_error TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    finished_at TIMESTAMP
+                )
+            """)
+            # 같은 작업(종류 + 키)은 대기 / 처리 중인 것이 하나만 있도록
+            cursor.execute("""
+                CREATE UNIQUE INDEX IF NOT EXISTS idx_crawl_tasks_active ON crawl_tasks (kind, task_key)
+                WHERE status IN ('pending', 'leased')
+            """)
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_crawl_tasks_claim ON crawl_tasks (status, kind, available_at, id)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_crawl_tasks_lease ON crawl_tasks (status, lease_expires_at)")
+
+            # 수집 작업자별 처리량 통계
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS crawl_workers (
+                    worker_id TEXT PRIMARY KEY,
+                    hostname TEXT,
+                    pid INTEGER,
+                    started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    last_heartbeat_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    tasks_done INTEGER NOT NULL DEFAULT 0,
+                    tasks_failed INTEGER NOT NULL DEFAULT 0,
+                    busy_seconds REAL NOT NULL DEFAULT 0
+                ) WITHOUT ROWID
+            """)
+
+            # 수집 작업자가 추출한 기사 본문 (요약 전 단계, content는 압축 저장)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS article_contents (
+                    url TEXT PRIMARY KEY,
+                    title TEXT,
+                    content BLOB,
+                    published_at TIMESTAMP,
+                    authors TEXT,
+                    extraction TEXT,
+                    fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                ) WITHOUT ROWID
+            """)
+
+            # 일괄 작업(전체 수집, 선택 기사 요약) 실행 기록 - 새로고침 / 중단 후 남은 항목부터 이어서 실행
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS batch_runs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    kind TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'running',
+                    params TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    finished_at TIMESTAMP
+                )
+            """)
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_batch_runs_status ON batch_runs (status, updated_at)")
+            # 항목별 진행 상태: pending / fetched / extracted / summarized / failed
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS batch_run_items (
+                    run_id INTEGER NOT NULL,
+                    item_key TEXT NOT NULL,
+                    position INTEGER NOT NULL,
+                    payload TEXT NOT NULL,
+                    state TEXT NOT NULL DEFAULT 'pending',
+                    result TEXT,
+                    error TEXT,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (run_id, item_key)
+                ) WITHOUT ROWID
+            """)
+
+            # 본문 압축 사전 (압축 블롭 헤더의 사전 ID로 참조)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS compression_dictionaries (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    codec INTEGER NOT NULL,
+                    data BLOB NOT NULL,
+                    sample_count INTEGER,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            cursor.execute("""
+                SELECT id, codec, data FROM compression_dictionaries
+                WHERE codec = ? ORDER BY id DESC LIMIT 1
+            """, (self.compressor.codec,))
+            row = cursor.fetchone()
+            if row:
+                self.compressor.add_dictionary(*row)
+
+            # 동일 사건 기사 묶음 ID (대표 기사의 scraped_news.id)
+            self._ensure_column(cursor, "scraped_news", "cluster_id", "INTEGER")
+
+            # 소스별 RSS / Atom / 뉴스 사이트맵 주소 (있으면 HTML 목록 페이지보다 먼저 사용)
+            self._ensure_column(cursor, "news_sources", "feed_url", "TEXT")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_scraped_news_cluster ON scraped_news (cluster_id)")
 
+            # 기사 발행 시각 (UTC, 목록 / 기사 페이지에서 추출 - 모르면 NULL)
+            self._ensure_column(cursor, "scraped_news", "published_at", "TIMESTAMP")
+            self._ensure_column(cursor, "news_summaries", "published_at", "TIMESTAMP")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_scraped_news_published ON scraped_news (source_name, category, published_at)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_scraped_news_published_time ON scraped_news (published_at, id)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_news_summaries_published ON news_summaries (source_name, category, published_at)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_news_summaries_published_time ON news_summaries (published_at, id)")
+
+            # 목록 필터 / 키셋 페이지네이션용 인덱스
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_scraped_news_time ON scraped_news (scraped_at, id)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_scraped_news_category ON scraped_news (category, source_name, scraped_at, id)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_scraped_news_source ON scraped_news (source_name, scraped_at, id)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_news_summaries_time ON news_summaries (created_at, id)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_news_summaries_category ON news_summaries (category, source_name, created_at, id)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_news_summaries_url ON news_summaries (url)")
+
+            # 전문 검색(FTS5) 인덱스
+            self._init_search_index(cursor)
             
             conn.commit()
+
+    @staticmethod
+    def _ensure_column(cursor, table: str, column: str, definition: str):
+        """기존 DB 파일에 없는 컬럼 추가 (마이그레이션)"""
+        cursor.execute(f"PRAGMA table_info({table})")
+        if column not in [row[1] for row in cursor.fetchall()]:
+            cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+
+    def _init_search_index(self, cursor):
+        """수집 뉴스 제목 / 요약본 bigram 검색 인덱스 생성
+
+        한국어 검색어는 두 글자 명사(경제, 정치, 국회)가 많아 trigram 인덱스로는 찾을 수 없으므로,
+        Python에서 글자 bigram으로 나눈 토큰을 contentless FTS5 테이블에 색인합니다 (bigram_tokens 참고).
+        토큰은 Python에서 만들고 요약본 본문은 압축 저장되므로 트리거 대신 쓰기 메서드가 색인합니다.
+        (DB를 직접 수정했다면 maintenance.py --rebuild-search로 다시 색인)
+        """
+        # 이전 버전의 trigram 인덱스 / 동기화 트리거 / 복원 뷰 제거
+        for table in ("scraped_news", "news_summaries"):
+            for suffix in ("insert", "delete", "update"):
+                cursor.execute(f"DROP TRIGGER IF EXISTS {table}_fts_{suffix}")
+            cursor.execute(f"DROP TABLE IF EXISTS {table}_fts")
+        cursor.execute("DROP VIEW IF EXISTS news_summaries_fts_source")
+
+        created = False
+        for search_table, columns in SEARCH_TABLES.items():
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (search_table,))
+            if cursor.fetchone() is None:
+                cursor.execute(f"""
+                    CREATE VIRTUAL TABLE {search_table} USING fts5(
+                        {", ".join(columns)}, content='', tokenize='unicode61'
+                    )
+                """)
+                created = True
+        if created:
+            self._rebuild_search_index(cursor)
+
+    @staticmethod
+    def _index_search_rows(cursor, search_table: str, rows: List[Tuple], delete: bool = False):
+        """검색 색인 추가 / 삭제 (rows: (id, 원문 컬럼값...) - 컬럼 순서는 SEARCH_TABLES)
+
+        contentless 인덱스에서 삭제할 때는 색인할 때와 같은 값을 넘겨야 합니다.
+        """
+        columns = SEARCH_TABLES[search_table]
+        placeholders = ", ".join("?" * (len(columns) + 1))
+        if delete:
+            query = (f"INSERT INTO {search_table}({search_table}, rowid, {', '.join(columns)}) "
+                     f"VALUES ('delete', {placeholders})")
+        else:
+            query = f"INSERT INTO {search_table}(rowid, {', '.join(columns)}) VALUES ({placeholders})"
+        cursor.executemany(query, [(row[0],) + tuple(" ".join(bigram_tokens(value)) for value in row[1:])
+                                   for row in rows])
+
+    def _index_summaries(self, cursor, rows: List[Tuple[int, str, str, Optional[str]]], delete: bool = False):
+        """요약본 검색 색인 추가 / 삭제 (rows: id, title, summary, 원문 content)"""
+        self._index_search_rows(cursor, "news_summaries_search", rows, delete)
+
+    def _rebuild_search_index(self, cursor, batch_size: int = 500) -> int:
+        """검색 색인을 비우고 scraped_news / news_summaries 전체로 다시 생성 (색인한 행 수 반환)"""
+        indexed = 0
+        for search_table, table in (("scraped_news_search", "scraped_news"),
+                                    ("news_summaries_search", "news_summaries")):
+            cursor.execute(f"INSERT INTO {search_table}({search_table}) VALUES ('delete-all')")
+            columns = ", ".join(SEARCH_TABLES[search_table])
+            last_id = 0
+            while True:
+                cursor.execute(f"SELECT id, {columns} FROM {table} WHERE id > ? ORDER BY id LIMIT ?",
+                               (last_id, batch_size))
+                rows = cursor.fetchall()
+                if not rows:
+                    break
+                last_id = rows[-1][0]
+                if table == "news_summaries":
+                    rows = [(row_id, title, summary, self.compressor.decompress(content))
+                            for row_id, title, summary, content in rows]
+                self._index_search_rows(cursor, search_table, rows)
+                indexed += len(rows)
+        return indexed
+
+    def rebuild_search_index(self) -> int:
+        """검색 색인 재생성 (DB를 직접 수정한 뒤 등) - 색인한 행 수 반환"""
+        try:
+            with self._connect() as conn:
+                cursor = conn.cursor()
+                indexed = self._rebuild_search_index(cursor)
+                conn.commit()
+                return indexed
+        except Exception as e:
+            print(f"검색 색인 재생성 실패: {e}")
+            return 0
+
+    def _get_story_clusterer(self, cursor) -> StoryClusterer:
+        """최근 수집 기사로 복원한 클러스터러 조회 (최초 1회만 복원)"""
+        clusterer = self._story_clusterers.get(self.db_path)
+        if clusterer is None:
+            clusterer = StoryClusterer()
+            cursor.execute("""
+                SELECT id, title, cluster_id FROM scraped_news
+                WHERE cluster_id IS NOT NULL
+                ORDER BY id DESC
+                LIMIT ?
+            """, (clusterer.window * 3,))
+            clusterer.load(reversed(cursor.fetchall()))
+            self._story_clusterers[self.db_path] = clusterer
+
+            # 클러스터 컬럼 추가 이전에 수집된 최근 기사 백필
+            cursor.execute("""
+                SELECT id, title FROM scraped_news
+                WHERE cluster_id IS NULL
+                ORDER BY id DESC
+                LIMIT ?
+            """, (clusterer.window * 3,))
+            backlog = list(reversed(cursor.fetchall()))
+            if backlog:
+                assignments = clusterer.assign(backlog)
+                cursor.executemany("UPDATE scraped_news SET cluster_id = ? WHERE id = ?",
+                                   [(cluster_id, row_id) for row_id, cluster_id in assignments.items()])
+        return clusterer
+
+    def _forget_story_clusterer(self):
+        """클러스터러 캐시 삭제 - 롤백된 행의 클러스터가 메모리에 남지 않도록 다음 저장에서 DB 기준으로 다시 복원"""
+        self._story_clusterers.pop(self.db_path, None)
+
+    def _assign_story_clusters(self, cursor, rows: List[Tuple[int, str]]):
+        """새로 저장된 기사에 동일 사건 클러스터 ID 부여"""
+        if not rows:
+            return
+        assignments = self._get_story_clusterer(cursor).assign(rows)
+        cursor.executemany("UPDATE scraped_news SET cluster_id = ? WHERE id = ?",
+                           [(cluster_id, row_id) for row_id, cluster_id in assignments.items()])
     
-    def add_news_source(self, source_name: str, category: str, url: str) -> bool:
-        """뉴스 소스 추가"""
+    def add_news_source(self, source_name: str, category: str, url: str, feed_url: str = None) -> bool:
+        """뉴스 소스 추가 (feed_url: RSS / Atom / 뉴스 사이트맵 주소, 선택)"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
-                    INSERT OR REPLACE INTO news_sources (source_name, category, url, updated_at)
-                    VALUES (?, ?, ?, CURRENT_TIMESTAMP)
-                """, (source_name, category, url))
+                    INSERT OR REPLACE INTO news_sources (source_name, category, url, feed_url, updated_at)
+                    VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+                """, (source_name, category, url, feed_url or None))
                 conn.commit()
                 return True
         except Exception as e:
@@ -87,130 +539,991 @@ class NewsDatabase:
     def get_news_sources(self, category: str = None) -> List[Dict]:
         """뉴스 소스 목록 조회"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 if category:
                     cursor.execute("""
-                        SELECT source_name, category, url, created_at, updated_at
+                        SELECT source_name, category, url, feed_url, created_at, updated_at
                         FROM news_sources WHERE category = ?
                         ORDER BY updated_at DESC
                     """, (category,))
                 else:
                     cursor.execute("""
-                        SELECT source_name, category, url, created_at, updated_at
+                        SELECT source_name, category, url, feed_url, created_at, updated_at
                         FROM news_sources
                         ORDER BY category, source_name
                     """)
                 
-                columns = [description[0] for description in cursor.description]
-                return [dict(zip(columns, row)) for row in cursor.fetchall()]
+                return NewsSource.from_cursor(cursor)
         except Exception as e:
             print(f"뉴스 소스 조회 실패: {e}")
             return []
             
     def save_scraped_news(self, news_item: Dict) -> bool:
-        """수집된 뉴스 저장 (중복 건너뜀)"""
+        """수집된 뉴스 저장 (중복 건너뜀) - 저장되었으면 True, 중복이거나 저장에 실패하면 False"""
+        return bool(self.insert_crawled_news([news_item]))
+
+    def save_crawled_news(self, news_list: List[Dict], source: Dict = None) -> Optional[int]:
+        """크롤링된 뉴스 목록 저장 (Bulk) - 새로 저장된 건수 반환 (DB 오류면 None)"""
+        inserted = self.insert_crawled_news(news_list, source)
+        return None if inserted is None else len(inserted)
+
+    def insert_crawled_news(self, news_list: List[Dict], source: Dict = None) -> Optional[List[Dict]]:
+        """크롤링된 뉴스 목록을 한 트랜잭션으로 일괄 저장하고 새로 저장된 행의 id, url 반환 (DB 오류면 None)
+
+        sqlite3의 executemany는 RETURNING 결과를 돌려주지 않으므로, 쓰기 잠금을 잡은 상태에서
+        AUTOINCREMENT id 기준점 이후에 생긴 행을 새로 저장된 행으로 판별합니다.
+        source: 목록을 수집한 news_sources 행 - 주어지면 목록 페이지에서 본 URL(news_list.seen_urls)을
+        같은 트랜잭션에서 소스별 최근 URL 링에 기록 (저장에 실패하면 링에도 남지 않아 다음 수집에서 다시 시도)
+        """
+        rows = [
+            (news['title'], canonicalize_url(news['url']) or news['url'], news.get('source_name'), news.get('category'),
+             news.get('published_at'))
+            for news in news_list
+            if news.get('title') and news.get('url')
+        ]
+        seen_urls = getattr(news_list, 'seen_urls', None) or [news['url'] for news in news_list if news.get('url')]
+        if not rows and not (source and seen_urls):
+            return []
+        try:
+            with self._connect() as conn:
+                cursor = conn.cursor()
+                cursor.execute("BEGIN IMMEDIATE")
+                cursor.execute("SELECT COALESCE(MAX(id), 0) FROM scraped_news")
+                watermark = cursor.fetchone()[0]
+                self._get_story_clusterer(cursor)  # 이번 배치가 백필 대상에 섞이지 않도록 먼저 복원
+
+                cursor.executemany("""
+                    INSERT INTO scraped_news (title, url, source_name, category, published_at, scraped_at)
+                    VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                    ON CONFLICT(url) DO UPDATE SET published_at = excluded.published_at
+                    WHERE scraped_news.published_at IS NULL AND excluded.published_at IS NOT NULL
+                """, rows)
+
+                cursor.execute("SELECT id, url, title FROM scraped_news WHERE id > ? ORDER BY id", (watermark,))
+                inserted = cursor.fetchall()
+                self._index_search_rows(cursor, "scraped_news_search", [(row_id, title) for row_id, _, title in inserted])
+                try:
+                    self._assign_story_clusters(cursor, [(row_id, title) for row_id, _, title in inserted])
+                except Exception as e:
+                    print(f"뉴스 클러스터링 실패: {e}")
+                    self._forget_story_clusterer()
+                if source:
+                    self._remember_source_urls(cursor, source['source_name'], source['category'], seen_urls)
+                conn.commit()
+                self._remember_urls([url for _, url, _ in inserted])
+                return [{'id': row_id, 'url': url} for row_id, url, _ in inserted]
+        except Exception as e:
+            print(f"크롤링된 뉴스 목록 저장 실패: {e}")
+            # 클러스터러는 커밋 전에 갱신되므로, 롤백된 id로 만든 클러스터가 남지 않게 버림
+            self._forget_story_clusterer()
+            return None
+
+    def get_recent_source_urls(self, source_name: str, category: str) -> set:
+        """소스(언론사 + 카테고리) 목록 페이지에서 최근에 본 URL 집합"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
-                    INSERT INTO scraped_news (title, url, source_name, category, scraped_at)
-                    VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
-                    ON CONFLICT(url) DO NOTHING
-                """, (news_item['title'], news_item['url'], news_item.get('source_name'), news_item.get('category')))
+                    SELECT url FROM source_seen_urls WHERE source_name = ? AND category = ?
+                """, (source_name, category))
+                return {row[0] for row in cursor.fetchall()}
+        except Exception as e:
+            print(f"최근 수집 URL 조회 실패: {e}")
+            return set()
+
+    def remember_source_urls(self, source_name: str, category: str, urls: List[str], keep: int = 300) -> bool:
+        """목록 페이지에서 본 URL을 소스별 링에 기록 (최근 keep개만 유지)
+
+        링에 있는 URL은 다음 수집에서 건너뛰므로, 해당 기사를 저장한 뒤에 기록해야 합니다.
+        """
+        if not urls:
+            return True
+        try:
+            with self._connect() as conn:
+                self._remember_source_urls(conn.cursor(), source_name, category, urls, keep)
                 conn.commit()
-                return cursor.rowcount > 0 # 저장되었으면 True, 중복이면(0) False
+                return True
         except Exception as e:
-            print(f"수집 뉴스 저장 실패: {e}")
+            print(f"최근 수집 URL 기록 실패: {e}")
             return False
 
-    def save_crawled_news(self, news_list: List[Dict]) -> int:
-        """크롤링된 뉴스 목록 저장 (Bulk)"""
-        added_count = 0
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                for news in news_list:
-                    try:
-                        cursor.execute("""
-                            INSERT INTO scraped_news (title, url, source_name, category, scraped_at)
-                            VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
-                            ON CONFLICT(url) DO NOTHING
-                        """, (news['title'], news['url'], news.get('source_name'), news.get('category')))
-                        if cursor.rowcount > 0:
-                            added_count += 1
-                    except Exception as e:
-                        print(f"개별 뉴스 저장 실패 ({news.get('title')}): {e}")
-                        continue
+    @staticmethod
+    def _remember_source_urls(cursor, source_name: str, category: str, urls: List[str], keep: int = 300):
+        if not urls:
+            return
+        cursor.executemany("""
+            INSERT INTO source_seen_urls (source_name, category, url, seen_at)
+            VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+            ON CONFLICT(source_name, category, url) DO UPDATE SET seen_at = excluded.seen_at
+        """, [(source_name, category, url) for url in urls])
+        cursor.execute("""
+            DELETE FROM source_seen_urls
+            WHERE source_name = ? AND category = ? AND url NOT IN (
+                SELECT url FROM source_seen_urls
+                WHERE source_name = ? AND category = ?
+                ORDER BY seen_at DESC LIMIT ?
+            )
+        """, (source_name, category, source_name, category, keep))
+
+    def get_source_poll_states(self) -> Dict[Tuple[str, str], Dict]:
+        """수집 데몬 폴링 상태 - {(source_name, category): 상태}"""
+        try:
+            with self._connect() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT source_name, category, interval_seconds, new_items_per_hour, last_polled_at,
+                           last_new_count, consecutive_failures, next_poll_at
+                    FROM source_poll_state
+                """)
+                return {(row['source_name'], row['category']): row for row in Record.from_cursor(cursor)}
+        except Exception as e:
+            print(f"폴링 상태 조회 실패: {e}")
+            return {}
+
+    def save_source_poll_state(self, source_name: str, category: str, interval_seconds: float,
+                               new_items_per_hour: Optional[float], last_polled_at: str, last_new_count: Optional[int],
+                               consecutive_failures: int, next_poll_at: str) -> bool:
+        """소스 하나의 폴링 상태 저장"""
+        try:
+            with self._connect() as conn:
+                conn.execute("""
+                    INSERT OR REPLACE INTO source_poll_state
+                        (source_name, category, interval_seconds, new_items_per_hour, last_polled_at,
+                         last_new_count, consecutive_failures, next_poll_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """, (source_name, category, interval_seconds, new_items_per_hour, last_polled_at,
+                      last_new_count, consecutive_failures, next_poll_at))
                 conn.commit()
-                return added_count
+                return True
         except Exception as e:
-            print(f"크롤링된 뉴스 목록 저장 실패: {e}")
+            print(f"폴링 상태 저장 실패: {e}")
+            return False
+
+    def get_url_failure(self, url: str) -> Optional[Dict]:
+        """재시도 시각이 지나지 않은 실패 기록 (없거나 재시도할 때가 되었으면 None)"""
+        try:
+            candidates = lookup_urls(url)
+            with self._connect() as conn:
+                cursor = conn.cursor()
+                cursor.execute(f"""
+                    SELECT url, failures, last_error, last_failed_at, retry_at FROM failed_urls
+                    WHERE url IN ({",".join("?" * len(candidates))}) AND retry_at > CURRENT_TIMESTAMP
+                """, candidates)
+                row = cursor.fetchone()
+                return Record.from_row(cursor, row) if row else None
+        except Exception as e:
+            print(f"실패 URL 조회 실패: {e}")
+            return None
+
+    def record_url_failure(self, url: str, error: str = None, base_delay: float = 900,
+                           max_delay: float = 86400) -> bool:
+        """URL 실패 기록 - 재시도 대기 시간은 base_delay부터 실패할 때마다 두 배 (최대 max_delay초)"""
+        url = canonicalize_url(url) or url
+        try:
+            with self._connect() as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT failures FROM failed_urls WHERE url = ?", (url,))
+                row = cursor.fetchone()
+                failures = (row[0] if row else 0) + 1
+                delay = min(base_delay * 2 ** (failures - 1), max_delay)
+                cursor.execute("""
+                    INSERT INTO failed_urls (url, failures, last_error, last_failed_at, retry_at)
+                    VALUES (?, ?, ?, CURRENT_TIMESTAMP, datetime('now', ?))
+                    ON CONFLICT(url) DO UPDATE SET failures = excluded.failures, last_error = excluded.last_error,
+                        last_failed_at = excluded.last_failed_at, retry_at = excluded.retry_at
+                """, (url, failures, error, f"+{int(delay)} seconds"))
+                conn.commit()
+                return True
+        except Exception as e:
+            print(f"실패 URL 기록 실패: {e}")
+            return False
+
+    def clear_url_failure(self, url: str) -> bool:
+        """성공한 URL의 실패 기록 삭제"""
+        try:
+            candidates = lookup_urls(url)
+            with self._connect() as conn:
+                conn.execute(f"DELETE FROM failed_urls WHERE url IN ({','.join('?' * len(candidates))})", candidates)
+                conn.commit()
+                return True
+        except Exception as e:
+            print(f"실패 URL 기록 삭제 실패: {e}")
+            return False
+
+    def enqueue_crawl_tasks(self, kind: str, tasks: Dict[str, Dict], max_attempts: int = 3) -> int:
+        """작업 등록 ({task_key: payload}) - 같은 키의 작업이 대기 / 처리 중이면 건너뛰고 새로 등록된 건수 반환"""
+        if not tasks:
+            return 0
+        try:
+            with self._connect() as conn:
+                before = conn.total_changes
+                conn.executemany("""
+                    INSERT OR IGNORE INTO crawl_tasks (kind, task_key, payload, max_attempts) VALUES (?, ?, ?, ?)
+                """, [(kind, key, json.dumps(payload, ensure_ascii=False), max_attempts) for key, payload in tasks.items()])
+                conn.commit()
+                return conn.total_changes - before
+        except Exception as e:
+            print(f"수집 작업 등록 실패: {e}")
             return 0
 
-    def get_scraped_news(self, limit: int = 200) -> List[Dict]:
-        """수집된 뉴스 목록 조회"""
+    def claim_crawl_task(self, worker_id: str, kinds: List[str] = None, lease_seconds: float = 120) -> Optional[Dict]:
+        """대기 중이거나 임대가 만료된 작업 하나를 원자적으로 임대 (없으면 None)
+
+        임대가 만료된 작업은 작업자가 처리 중에 죽은 것으로 보고 시도 횟수에 포함하며,
+        max_attempts번 시도해도 끝나지 않은 작업(작업자를 죽이는 작업 포함)은 격리합니다.
+        """
+        kinds = kinds or ["source", "article"]
+        placeholders = ",".join("?" * len(kinds))
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
+                cursor.execute("BEGIN IMMEDIATE")
                 cursor.execute("""
-                    SELECT title, url, source_name, category, scraped_at 
+                    UPDATE crawl_tasks
+                    SET status = 'quarantined', lease_owner = NULL, lease_expires_at = NULL,
+                        last_error = COALESCE(last_error || ' / ', '') || '임대 만료 (작업자 중단)',
+                        finished_at = CURRENT_TIMESTAMP
+                    WHERE status = 'leased' AND lease_expires_at <= CURRENT_TIMESTAMP AND attempts >= max_attempts
+                """)
+                cursor.execute(f"""
+                    UPDATE crawl_tasks
+                    SET status = 'leased', lease_owner = ?, lease_expires_at = datetime('now', ?),
+                        attempts = attempts + 1
+                    WHERE id = (
+                        SELECT id FROM crawl_tasks
+                        WHERE kind IN ({placeholders})
+                          AND ((status = 'pending' AND available_at <= CURRENT_TIMESTAMP)
+                               OR (status = 'leased' AND lease_expires_at <= CURRENT_TIMESTAMP))
+                        ORDER BY available_at, id LIMIT 1
+                    )
+                    RETURNING id, kind, task_key, payload, attempts, max_attempts
+                """, [worker_id, f"+{int(lease_seconds)} seconds", *kinds])
+                rows = cursor.fetchall()  # RETURNING 문을 끝까지 실행한 뒤 커밋
+                task = Record.from_row(cursor, rows[0]) if rows else None
+                conn.commit()
+        except Exception as e:
+            print(f"수집 작업 임대 실패: {e}")
+            return None
+        if task:
+            task['payload'] = json.loads(task['payload'])
+        return task
+
+    def heartbeat_crawl_task(self, task_id: int, worker_id: str, lease_seconds: float = 120) -> bool:
+        """작업 임대 연장 - 임대를 이미 잃었으면(만료 후 다른 작업자가 가져감) False"""
+        try:
+            with self._connect() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    UPDATE crawl_tasks SET lease_expires_at = datetime('now', ?)
+                    WHERE id = ? AND lease_owner = ? AND status = 'leased'
+                """, (f"+{int(lease_seconds)} seconds", task_id, worker_id))
+                extended = cursor.rowcount == 1
+                cursor.execute("UPDATE crawl_workers SET last_heartbeat_at = CURRENT_TIMESTAMP WHERE worker_id = ?",
+                               (worker_id,))
+                conn.commit()
+                return extended
+        except Exception as e:
+            print(f"수집 작업 임대 연장 실패: {e}")
+            return False
+
+    def complete_crawl_task(self, task_id: int, worker_id: str, busy_seconds: float = 0) -> bool:
+        """작업 완료 처리 - 임대를 잃었으면 False (다른 작업자가 다시 처리하므로 결과는 중복 저장되지 않도록 멱등이어야 함)"""
+        try:
+            with self._connect() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    UPDATE crawl_tasks
+                    SET status = 'done', lease_expires_at = NULL, last_error = NULL, finished_at = CURRENT_TIMESTAMP
+                    WHERE id = ? AND lease_owner = ? AND status = 'leased'
+                """, (task_id, worker_id))
+                completed = cursor.rowcount == 1
+                cursor.execute("""
+                    UPDATE crawl_workers
+                    SET tasks_done = tasks_done + ?, busy_seconds = busy_seconds + ?, last_heartbeat_at = CURRENT_TIMESTAMP
+                    WHERE worker_id = ?
+                """, (int(completed), busy_seconds, worker_id))
+                conn.commit()
+                return completed
+        except Exception as e:
+            print(f"수집 작업 완료 처리 실패: {e}")
+            return False
+
+    def fail_crawl_task(self, task_id: int, worker_id: str, error: str = None, busy_seconds: float = 0,
+                        base_delay: float = 60, max_delay: float = 3600) -> Optional[str]:
+        """작업 실패 처리 - 시도 횟수가 남았으면 base_delay부터 두 배씩 늘린 뒤 재시도(pending), 아니면 격리(quarantined)
+
+        바뀐 상태를 반환 (임대를 잃었으면 None)
+        """
+        try:
+            with self._connect() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    UPDATE crawl_tasks
+                    SET status = CASE WHEN attempts >= max_attempts THEN 'quarantined' ELSE 'pending' END,
+                        available_at = datetime('now', '+' || CAST(MIN(? * (1 << (attempts - 1)), ?) AS INTEGER) || ' seconds'),
+                        finished_at = CASE WHEN attempts >= max_attempts THEN CURRENT_TIMESTAMP END,
+                        lease_owner = NULL, lease_expires_at = NULL, last_error = ?
+                    WHERE id = ? AND lease_owner = ? AND status = 'leased'
+                    RETURNING status
+                """, (base_delay, max_delay, error, task_id, worker_id))
+                rows = cursor.fetchall()
+                cursor.execute("""
+                    UPDATE crawl_workers
+                    SET tasks_failed = tasks_failed + 1, busy_seconds = busy_seconds + ?, last_heartbeat_at = CURRENT_TIMESTAMP
+                    WHERE worker_id = ?
+                """, (busy_seconds, worker_id))
+                conn.commit()
+                return rows[0][0] if rows else None
+        except Exception as e:
+            print(f"수집 작업 실패 처리 실패: {e}")
+            return None
+
+    def requeue_quarantined_tasks(self, kind: str = None) -> int:
+        """격리된 작업을 시도 횟수를 초기화하여 다시 대기열로 (같은 키의 작업이 대기 중이면 그대로 둠)"""
+        try:
+            with self._connect() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    UPDATE OR IGNORE crawl_tasks
+                    SET status = 'pending', attempts = 0, available_at = CURRENT_TIMESTAMP, finished_at = NULL
+                    WHERE status = 'quarantined' AND (? IS NULL OR kind = ?)
+                """, (kind, kind))
+                conn.commit()
+                return cursor.rowcount
+        except Exception as e:
+            print(f"격리 작업 재등록 실패: {e}")
+            return 0
+
+    def purge_crawl_tasks(self, days: float = 7) -> int:
+        """완료된 지 days일이 지난 작업 삭제 (격리된 작업은 확인할 수 있도록 남김)"""
+        try:
+            with self._connect() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    DELETE FROM crawl_tasks WHERE status = 'done' AND finished_at < datetime('now', ?)
+                """, (f"-{days} days",))
+                conn.commit()
+                return cursor.rowcount
+        except Exception as e:
+            print(f"완료 작업 정리 실패: {e}")
+            return 0
+
+    def register_crawl_worker(self, worker_id: str, hostname: str = None, pid: int = None) -> bool:
+        """작업자 등록 (같은 ID로 다시 시작하면 통계 초기화)"""
+        try:
+            with self._connect() as conn:
+                conn.execute("""
+                    INSERT OR REPLACE INTO crawl_workers (worker_id, hostname, pid, started_at, last_heartbeat_at)
+                    VALUES (?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+                """, (worker_id, hostname, pid))
+                conn.commit()
+                return True
+        except Exception as e:
+            print(f"수집 작업자 등록 실패: {e}")
+            return False
+
+    def get_crawl_queue_stats(self) -> Dict:
+        """작업 종류 / 상태별 건수와 작업자별 처리량
+
+        반환: {'tasks': {kind: {status: 건수}}, 'workers': [작업자별 통계 (tasks_per_minute 포함)]}
+        """
+        try:
+            with self._connect() as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT kind, status, COUNT(*) FROM crawl_tasks GROUP BY kind, status")
+                tasks = {}
+                for kind, status, count in cursor.fetchall():
+                    tasks.setdefault(kind, {})[status] = count
+                cursor.execute("""
+                    SELECT worker_id, hostname, pid, started_at, last_heartbeat_at, tasks_done, tasks_failed,
+                           busy_seconds,
+                           tasks_done * 60.0 / MAX(1, (julianday('now') - julianday(started_at)) * 86400)
+                               AS tasks_per_minute
+                    FROM crawl_workers ORDER BY last_heartbeat_at DESC
+                """)
+                return {'tasks': tasks, 'workers': Record.from_cursor(cursor)}
+        except Exception as e:
+            print(f"수집 작업 통계 조회 실패: {e}")
+            return {'tasks': {}, 'workers': []}
+
+    def save_article_content(self, article: Dict) -> bool:
+        """추출한 기사 본문 저장 (같은 URL이면 갱신, content는 압축)"""
+        url = canonicalize_url(article.get('url')) or article.get('url')
+        if not url or not article.get('content'):
+            return False
+        try:
+            with self._connect() as conn:
+                conn.execute("""
+                    INSERT OR REPLACE INTO article_contents
+                        (url, title, content, published_at, authors, extraction, fetched_at)
+                    VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                """, (url, article.get('title'), self.compressor.compress(article['content']), article.get('published_at'),
+                      json.dumps(article.get('authors') or [], ensure_ascii=False), article.get('extraction')))
+                conn.commit()
+                return True
+        except Exception as e:
+            print(f"기사 본문 저장 실패: {e}")
+            return False
+
+    def get_article_content(self, url: str) -> Optional[Dict]:
+        """수집 작업자가 저장한 기사 본문 (없으면 None)"""
+        try:
+            candidates = lookup_urls(url)
+            with self._connect() as conn:
+                cursor = conn.cursor()
+                cursor.execute(f"""
+                    SELECT url, title, decompress_text(content) AS content, published_at, authors, extraction, fetched_at
+                    FROM article_contents WHERE url IN ({",".join("?" * len(candidates))})
+                """, candidates)
+                row = cursor.fetchone()
+                if not row:
+                    return None
+                article = Record.from_row(cursor, row)
+                article['authors'] = json.loads(article['authors'] or '[]')
+                return article
+        except Exception as e:
+            print(f"기사 본문 조회 실패: {e}")
+            return None
+
+    def create_batch_run(self, kind: str, items: Dict[str, Dict], params: Dict = None) -> Optional[int]:
+        """일괄 작업 실행 기록 생성 ({item_key: payload}, 순서 유지) - 실행 ID 반환"""
+        try:
+            with self._connect() as conn:
+                cursor = conn.cursor()
+                cursor.execute("INSERT INTO batch_runs (kind, params) VALUES (?, ?)",
+                               (kind, json.dumps(params or {}, ensure_ascii=False)))
+                run_id = cursor.lastrowid
+                cursor.executemany("""
+                    INSERT OR IGNORE INTO batch_run_items (run_id, item_key, position, payload) VALUES (?, ?, ?, ?)
+                """, [(run_id, key, position, json.dumps(payload, ensure_ascii=False))
+                      for position, (key, payload) in enumerate(items.items())])
+                conn.commit()
+                return run_id
+        except Exception as e:
+            print(f"일괄 작업 생성 실패: {e}")
+            return None
+
+    def _batch_run_counts(self, cursor, run_ids: List[int]) -> Dict[int, Dict[str, int]]:
+        counts = {run_id: {} for run_id in run_ids}
+        if run_ids:
+            cursor.execute(f"""
+                SELECT run_id, state, COUNT(*) FROM batch_run_items
+                WHERE run_id IN ({",".join("?" * len(run_ids))}) GROUP BY run_id, state
+            """, run_ids)
+            for run_id, state, count in cursor.fetchall():
+                counts[run_id][state] = count
+        return counts
+
+    def get_batch_run(self, run_id: int) -> Optional[Dict]:
+        """일괄 작업 실행 정보 (counts: 상태별 항목 수, total: 전체 항목 수)"""
+        try:
+            with self._connect() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT id, kind, status, params, created_at, updated_at, finished_at FROM batch_runs WHERE id = ?
+                """, (run_id,))
+                row = cursor.fetchone()
+                if not row:
+                    return None
+                run = Record.from_row(cursor, row)
+                run['params'] = json.loads(run['params'] or '{}')
+                run['counts'] = self._batch_run_counts(cursor, [run_id])[run_id]
+                run['total'] = sum(run['counts'].values())
+                return run
+        except Exception as e:
+            print(f"일괄 작업 조회 실패: {e}")
+            return None
+
+    def get_unfinished_batch_runs(self, kind: str = None) -> List[Dict]:
+        """끝나지 않은(중단된) 일괄 작업 목록 - 최근 갱신 순"""
+        try:
+            with self._connect() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT id, kind, status, params, created_at, updated_at, finished_at FROM batch_runs
+                    WHERE status = 'running' AND (? IS NULL OR kind = ?)
+                    ORDER BY updated_at DESC
+                """, (kind, kind))
+                runs = Record.from_cursor(cursor)
+                counts = self._batch_run_counts(cursor, [run['id'] for run in runs])
+                for run in runs:
+                    run['params'] = json.loads(run['params'] or '{}')
+                    run['counts'] = counts[run['id']]
+                    run['total'] = sum(run['counts'].values())
+                return runs
+        except Exception as e:
+            print(f"중단된 일괄 작업 조회 실패: {e}")
+            return []
+
+    def get_batch_run_items(self, run_id: int, states: List[str] = None) -> List[Dict]:
+        """일괄 작업 항목 목록 (등록 순서, payload / result는 JSON 복원)"""
+        try:
+            with self._connect() as conn:
+                cursor = conn.cursor()
+                query = "SELECT item_key, position, payload, state, result, error FROM batch_run_items WHERE run_id = ?"
+                params = [run_id]
+                if states:
+                    query += f" AND state IN ({','.join('?' * len(states))})"
+                    params.extend(states)
+                cursor.execute(query + " ORDER BY position", params)
+                items = Record.from_cursor(cursor)
+                for item in items:
+                    item['payload'] = json.loads(item['payload'])
+                    item['result'] = json.loads(item['result']) if item['result'] else None
+                return items
+        except Exception as e:
+            print(f"일괄 작업 항목 조회 실패: {e}")
+            return []
+
+    def update_batch_run_item(self, run_id: int, item_key: str, state: str, result: Dict = None,
+                              error: str = None) -> bool:
+        """항목 진행 상태 기록 (단계가 끝날 때마다 호출하여 중단되어도 그 단계부터 이어서 실행)"""
+        try:
+            with self._connect() as conn:
+                conn.execute("""
+                    UPDATE batch_run_items SET state = ?, result = COALESCE(?, result), error = ?,
+                        updated_at = CURRENT_TIMESTAMP
+                    WHERE run_id = ? AND item_key = ?
+                """, (state, json.dumps(result, ensure_ascii=False) if result is not None else None, error,
+                      run_id, item_key))
+                conn.execute("UPDATE batch_runs SET updated_at = CURRENT_TIMESTAMP WHERE id = ?", (run_id,))
+                conn.commit()
+                return True
+        except Exception as e:
+            print(f"일괄 작업 항목 갱신 실패: {e}")
+            return False
+
+    def finish_batch_run(self, run_id: int, status: str = "completed") -> bool:
+        """일괄 작업 종료 (completed / cancelled)"""
+        try:
+            with self._connect() as conn:
+                conn.execute("""
+                    UPDATE batch_runs SET status = ?, updated_at = CURRENT_TIMESTAMP, finished_at = CURRENT_TIMESTAMP
+                    WHERE id = ?
+                """, (status, run_id))
+                conn.commit()
+                return True
+        except Exception as e:
+            print(f"일괄 작업 종료 처리 실패: {e}")
+            return False
+
+    def get_url_filter(self) -> ScalableBloomFilter:
+        """전체 수집 이력 URL 블룸 필터 (파일을 새로 만들면 기존 DB의 URL로 채움)"""
+        url_filter = self._url_filters.get(self.db_path)
+        if url_filter is None:
+            url_filter = ScalableBloomFilter(f"{os.path.splitext(self.db_path)[0]}_urls.bloom")
+            if url_filter.created:
+                with self._connect() as conn:
+                    cursor = conn.cursor()
+                    cursor.execute("SELECT url FROM scraped_news UNION SELECT url FROM news_summaries")
+                    url_filter.update(candidate for row in cursor for candidate in lookup_urls(row[0]))
+            self._url_filters[self.db_path] = url_filter
+        return url_filter
+
+    def _remember_urls(self, urls: List[str]):
+        if not urls:
+            return
+        try:
+            self.get_url_filter().update(urls)
+        except Exception as e:
+            print(f"수집 URL 블룸 필터 갱신 실패: {e}")
+
+    def filter_new_news(self, news_list: List[Dict], batch_size: int = 500) -> List[Dict]:
+        """이전에 수집한 적 없는 뉴스만 반환
+
+        블룸 필터가 '없음'으로 판정한 URL은 DB 조회 없이 새 기사로 보고,
+        '있음'으로 판정한 URL만 DB에서 확인합니다. (DB에 없으면 오탐으로 집계)
+        """
+        if not news_list:
+            return []
+        try:
+            url_filter = self.get_url_filter()
+            keys = [canonicalize_url(news.get('url')) or news.get('url') for news in news_list]
+            candidates = {key for key in keys if key and key in url_filter}
+            if not candidates:
+                url_filter.record_lookups(absent=len(news_list), false_positives=0)
+                return list(news_list)
+
+            existing = set()
+            with self._connect() as conn:
+                cursor = conn.cursor()
+                mapping = _lookup_map(list(candidates))
+                urls = list(mapping)
+                for start in range(0, len(urls), batch_size):
+                    chunk = urls[start:start + batch_size]
+                    placeholders = ",".join("?" * len(chunk))
+                    cursor.execute(f"""
+                        SELECT url FROM scraped_news WHERE url IN ({placeholders})
+                        UNION SELECT url FROM news_summaries WHERE url IN ({placeholders})
+                    """, chunk + chunk)
+                    for (url,) in cursor.fetchall():
+                        existing.update(mapping[url])
+
+            new_news = [news for news, key in zip(news_list, keys) if key not in existing]
+            url_filter.record_lookups(absent=len(new_news), false_positives=len(candidates - existing))
+            return new_news
+        except Exception as e:
+            print(f"신규 뉴스 판별 실패: {e}")
+            return list(news_list)
+
+    def url_filter_stats(self) -> Dict:
+        """수집 URL 블룸 필터 통계 (항목 수, 예상 / 실측 오탐률 등)"""
+        try:
+            return self.get_url_filter().stats()
+        except Exception as e:
+            print(f"수집 URL 블룸 필터 통계 조회 실패: {e}")
+            return {}
+
+    @staticmethod
+    def _build_list_filters(category=None, source_name=None, since: str = None, until: str = None,
+                            cursor: str = None, date_column: str = "created_at") -> Tuple[List[str], List]:
+        """카테고리/언론사/기간/커서 조건을 WHERE 절로 변환"""
+        conditions = []
+        params = []
+        categories = _as_list(category)
+        if categories:
+            conditions.append(f"category IN ({','.join('?' * len(categories))})")
+            params.extend(categories)
+        sources = _as_list(source_name)
+        if sources:
+            conditions.append(f"source_name IN ({','.join('?' * len(sources))})")
+            params.extend(sources)
+        if since:
+            conditions.append(f"{date_column} >= ?")
+            params.append(since)
+        if until:
+            conditions.append(f"{date_column} < ?")
+            params.append(until)
+        if cursor:
+            # 키셋 페이지네이션: 마지막으로 본 (시각, id) 이전 행만 조회
+            sort_value, row_id = _decode_cursor(cursor)
+            conditions.append(f"({date_column}, id) < (?, ?)")
+            params.extend([sort_value, row_id])
+        return conditions, params
+
+    @staticmethod
+    def _fetch_page(cursor, query: str, params: List, limit: Optional[int], date_column: str,
+                    record_type=Record) -> ResultPage:
+        """limit + 1행을 읽어 다음 페이지 존재 여부와 커서 계산"""
+        if limit is not None:
+            query += " LIMIT ?"
+            params = params + [limit + 1]
+        cursor.execute(query, params)
+        rows = record_type.from_cursor(cursor)
+        next_cursor = None
+        if limit is not None and len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = _encode_cursor(rows[-1][date_column], rows[-1]['id'])
+        return ResultPage(rows, next_cursor)
+
+    def get_scraped_news(self, limit: int = 200, category=None, source_name=None,
+                         since: str = None, until: str = None, cursor: str = None,
+                         order_by: str = "scraped_at") -> List[Dict]:
+        """수집된 뉴스 목록 조회 (최신순)
+
+        category / source_name: 단일 값 또는 목록, since / until: 'YYYY-MM-DD HH:MM:SS' (UTC)
+        cursor: 이전 결과의 next_cursor - 반환값(ResultPage)의 next_cursor로 다음 페이지 조회
+        order_by: "scraped_at"(수집 시각) 또는 "published_at"(발행 시각, 발행 시각을 모르는 기사는 제외)
+                  - since / until / cursor도 이 컬럼 기준
+        """
+        try:
+            if order_by not in ("scraped_at", "published_at"):
+                raise ValueError(f"지원하지 않는 정렬 기준입니다: {order_by}")
+            with self._connect() as conn:
+                db_cursor = conn.cursor()
+                conditions, params = self._build_list_filters(
+                    category, source_name, since, until, cursor, date_column=order_by
+                )
+                if order_by == "published_at":
+                    conditions.append("published_at IS NOT NULL")
+                where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+                query = f"""
+                    SELECT id, title, url, source_name, category, scraped_at, published_at, cluster_id
                     FROM scraped_news
-                    ORDER BY scraped_at DESC
-                    LIMIT ?
-                """, (limit,))
-                columns = [description[0] for description in cursor.description]
-                return [dict(zip(columns, row)) for row in cursor.fetchall()]
+                    {where}
+                    ORDER BY {order_by} DESC, id DESC
+                """
+                return self._fetch_page(db_cursor, query, params, limit, order_by, ScrapedNews)
         except Exception as e:
             print(f"수집 뉴스 조회 실패: {e}")
-            return []
+            return ResultPage()
+
+    def get_recent_news(self, hours: float = 24, category=None, source_name=None, limit: int = 200,
+                        cursor: str = None) -> List[Dict]:
+        """최근 hours시간 안에 발행된 뉴스 (발행 시각 최신순, published_at 인덱스 범위 조회)"""
+        since = (datetime.now(timezone.utc) - timedelta(hours=hours)).strftime(DB_TIME_FORMAT)
+        return self.get_scraped_news(limit=limit, category=category, source_name=source_name,
+                                     since=since, cursor=cursor, order_by="published_at")
+
+    def get_cluster_ids(self, urls: List[str]) -> Dict[str, int]:
+        """URL별 동일 사건 클러스터 ID 조회"""
+        if not urls:
+            return {}
+        try:
+            mapping = _lookup_map(urls)
+            candidates = list(mapping)
+            with self._connect() as conn:
+                cursor = conn.cursor()
+                result = {}
+                for start in range(0, len(candidates), 500):
+                    chunk = candidates[start:start + 500]
+                    placeholders = ",".join("?" * len(chunk))
+                    cursor.execute(f"""
+                        SELECT url, cluster_id FROM scraped_news
+                        WHERE url IN ({placeholders}) AND cluster_id IS NOT NULL
+                    """, chunk)
+                    for url, cluster_id in cursor.fetchall():
+                        result.update(dict.fromkeys(mapping[url], cluster_id))
+                return result
+        except Exception as e:
+            print(f"클러스터 ID 조회 실패: {e}")
+            return {}
 
     def save_news_summary(self, title: str, url: str, category: str, source_name: str, 
-                         summary: str, content: str = None) -> int:
-        """뉴스 요약 저장"""
+                         summary: str, content: str = None, published_at: str = None) -> int:
+        """뉴스 요약 저장 (URL은 정규화, 기사 본문 content는 압축하여 저장)"""
+        url = canonicalize_url(url) or url
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
-                    INSERT INTO news_summaries (title, url, category, source_name, summary, content)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """, (title, url, category, source_name, summary, content))
+                    INSERT INTO news_summaries (title, url, category, source_name, summary, content, published_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                """, (title, url, category, source_name, summary, self.compressor.compress(content), published_at))
+                summary_id = cursor.lastrowid
+                self._index_summaries(cursor, [(summary_id, title, summary, content)])
                 conn.commit()
-                return cursor.lastrowid
         except Exception as e:
             print(f"뉴스 요약 저장 실패: {e}")
             return None
-    
-    def get_news_summaries(self, category: str = None, is_favorite: bool = None) -> List[Dict]:
-        """뉴스 요약 목록 조회"""
+
+        self._remember_urls([url])
+        return summary_id
+
+    def _load_compression_dictionary(self, dictionary_id: int) -> Optional[Tuple[int, bytes]]:
+        """다른 인스턴스가 학습한 압축 사전 조회"""
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute("SELECT codec, data FROM compression_dictionaries WHERE id = ?",
+                               (dictionary_id,)).fetchone()
+            return (row[0], row[1]) if row else None
+
+    def train_compression_dictionary(self, sample_limit: int = 1000,
+                                     min_samples: int = DICTIONARY_TRAIN_MIN_SAMPLES) -> Optional[int]:
+        """최근 저장된 본문으로 압축 사전 학습 (사전 ID 반환, 이후 저장하는 본문부터 사용)
+
+        저장 경로에서 자동으로 실행하지 않는 유지보수 작업입니다 (maintenance.py --train-dictionary).
+        기존 본문은 recompress_contents로 따로 다시 압축합니다.
+        """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT decompress_text(content) FROM news_summaries
+                    WHERE content IS NOT NULL AND content != ''
+                    ORDER BY id DESC LIMIT ?
+                """, (sample_limit,))
+                samples = [row[0] for row in cursor.fetchall()]
+                if len(samples) < min_samples:
+                    print(f"ℹ️ 압축 사전 학습에 필요한 본문이 부족합니다 ({len(samples)}/{min_samples}개)")
+                    return None
+
+                data = train_dictionary(samples, self.compressor.codec)
+                if not data:
+                    return None
+                cursor.execute("""
+                    INSERT INTO compression_dictionaries (codec, data, sample_count) VALUES (?, ?, ?)
+                """, (self.compressor.codec, data, len(samples)))
+                dictionary_id = cursor.lastrowid
+                self.compressor.add_dictionary(dictionary_id, self.compressor.codec, data)
+                conn.commit()
+        except Exception as e:
+            print(f"압축 사전 학습 실패: {e}")
+            return None
+        return dictionary_id
+
+    def recompress_contents(self, batch_size: int = 500) -> int:
+        """현재 사전으로 압축되지 않은 본문을 다시 압축 (변경된 행 수 반환)"""
+        updated = 0
+        try:
+            with self._connect() as conn:
+                cursor = conn.cursor()
+                last_id = 0
+                while True:
+                    cursor.execute("""
+                        SELECT id, content FROM news_summaries
+                        WHERE id > ? AND content IS NOT NULL
+                        ORDER BY id LIMIT ?
+                    """, (last_id, batch_size))
+                    rows = cursor.fetchall()
+                    if not rows:
+                        break
+                    last_id = rows[-1][0]
+                    changes = []
+                    for summary_id, stored in rows:
+                        recompressed = self.compressor.compress(self.compressor.decompress(stored))
+                        if recompressed != stored:
+                            changes.append((recompressed, summary_id))
+                    cursor.executemany("UPDATE news_summaries SET content = ? WHERE id = ?", changes)
+                    updated += len(changes)
+                conn.commit()
+        except Exception as e:
+            print(f"본문 재압축 실패: {e}")
+        return updated
+
+    def get_storage_stats(self) -> Dict:
+        """요약본 본문 원본 크기 / 저장 크기 통계"""
+        try:
+            with self._connect() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT COUNT(content),
+                           COALESCE(SUM(LENGTH(CAST(decompress_text(content) AS BLOB))), 0),
+                           COALESCE(SUM(LENGTH(CAST(content AS BLOB))), 0)
+                    FROM news_summaries WHERE content IS NOT NULL
+                """)
+                count, raw_bytes, stored_bytes = cursor.fetchone()
+                return {
+                    'content_rows': count,
+                    'raw_bytes': raw_bytes,
+                    'stored_bytes': stored_bytes,
+                    'ratio': raw_bytes / stored_bytes if stored_bytes else 1.0,
+                    'dictionary_id': self.compressor.current_dictionary_id,
+                }
+        except Exception as e:
+            print(f"저장 공간 통계 조회 실패: {e}")
+            return {}
+
+    def _get_vector_index(self) -> VectorIndex:
+        """현재 임베딩 생성기용 메모리 맵 벡터 저장소 (여러 스레드가 같은 인스턴스를 공유)"""
+        with self._vector_index_lock:
+            if self._vector_index is None:
+                path = f"{os.path.splitext(self.db_path)[0]}_{self.embedder.name}.vectors"
+                self._vector_index = VectorIndex(path, self.embedder.dim)
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT COALESCE(MAX(row_index), -1) + 1 FROM summary_embeddings WHERE embedder = ?",
+                           (self.embedder.name,))
+            self._vector_index.update_count(cursor.fetchone()[0])
+        return self._vector_index
+
+    def index_summary_embeddings(self, batch_size: int = 256) -> int:
+        """아직 임베딩되지 않은 요약본을 벡터 저장소에 추가 (추가한 수 반환)
+
+        임베딩 생성기가 API를 호출할 수 있으므로 저장 / 조회 경로가 아니라 일괄 단계
+        (요약 작업이 끝날 때, maintenance.py --index-embeddings)에서 실행합니다.
+        """
+        indexed = 0
+        try:
+            index = self._get_vector_index()
+            while True:
+                with self._connect() as conn:
+                    cursor = conn.cursor()
+                    cursor.execute("""
+                        SELECT ns.id, ns.title, ns.summary FROM news_summaries ns
+                        LEFT JOIN summary_embeddings se ON se.summary_id = ns.id AND se.embedder = ?
+                        WHERE se.summary_id IS NULL
+                        ORDER BY ns.id
+                        LIMIT ?
+                    """, (self.embedder.name, batch_size))
+                    rows = cursor.fetchall()
+                    if not rows:
+                        return indexed
+                    # 임베딩(네트워크 호출일 수 있음)은 쓰기 잠금 밖에서 먼저 생성
+                    vectors = self.embedder.embed([f"{title}\n{summary}" for _, title, summary in rows])
+
+                    # 행 번호 예약 (여러 프로세스가 동시에 추가해도 겹치지 않도록)
+                    cursor.execute("BEGIN IMMEDIATE")
+                    cursor.execute("SELECT COALESCE(MAX(row_index), -1) + 1 FROM summary_embeddings WHERE embedder = ?",
+                                   (self.embedder.name,))
+                    start = cursor.fetchone()[0]
+                    # 벡터를 기록한 뒤에 예약을 커밋 - 기록에 실패하면 예약도 롤백되어 빈 벡터 행이 남지 않음
+                    for i, vector in enumerate(vectors):
+                        index.write(start + i, vector)
+                    cursor.executemany("""
+                        INSERT OR IGNORE INTO summary_embeddings (embedder, summary_id, row_index)
+                        VALUES (?, ?, ?)
+                    """, [(self.embedder.name, row[0], start + i) for i, row in enumerate(rows)])
+                    conn.commit()
+                indexed += len(rows)
+        except Exception as e:
+            print(f"요약본 임베딩 저장 실패: {e}")
+            return indexed
+
+    def get_related_summaries(self, summary_id: int, k: int = 5) -> List[Dict]:
+        """요약본 임베딩 코사인 유사도 기준 관련 기사 상위 k개 조회 (아직 임베딩되지 않은 요약본이면 빈 목록)"""
+        try:
+            index = self._get_vector_index()
+            with self._connect() as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT row_index FROM summary_embeddings WHERE embedder = ? AND summary_id = ?",
+                               (self.embedder.name, summary_id))
+                row = cursor.fetchone()
+                if row is None:
+                    return []
+
+                index.ensure_ivf()
+                hits = index.search(index.vector(row[0]), k=k, exclude=row[0])
+                if not hits:
+                    return []
+
+                placeholders = ",".join("?" * len(hits))
+                cursor.execute(f"""
+                    SELECT se.row_index, ns.id, ns.title, ns.url, ns.source_name, ns.category, ns.created_at
+                    FROM summary_embeddings se
+                    JOIN news_summaries ns ON ns.id = se.summary_id
+                    WHERE se.embedder = ? AND se.row_index IN ({placeholders})
+                """, [self.embedder.name] + [hit_row for hit_row, _ in hits])
+                by_row = {record['row_index']: record for record in NewsSummary.from_cursor(cursor)}
+
+                related = []
+                for hit_row, score in hits:
+                    if hit_row in by_row:
+                        item = by_row[hit_row]
+                        del item['row_index']
+                        item['similarity'] = score
+                        related.append(item)
+                return related
+        except Exception as e:
+            print(f"관련 기사 조회 실패: {e}")
+            return []
+    
+    def get_news_summaries(self, category=None, is_favorite: bool = None, source_name=None,
+                           since: str = None, until: str = None, cursor: str = None,
+                           limit: int = None, projection: str = "full", order_by: str = "created_at") -> List[Dict]:
+        """뉴스 요약 목록 조회 (필터 / 커서 규칙은 get_scraped_news와 동일, limit이 없으면 전체)
+
+        projection: "list"(제목 등 메타데이터만), "detail"(+ summary), "full"(+ content)
+        order_by: "created_at"(요약 시각) 또는 "published_at"(기사 발행 시각)
+        """
+        try:
+            if order_by not in ("created_at", "published_at"):
+                raise ValueError(f"지원하지 않는 정렬 기준입니다: {order_by}")
+            with self._connect() as conn:
+                db_cursor = conn.cursor()
                 
-                query = "SELECT * FROM news_summaries WHERE 1=1"
-                params = []
-                
-                if category:
-                    query += " AND category = ?"
-                    params.append(category)
+                conditions, params = self._build_list_filters(
+                    category, source_name, since, until, cursor, date_column=order_by
+                )
                 
                 if is_favorite is not None:
-                    query += " AND is_favorite = ?"
+                    conditions.append("is_favorite = ?")
                     params.append(is_favorite)
+                if order_by == "published_at":
+                    conditions.append("published_at IS NOT NULL")
                 
-                query += " ORDER BY created_at DESC"
+                where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+                query = f"SELECT {_projection(projection)} FROM news_summaries {where} ORDER BY {order_by} DESC, id DESC"
                 
-                cursor.execute(query, params)
-                columns = [description[0] for description in cursor.description]
-                return [dict(zip(columns, row)) for row in cursor.fetchall()]
+                return self._fetch_page(db_cursor, query, params, limit, order_by, NewsSummary)
         except Exception as e:
             print(f"뉴스 요약 조회 실패: {e}")
-            return []
+            return ResultPage()
     
     def toggle_favorite(self, news_summary_id: int) -> bool:
         """관심 뉴스 토글"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # 현재 상태 확인
@@ -247,100 +1560,279 @@ class NewsDatabase:
     def get_news_by_id(self, news_id: int) -> Optional[Dict]:
         """ID로 뉴스 정보 조회"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT * FROM news_summaries 
+                cursor.execute(f"""
+                    SELECT {_projection("full")} FROM news_summaries 
                     WHERE id = ?
                 """, (news_id,))
                 row = cursor.fetchone()
                 if row:
-                    columns = [description[0] for description in cursor.description]
-                    return dict(zip(columns, row))
+                    return NewsSummary.from_row(cursor, row)
                 return None
         except Exception as e:
             print(f"뉴스 정보 조회 실패: {e}")
             return None
 
-    def get_news_by_url(self, url: str) -> Optional[Dict]:
-        """URL로 기존 뉴스 요약본 조회"""
+    def list_news_summaries(self, category=None, source_name=None, since: str = None,
+                            until: str = None, cursor: str = None, limit: int = None) -> List[Dict]:
+        """목록 화면용 요약본 조회 (summary / content 컬럼 제외)"""
+        return self.get_news_summaries(category=category, source_name=source_name, since=since,
+                                       until=until, cursor=cursor, limit=limit, projection="list")
+
+    def get_news_summary_detail(self, summary_id: int, with_content: bool = False) -> Optional[Dict]:
+        """상세 화면용 요약본 조회 (본문 content는 with_content=True일 때만)"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT * FROM news_summaries 
-                    WHERE url = ?
-                    ORDER BY created_at DESC
+                cursor.execute(f"""
+                    SELECT {_projection("full" if with_content else "detail")}
+                    FROM news_summaries WHERE id = ?
+                """, (summary_id,))
+                row = cursor.fetchone()
+                if row:
+                    return NewsSummary.from_row(cursor, row)
+                return None
+        except Exception as e:
+            print(f"요약본 상세 조회 실패: {e}")
+            return None
+
+    def get_news_summary_text(self, summary_id: int, column: str = "summary") -> Optional[str]:
+        """요약본의 큰 텍스트 컬럼(summary 또는 content)만 필요할 때 지연 로딩"""
+        if column not in ("summary", "content"):
+            raise ValueError(f"지원하지 않는 컬럼입니다: {column}")
+        try:
+            with self._connect() as conn:
+                cursor = conn.cursor()
+                expression = f"decompress_text({column})" if column in COMPRESSED_SUMMARY_COLUMNS else column
+                cursor.execute(f"SELECT {expression} FROM news_summaries WHERE id = ?", (summary_id,))
+                row = cursor.fetchone()
+                return row[0] if row else None
+        except Exception as e:
+            print(f"요약본 텍스트 조회 실패: {e}")
+            return None
+
+    def get_summary_status_by_urls(self, urls: List[str]) -> Dict[str, Dict]:
+        """URL 목록의 요약 여부를 한 번에 조회 - {url: {'id', 'created_at'}} (최신 요약본 기준)"""
+        if not urls:
+            return {}
+        try:
+            mapping = _lookup_map(urls)
+            candidates = list(mapping)
+            with self._connect() as conn:
+                cursor = conn.cursor()
+                rows = []
+                for start in range(0, len(candidates), 500):
+                    chunk = candidates[start:start + 500]
+                    placeholders = ",".join("?" * len(chunk))
+                    cursor.execute(f"""
+                        SELECT url, id, created_at FROM news_summaries
+                        WHERE url IN ({placeholders})
+                    """, chunk)
+                    rows.extend(cursor.fetchall())
+                result = {}
+                for url, summary_id, created_at in sorted(rows, key=lambda row: (row[2] or '', row[1])):
+                    for requested in mapping[url]:
+                        result[requested] = {'id': summary_id, 'created_at': created_at}
+                return result
+        except Exception as e:
+            print(f"요약 상태 일괄 조회 실패: {e}")
+            return {}
+
+    def get_news_by_url(self, url: str, with_content: bool = False) -> Optional[Dict]:
+        """URL로 기존 뉴스 요약본 조회 (정규화 URL과 원본 URL 모두 확인, 본문 content는 with_content=True일 때만)"""
+        try:
+            candidates = lookup_urls(url)
+            with self._connect() as conn:
+                cursor = conn.cursor()
+                cursor.execute(f"""
+                    SELECT {_projection("full" if with_content else "detail")} FROM news_summaries 
+                    WHERE url IN ({",".join("?" * len(candidates))})
+                    ORDER BY created_at DESC, id DESC
                     LIMIT 1
-                """, (url,))
+                """, candidates)
                 row = cursor.fetchone()
                 if row:
-                    columns = [description[0] for description in cursor.description]
-                    return dict(zip(columns, row))
+                    return NewsSummary.from_row(cursor, row)
                 return None
         except Exception as e:
             print(f"URL로 뉴스 조회 실패: {e}")
             return None
 
+    def get_news_by_urls(self, urls: List[str]) -> Dict[str, Dict]:
+        """URL 목록의 최신 요약본을 한 번에 조회 - {요청한 url: 요약본} (요약본이 없는 URL은 제외)"""
+        if not urls:
+            return {}
+        try:
+            mapping = _lookup_map(urls)
+            candidates = list(mapping)
+            with self._connect() as conn:
+                cursor = conn.cursor()
+                summaries = []
+                for start in range(0, len(candidates), 500):
+                    chunk = candidates[start:start + 500]
+                    placeholders = ",".join("?" * len(chunk))
+                    cursor.execute(f"""
+                        SELECT {_projection("detail")} FROM news_summaries
+                        WHERE url IN ({placeholders})
+                    """, chunk)
+                    summaries.extend(NewsSummary.from_row(cursor, row) for row in cursor.fetchall())
+                result = {}
+                for summary in sorted(summaries, key=lambda item: (item['created_at'] or '', item['id'])):
+                    for requested in mapping[summary['url']]:
+                        result[requested] = summary
+                return result
+        except Exception as e:
+            print(f"URL 목록으로 뉴스 조회 실패: {e}")
+            return {}
+
     def is_news_summarized(self, url: str) -> bool:
         """뉴스가 이미 요약되었는지 확인"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            candidates = lookup_urls(url)
+            with self._connect() as conn:
                 cursor = conn.cursor()
-                cursor.execute("""
+                cursor.execute(f"""
                     SELECT COUNT(*) FROM news_summaries 
-                    WHERE url = ?
-                """, (url,))
+                    WHERE url IN ({",".join("?" * len(candidates))})
+                """, candidates)
                 count = cursor.fetchone()[0]
                 return count > 0
         except Exception as e:
             print(f"뉴스 요약 상태 확인 실패: {e}")
             return False
 
-    def get_all_news_summaries(self) -> List[Dict]:
-        """모든 뉴스 요약본 조회"""
+    def save_content_fingerprint(self, url: str, signature: bytes, band_hashes: List[int]) -> bool:
+        """기사 본문 지문 및 LSH 버킷 저장 (URL은 정규화)"""
+        url = canonicalize_url(url) or url
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
-                    SELECT * FROM news_summaries 
-                    ORDER BY created_at DESC
-                """)
-                columns = [description[0] for description in cursor.description]
-                return [dict(zip(columns, row)) for row in cursor.fetchall()]
+                    INSERT OR REPLACE INTO content_fingerprints (url, signature, created_at)
+                    VALUES (?, ?, CURRENT_TIMESTAMP)
+                """, (url, signature))
+                cursor.execute("DELETE FROM fingerprint_lsh WHERE url = ?", (url,))
+                cursor.executemany("""
+                    INSERT OR IGNORE INTO fingerprint_lsh (band, bucket, url)
+                    VALUES (?, ?, ?)
+                """, [(band, bucket, url) for band, bucket in enumerate(band_hashes)])
+                conn.commit()
+                return True
         except Exception as e:
-            print(f"모든 뉴스 요약본 조회 실패: {e}")
+            print(f"기사 지문 저장 실패: {e}")
+            return False
+
+    def find_fingerprint_candidates(self, band_hashes: List[int]) -> List[Dict]:
+        """LSH 버킷이 하나 이상 겹치는 기사 지문 후보 조회"""
+        if not band_hashes:
             return []
+        try:
+            with self._connect() as conn:
+                cursor = conn.cursor()
+                conditions = " OR ".join(["(band = ? AND bucket = ?)"] * len(band_hashes))
+                params = [value for pair in enumerate(band_hashes) for value in pair]
+                cursor.execute(f"""
+                    SELECT url, signature FROM content_fingerprints
+                    WHERE url IN (SELECT url FROM fingerprint_lsh WHERE {conditions})
+                """, params)
+                return Record.from_cursor(cursor)
+        except Exception as e:
+            print(f"유사 기사 후보 조회 실패: {e}")
+            return []
+
+    def search(self, query: str, limit: int = 50, scope: str = "all") -> List[Dict]:
+        """수집 뉴스 제목 / 요약본 전문 검색 (관련도순, 스니펫 포함)
+
+        scope: "all", "scraped"(수집 뉴스), "summaries"(요약본)
+        """
+        terms = [term for term in (query or "").split() if term]
+        if not terms:
+            return []
+
+        match_expr = bigram_match_query(terms)
+        if not match_expr:
+            return []
+
+        targets = []
+        if scope in ("all", "scraped"):
+            targets.append(("scraped", "scraped_news_search", "scraped_news", "scraped_at"))
+        if scope in ("all", "summaries"):
+            targets.append(("summary", "news_summaries_search", "news_summaries", "created_at"))
+
+        try:
+            with self._connect() as conn:
+                cursor = conn.cursor()
+                results = []
+                for result_type, search_table, table, date_column in targets:
+                    # 요약본 인덱스는 원문을 저장하지 않으므로 스니펫은 조회한 요약 / 본문에서 만듦
+                    texts = (", t.summary AS summary_text, decompress_text(t.content) AS content_text"
+                             if result_type == "summary" else "")
+                    cursor.execute(f"""
+                        SELECT t.id, t.title, t.url, t.source_name, t.category,
+                               t.{date_column} AS created_at, hits.score AS rank{texts}
+                        FROM (
+                            SELECT rowid, bm25({search_table}) AS score FROM {search_table}
+                            WHERE {search_table} MATCH ?
+                            ORDER BY score
+                            LIMIT ?
+                        ) hits
+                        JOIN {table} t ON t.id = hits.rowid
+                        ORDER BY hits.score
+                    """, (match_expr, limit))
+                    hits = SearchHit.from_cursor(cursor)
+
+                    # bm25 점수는 테이블(문서 길이 / 문서 수)마다 척도가 다르므로 테이블별 최고 점수로 나눠 합침 (-1.0이 최고)
+                    best = abs(hits[0].rank) if hits and hits[0].rank else 1.0
+                    for item in hits:
+                        item.type = result_type
+                        item.rank = item.rank / best
+                        if result_type == "summary":
+                            text = " ".join(filter(None, [item.pop('summary_text'), item.pop('content_text')]))
+                            item.snippet = _snippet(text, terms) if text else item.title
+                        else:
+                            item.snippet = _snippet(item.title, terms)
+                        results.append(item)
+
+                results.sort(key=lambda item: item['rank'])
+                return results[:limit]
+        except Exception as e:
+            print(f"뉴스 검색 실패: {e}")
+            return []
+
+    def get_all_news_summaries(self, category=None, source_name=None, since: str = None,
+                               until: str = None, cursor: str = None, limit: int = None) -> List[Dict]:
+        """모든 뉴스 요약본 조회 (필터 / 커서 규칙은 get_scraped_news와 동일)"""
+        return self.get_news_summaries(category=category, source_name=source_name, since=since,
+                                       until=until, cursor=cursor, limit=limit)
 
     def get_news_summaries_by_category(self, category: str) -> List[Dict]:
         """카테고리별 뉴스 요약본 조회"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT * FROM news_summaries 
+                cursor.execute(f"""
+                    SELECT {_projection("full")} FROM news_summaries 
                     WHERE category = ?
                     ORDER BY created_at DESC
                 """, (category,))
-                columns = [description[0] for description in cursor.description]
-                return [dict(zip(columns, row)) for row in cursor.fetchall()]
+                return NewsSummary.from_cursor(cursor)
         except Exception as e:
             print(f"카테고리별 뉴스 요약본 조회 실패: {e}")
             return []
 
     def get_favorite_news(self) -> List[Dict]:
-        """관심 뉴스 목록 조회"""
+        """관심 뉴스 목록 조회 (목록용 프로젝션 - 요약/본문은 get_news_summary_text로 지연 로딩)"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT ns.*, fn.user_notes, fn.created_at as favorite_date
+                cursor.execute(f"""
+                    SELECT {_projection("list", "ns")}, fn.user_notes, fn.created_at as favorite_date
                     FROM news_summaries ns
                     JOIN favorite_news fn ON ns.id = fn.news_summary_id
                     ORDER BY fn.created_at DESC
                 """)
-                columns = [description[0] for description in cursor.description]
-                return [dict(zip(columns, row)) for row in cursor.fetchall()]
+                return FavoriteNews.from_cursor(cursor)
         except Exception as e:
             print(f"관심 뉴스 조회 실패: {e}")
             return []
@@ -350,7 +1842,7 @@ class NewsDatabase:
     def update_user_notes(self, news_summary_id: int, notes: str) -> bool:
         """사용자 메모 업데이트"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
                     UPDATE favorite_news SET user_notes = ? WHERE news_summary_id = ?
@@ -360,11 +1852,42 @@ class NewsDatabase:
         except Exception as e:
             print(f"사용자 메모 업데이트 실패: {e}")
             return False
+
+    def update_news_contents(self, contents: Dict[str, str]) -> int:
+        """URL별 기사 본문 일괄 갱신 (재추출 결과 반영용, 변경된 요약본 수 반환)"""
+        if not contents:
+            return 0
+        try:
+            with self._connect() as conn:
+                cursor = conn.cursor()
+                updated = 0
+                for url, content in contents.items():
+                    candidates = lookup_urls(url)
+                    cursor.execute(f"""
+                        SELECT id, title, summary, content FROM news_summaries
+                        WHERE url IN ({",".join("?" * len(candidates))})
+                    """, candidates)
+                    rows = cursor.fetchall()
+                    if not rows:
+                        continue
+                    # 검색 색인은 이전 본문으로 지우고 새 본문으로 다시 추가
+                    self._index_summaries(cursor, [(row_id, title, summary, self.compressor.decompress(stored))
+                                                   for row_id, title, summary, stored in rows], delete=True)
+                    cursor.executemany("UPDATE news_summaries SET content = ? WHERE id = ?",
+                                       [(self.compressor.compress(content), row[0]) for row in rows])
+                    self._index_summaries(cursor, [(row_id, title, summary, content)
+                                                   for row_id, title, summary, _ in rows])
+                    updated += len(rows)
+                conn.commit()
+                return updated
+        except Exception as e:
+            print(f"기사 본문 갱신 실패: {e}")
+            return 0
     
     def delete_news_source(self, source_name: str, category: str) -> bool:
         """뉴스 소스 삭제"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
                     DELETE FROM news_sources WHERE source_name = ? AND category = ?
@@ -378,7 +1901,7 @@ class NewsDatabase:
     def get_categories(self) -> List[str]:
         """등록된 카테고리 목록 조회"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute("SELECT DISTINCT category FROM news_sources ORDER BY category")
                 return [row[0] for row in cursor.fetchall()]
@@ -389,7 +1912,7 @@ class NewsDatabase:
     def get_sources_by_category(self, category: str) -> List[str]:
         """특정 카테고리의 뉴스 소스 목록 조회"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
                     SELECT DISTINCT source_name FROM news_sources WHERE category = ?
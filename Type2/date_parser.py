@@ -0,0 +1,98 @@
+"""
+기사 발행 시각 파싱 (ISO 8601, RFC 822, 한국어 날짜 표기, 'N시간 전' 같은 상대 표기)
+
+시간대가 없는 값은 한국 시간(KST)으로 보고, 결과는 SQLite CURRENT_TIMESTAMP와 같은
+'YYYY-MM-DD HH:MM:SS' 형식의 UTC 문자열로 통일합니다.
+"""
+import re
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+KST = timezone(timedelta(hours=9), 'KST')
+DB_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# 2024.05.01 14:32 / 2024-05-01 오후 2:32 / 2024년 5월 1일 14시 32분 / 2024/05/01(수) 14:32:10
+_KOREAN_DATE = re.compile(
+    r'(?P<year>(?:19|20)\d{2})\s*[.\-/년]\s*(?P<month>\d{1,2})\s*[.\-/월]\s*(?P<day>\d{1,2})\s*[.일]?'
+    r'(?:\s*\(\s*[월화수목금토일]\s*\))?'
+    r'(?:\s*(?P<meridiem>오전|오후|AM|PM|am|pm)?\s*(?P<hour>\d{1,2})\s*(?::|시)\s*(?:(?P<minute>\d{1,2})\s*분?)?'
+    r'(?:\s*:\s*(?P<second>\d{1,2}))?)?'
+)
+_RELATIVE = re.compile(r'(?P<amount>\d+)\s*(?P<unit>초|분|시간|일)\s*전')
+_RELATIVE_UNITS = {'초': 'seconds', '분': 'minutes', '시간': 'hours', '일': 'days'}
+# 기사 페이지의 '입력 2024.05.01 14:32' 같은 표기
+_LABEL = re.compile(r'(?:기사\s*입력|입력|등록|게재|발행|작성|송고)\s*(?:일시|시간)?\s*[:：]?\s*')
+
+
+def _to_db_time(value: datetime) -> str:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=KST)
+    return value.astimezone(timezone.utc).strftime(DB_TIME_FORMAT)
+
+
+def _from_match(match) -> Optional[datetime]:
+    hour = int(match.group('hour') or 0)
+    meridiem = (match.group('meridiem') or '').lower()
+    if meridiem in ('오후', 'pm') and hour < 12:
+        hour += 12
+    elif meridiem in ('오전', 'am') and hour == 12:
+        hour = 0
+    try:
+        return datetime(int(match.group('year')), int(match.group('month')), int(match.group('day')),
+                        hour, int(match.group('minute') or 0), int(match.group('second') or 0), tzinfo=KST)
+    except ValueError:
+        return None
+
+
+def parse_published(value: Optional[str], now: datetime = None) -> Optional[str]:
+    """발행 시각 문자열을 UTC 'YYYY-MM-DD HH:MM:SS'로 변환 (해석할 수 없거나 미래 시각이면 None)"""
+    if not value or not isinstance(value, str):
+        return None
+    value = value.strip()
+    now = now or datetime.now(timezone.utc)
+    parsed = None
+
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        pass
+    if parsed is None and re.match(r'^[A-Za-z]{3},', value):
+        try:
+            parsed = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            pass
+    if parsed is None:
+        match = _KOREAN_DATE.search(value)
+        if match:
+            parsed = _from_match(match)
+    if parsed is None:
+        match = _RELATIVE.search(value)
+        if match:
+            parsed = now - timedelta(**{_RELATIVE_UNITS[match.group('unit')]: int(match.group('amount'))})
+    if parsed is None:
+        return None
+
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=KST)
+    # 예약 기사 / 잘못된 표기로 인한 미래 시각은 버림 (시계 오차는 허용)
+    if parsed > now + timedelta(hours=1):
+        return None
+    return _to_db_time(parsed)
+
+
+def find_published(text: str, labeled_only: bool = False, now: datetime = None) -> Optional[str]:
+    """본문 텍스트에서 발행 시각 찾기 ('입력' 등 표시가 붙은 날짜 우선)
+
+    labeled_only: 표시가 붙은 날짜만 사용 (기사 본문 속 다른 날짜를 잘못 잡지 않도록)
+    """
+    if not text:
+        return None
+    for label in _LABEL.finditer(text):
+        published = parse_published(text[label.end():label.end() + 40], now)
+        if published:
+            return published
+    if labeled_only:
+        return None
+    match = _KOREAN_DATE.search(text) or _RELATIVE.search(text)
+    return parse_published(match.group(0), now) if match else None
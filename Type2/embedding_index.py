@@ -0,0 +1,177 @@
+"""
+뉴스 요약본 임베딩 저장소 및 유사 기사(관련 기사) 검색
+"""
+import os
+import re
+import threading
+import zlib
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+_NON_WORD_PATTERN = re.compile(r'[^\w가-힣]')
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (matrix / norms).astype(np.float32)
+
+
+class HashingEmbedder:
+    def __init__(self, dim: int = 512, ngram_range: Tuple[int, int] = (2, 3)):
+        """로컬 해싱 벡터라이저 (문자 n-gram, 부호 해싱, 로그 TF) - API 호출 없음"""
+        self.dim = dim
+        self.ngram_range = ngram_range
+        self.name = f"hashing{dim}"
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        low, high = self.ngram_range
+        for row, text in enumerate(texts):
+            normalized = _NON_WORD_PATTERN.sub('', text or '').lower()
+            for n in range(low, high + 1):
+                for i in range(len(normalized) - n + 1):
+                    h = zlib.crc32(normalized[i:i + n].encode('utf-8'))
+                    vectors[row, h % self.dim] += 1.0 if (h >> 31) & 1 else -1.0
+        vectors = np.sign(vectors) * np.log1p(np.abs(vectors))
+        return _normalize_rows(vectors)
+
+
+class OpenAIEmbedder:
+    def __init__(self, client, model: str = "text-embedding-3-small", dim: int = 1536):
+        """OpenAI 임베딩 API 사용 (client: openai.OpenAI 또는 같은 인터페이스의 대체 객체)"""
+        self.client = client
+        self.model = model
+        self.dim = dim
+        self.name = f"openai-{model}"
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        response = self.client.embeddings.create(model=self.model, input=[text or " " for text in texts])
+        vectors = np.array([item.embedding for item in response.data], dtype=np.float32)
+        return _normalize_rows(vectors)
+
+
+class VectorIndex:
+    def __init__(self, path: str, dim: int, count: int = 0, grow_step: int = 4096):
+        """float32 행렬을 메모리 맵 파일로 보관하는 벡터 저장소 (count: 유효한 행 수)
+
+        여러 스레드가 같은 인스턴스를 써도 되도록 매핑 교체 / 기록 / IVF 교체는 잠금 안에서 하고,
+        검색과 IVF 생성은 잠금 안에서 잡은 행렬 뷰로 잠금 밖에서 계산합니다.
+        """
+        self.path = path
+        self.dim = dim
+        self.count = count
+        self.grow_step = grow_step
+        self._lock = threading.RLock()
+        self._ivf_build_lock = threading.Lock()
+        self._matrix: Optional[np.memmap] = None
+        self._ivf_centroids: Optional[np.ndarray] = None
+        self._ivf_lists: List[np.ndarray] = []
+        self._ivf_count = 0
+
+    def _capacity(self) -> int:
+        return 0 if self._matrix is None else self._matrix.shape[0]
+
+    def _map(self, min_rows: int):
+        """필요한 행 수만큼 파일을 늘리고 다시 매핑 (self._lock을 잡은 상태에서 호출)"""
+        file_rows = os.path.getsize(self.path) // (self.dim * 4) if os.path.exists(self.path) else 0
+        if file_rows < min_rows:
+            file_rows = ((min_rows // self.grow_step) + 1) * self.grow_step
+            if self._matrix is not None:
+                self._matrix.flush()
+                self._matrix = None
+            with open(self.path, 'ab') as f:
+                f.truncate(file_rows * self.dim * 4)
+        if self._capacity() < file_rows:
+            self._matrix = np.memmap(self.path, dtype=np.float32, mode='r+', shape=(file_rows, self.dim))
+
+    def write(self, row: int, vector: np.ndarray):
+        """row 위치에 벡터 기록"""
+        with self._lock:
+            if self._capacity() <= row:
+                self._map(row + 1)
+            self._matrix[row] = vector
+            self._matrix.flush()
+            self.count = max(self.count, row + 1)
+
+    def update_count(self, count: int):
+        """다른 프로세스가 추가한 행 반영 (이 인스턴스가 기록한 행 수보다 줄이지는 않음)"""
+        with self._lock:
+            self.count = max(self.count, count)
+
+    def vector(self, row: int) -> np.ndarray:
+        with self._lock:
+            if self._capacity() <= row:
+                self._map(row + 1)
+            return np.array(self._matrix[row])
+
+    def _snapshot(self) -> Tuple[Optional[np.ndarray], int]:
+        """현재 유효한 행의 행렬 뷰와 행 수 (뷰는 다시 매핑되어도 이전 매핑을 계속 가리킴)"""
+        with self._lock:
+            count = self.count
+            if count == 0:
+                return None, 0
+            self._map(count)
+            return self._matrix[:count], count
+
+    def build_ivf(self, n_lists: int = None, iterations: int = 8, seed: int = 42):
+        """k-means로 벡터를 n_lists개 파티션으로 나누는 IVF 인덱스 생성"""
+        data, count = self._snapshot()
+        if count == 0:
+            return
+        n_lists = n_lists or max(1, int(np.sqrt(count)))
+        rng = np.random.RandomState(seed)
+        centroids = np.array(data[rng.choice(count, size=min(n_lists, count), replace=False)])
+        for _ in range(iterations):
+            assignment = np.argmax(data @ centroids.T, axis=1)
+            for c in range(len(centroids)):
+                members = data[assignment == c]
+                if len(members):
+                    centroids[c] = members.mean(axis=0)
+            centroids = _normalize_rows(centroids)
+        assignment = np.argmax(data @ centroids.T, axis=1)
+        lists = [np.flatnonzero(assignment == c) for c in range(len(centroids))]
+        with self._lock:
+            self._ivf_centroids, self._ivf_lists, self._ivf_count = centroids, lists, count
+
+    def ensure_ivf(self, min_rows: int = 20000, rebuild_ratio: float = 1.2):
+        """행 수가 min_rows 이상이면 IVF 생성, 생성 이후 rebuild_ratio배 이상 늘면 재생성 (한 스레드만 생성)"""
+        if self.count < min_rows:
+            return
+        with self._ivf_build_lock:
+            if self._ivf_centroids is None or self.count > self._ivf_count * rebuild_ratio:
+                self.build_ivf()
+
+    def search(self, query: np.ndarray, k: int = 5, nprobe: int = 8,
+               exclude: Optional[int] = None) -> List[Tuple[int, float]]:
+        """코사인 유사도 상위 k개 (행 번호, 점수) - IVF가 있으면 nprobe개 파티션만 탐색"""
+        with self._lock:
+            data, count = self._snapshot()
+            centroids, lists, ivf_count = self._ivf_centroids, self._ivf_lists, self._ivf_count
+        if count == 0:
+            return []
+
+        if centroids is not None:
+            probes = np.argsort(-(centroids @ query))[:nprobe]
+            candidates = np.concatenate([lists[p] for p in probes] +
+                                        [np.arange(ivf_count, count)])  # IVF 생성 이후 추가분
+            scores = data[candidates] @ query
+        else:
+            candidates = None
+            scores = data @ query
+
+        if exclude is not None:
+            if candidates is None:
+                if exclude < len(scores):
+                    scores[exclude] = -np.inf
+            else:
+                scores[candidates == exclude] = -np.inf
+
+        k = min(k, len(scores))
+        if k <= 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        rows = top if candidates is None else candidates[top]
+        return [(int(row), float(scores[i])) for row, i in zip(rows, top) if np.isfinite(scores[i])]
@@ -5,12 +5,17 @@ import openai
 import os
 from datetime import datetime
 from news_content_scraper import NewsContentScraper
+from database import NewsDatabase
+from content_fingerprint import SyndicationDetector
+from story_clustering import collapse_story_clusters
 
 class EnhancedNewsSummarizer:
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, db: NewsDatabase = None):
         self.api_key = api_key
         self.use_openai = False
         self.client = None
+        self.db = db if db is not None else NewsDatabase()
+        self.syndication_detector = SyndicationDetector(self.db)
         
         if api_key and api_key.strip():
             try:
@@ -38,14 +43,52 @@ class EnhancedNewsSummarizer:
         """뉴스 URL의 전체 내용을 스크래핑하고 상세하게 요약"""
         if not self.use_openai:
             return "❌ OpenAI API 키가 필요합니다. 왼쪽 사이드바에서 API 키를 입력해주세요."
-        
+
         try:
-            # 뉴스 내용 스크래핑
-            scraper = NewsContentScraper()
-            content_data = scraper.scrape_news_content(url)
-            
-            if not content_data or not content_data.get('content'):
-                return "❌ 뉴스 내용을 가져올 수 없습니다. URL을 확인해주세요."
+            content_data = self.fetch_article(url)
+        except Exception as e:
+            return f"❌ 뉴스 요약 중 오류가 발생했습니다: {str(e)}"
+        if not content_data:
+            return "❌ 뉴스 내용을 가져올 수 없습니다. URL을 확인해주세요."
+        return self.summarize_article(url, title, content_data)
+
+    def fetch_article(self, url: str):
+        """기사 본문 가져오기 (요약 전 단계)
+
+        수집 작업자나 이전 실행이 article_contents에 저장한 본문이 있으면 재사용하고,
+        없으면 스크래핑한 뒤 저장하여 요약 단계가 실패해도 다시 내려받지 않도록 합니다.
+        """
+        content_data = self.db.get_article_content(url)
+        if content_data and content_data.get('content'):
+            return content_data
+
+        scraper = NewsContentScraper(db=self.db)
+        content_data = scraper.scrape_news_content(url)
+        if not content_data or not content_data.get('content'):
+            return None
+        content_data.setdefault('url', url)
+        self.db.save_article_content(content_data)
+        return content_data
+
+    def summarize_article(self, url: str, title: str, content_data: dict):
+        """fetch_article로 가져온 본문을 상세하게 요약 (LLM 호출 단계)"""
+        if not self.use_openai:
+            return "❌ OpenAI API 키가 필요합니다. 왼쪽 사이드바에서 API 키를 입력해주세요."
+
+        try:
+            # 통신사 전재 등 거의 같은 본문이 이미 요약되어 있으면 LLM 호출 없이 재사용
+            duplicate = self.syndication_detector.find_summarized_duplicate(url, content_data['content'])
+            self.syndication_detector.remember(url, content_data['content'])
+            if duplicate:
+                return {
+                    'summary': duplicate['summary'],
+                    'full_content': content_data['content'],
+                    'title': content_data.get('title') or title,
+                    'url': url,
+                    'published_at': content_data.get('published_at'),
+                    'scraped_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                    'reused_from': duplicate['url']
+                }
             
             # 상세한 요약 프롬프트
             prompt = f"""
@@ -82,8 +125,9 @@ URL: {url}
             return {
                 'summary': summary,
                 'full_content': content_data['content'],
-                'title': content_data.get('title', title),
+                'title': content_data.get('title') or title,
                 'url': url,
+                'published_at': content_data.get('published_at'),
                 'scraped_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             }
             
@@ -99,12 +143,17 @@ URL: {url}
             return "❌ 분석할 뉴스 목록이 비어있습니다."
         
         try:
+            # 같은 사건을 다룬 기사(cluster_id 동일)는 대표 기사 하나로 묶어 중복 입력 방지
+            news_list = collapse_story_clusters(news_list)
+
             # 뉴스 목록 및 요약본 텍스트 구성
             news_context = ""
             for idx, news in enumerate(news_list, 1):
                 title = news.get('title', '제목 없음')
                 summary = news.get('summary', '요약 정보 없음')
                 news_context += f"기사 {idx}: {title}\n"
+                if news.get('cluster_size', 1) > 1:
+                    news_context += f"동일 사건 보도: {news['cluster_size']}건 ({', '.join(news['related_sources'])})\n"
                 news_context += f"요약 내용: {summary}\n"
                 news_context += "-" * 30 + "\n"
             
@@ -0,0 +1,127 @@
+"""
+HTML 파싱 전용 프로세스 풀
+
+BeautifulSoup 파싱과 셀렉터 탐색은 CPU 작업이라 스레드로 병렬 수집해도 GIL 때문에 한 코어에서 차례로 실행됩니다.
+원본 페이지(bytes)와 소스 정보만 작업자 프로세스로 넘기고 추출 결과(기사 목록 / 본문 dict)만 돌려받아
+파싱을 여러 코어로 나눕니다. 페이지는 bytes 그대로 넘기며, 수백 KB 페이지를 파이프로 보내는 비용은
+파싱 비용에 비해 작습니다.
+
+작업자 프로세스는 스레드가 많은 부모(Streamlit, 수집 스레드)를 fork하지 않도록 spawn으로 시작하며,
+풀을 쓸 수 없으면 현재 프로세스에서 바로 파싱합니다. 수집 작업자 프로세스를 여러 개 띄우면 프로세스마다
+풀이 생기므로 기본 크기는 MAX_DEFAULT_WORKERS개로 제한하고, crawl_worker.py --parse-workers로 바꿀 수 있습니다.
+"""
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Optional, Set, Tuple, Union
+
+from news_extractors import ListingPage, extract_article, extract_listing
+
+# 기본 작업자 프로세스 수 상한 (CPU가 더 많아도 프로세스마다 이 이상 만들지 않음)
+MAX_DEFAULT_WORKERS = 4
+
+
+def default_workers() -> int:
+    return min(MAX_DEFAULT_WORKERS, os.cpu_count() or 1)
+
+
+def _run_task(task: Tuple) -> Union[ListingPage, Optional[Dict]]:
+    """작업자 프로세스 진입점"""
+    kind, page, args = task
+    if kind == "listing":
+        return extract_listing(page, **args)
+    return extract_article(page, **args)
+
+
+class ExtractionPool:
+    def __init__(self, workers: int = None):
+        """workers: 작업자 프로세스 수 (기본값: CPU 수와 MAX_DEFAULT_WORKERS 중 작은 값, 0이면 현재 프로세스에서 파싱)"""
+        self.workers = default_workers() if workers is None else max(0, workers)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.stats = {'tasks': 0, 'inline': 0}
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers,
+                                                     mp_context=multiprocessing.get_context("spawn"))
+            return self._executor
+
+    def _run_inline(self, task: Tuple):
+        with self._lock:
+            self.stats['inline'] += 1
+        return _run_task(task)
+
+    def _fallback(self, task: Tuple, error: Exception):
+        """풀을 쓸 수 없을 때 현재 프로세스에서 추출 (작업자가 죽었으면 다음 작업 때 풀을 다시 만듦)"""
+        if isinstance(error, BrokenProcessPool):
+            with self._lock:
+                self._executor = None
+        print(f"⚠️ 파싱 프로세스 풀 사용 불가 - 현재 프로세스에서 파싱합니다: {error}")
+        return self._run_inline(task)
+
+    def _run(self, kind: str, page: Union[str, bytes], args: Dict):
+        """작업자 프로세스에서 추출하고 결과 반환
+
+        풀을 쓸 수 없으면(작업자 비정상 종료, 프로세스 생성 실패 등) 이번 작업은 현재 프로세스에서 추출합니다.
+        작업자에서 추출 함수가 던진 예외는 다시 파싱하지 않고 그대로 전달합니다.
+        """
+        if isinstance(page, str):
+            page = page.encode("utf-8")
+        task = (kind, page, args)
+        if self.workers == 0:
+            return self._run_inline(task)
+        try:
+            future = self._get_executor().submit(_run_task, task)
+        except (BrokenProcessPool, OSError, RuntimeError) as e:
+            # 제출 단계 오류: 풀이 깨졌거나 종료됨, 작업자 프로세스를 만들 수 없음
+            return self._fallback(task, e)
+        with self._lock:
+            self.stats['tasks'] += 1
+        try:
+            return future.result()
+        except BrokenProcessPool as e:
+            return self._fallback(task, e)
+
+    def extract_listing(self, page: Union[str, bytes], source: Dict, category: str, known_urls: Set[str] = None,
+                        **kwargs) -> ListingPage:
+        """news_extractors.extract_listing을 작업자 프로세스에서 실행"""
+        args = {'source': {key: source.get(key) for key in ('source_name', 'url')}, 'category': category,
+                'known_urls': known_urls, **kwargs}
+        return self._run("listing", page, args)
+
+    def extract_article(self, page: Union[str, bytes], url: str, **kwargs) -> Optional[Dict]:
+        """news_extractors.extract_article을 작업자 프로세스에서 실행"""
+        return self._run("article", page, {'url': url, **kwargs})
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+
+_default_pool: Optional[ExtractionPool] = None
+_default_lock = threading.Lock()
+
+
+def get_extraction_pool() -> ExtractionPool:
+    """프로세스 전체에서 공유하는 기본 파싱 풀"""
+    global _default_pool
+    with _default_lock:
+        if _default_pool is None:
+            _default_pool = ExtractionPool()
+        return _default_pool
+
+
+def configure_extraction_pool(workers: int) -> ExtractionPool:
+    """기본 파싱 풀의 작업자 수 변경 (스크래퍼를 만들기 전에 호출, 0이면 현재 프로세스에서 파싱)"""
+    global _default_pool
+    with _default_lock:
+        if _default_pool is not None:
+            _default_pool.shutdown()
+        _default_pool = ExtractionPool(workers)
+        return _default_pool
@@ -0,0 +1,100 @@
+"""
+RSS 2.0 / Atom / 뉴스 사이트맵(Google News sitemap) 파서
+
+iterparse로 항목 단위로 읽고 처리한 요소는 바로 비워서, 큰 사이트맵도 전체 트리를 만들지 않고 처리합니다.
+HTML 목록 페이지보다 가볍기 때문에 NewsScraper가 가장 먼저 시도합니다.
+"""
+import io
+import xml.etree.ElementTree as ET
+from typing import Dict, Optional, Set, Union
+
+from date_parser import parse_published
+from news_extractors import ListingPage
+from url_canonicalizer import canonicalize_url
+
+# 피드 종류별 항목 요소 (네임스페이스 제외한 이름)
+_ITEM_TAGS = {'item', 'entry', 'url'}
+_DATE_TAGS = ('pubDate', 'published', 'updated', 'publication_date', 'date', 'lastmod')
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit('}', 1)[-1]
+
+
+def _parse_item(element) -> Dict[str, str]:
+    """item / entry / url 요소에서 제목, 링크, 발행 시각 추출"""
+    fields = {}
+    for child in element.iter():
+        name = _local_name(child.tag)
+        text = (child.text or "").strip()
+        if name == 'title' and text and 'title' not in fields:
+            fields['title'] = text
+        elif name == 'link':
+            # Atom은 <link rel="alternate" href="..."/>, RSS는 <link>텍스트</link>
+            href = child.get('href')
+            if href and child.get('rel', 'alternate') == 'alternate':
+                fields.setdefault('url', href.strip())
+            elif text:
+                fields.setdefault('url', text)
+        elif name == 'loc' and text:
+            fields.setdefault('url', text)
+        elif name == 'guid' and text and child.get('isPermaLink', 'true') == 'true':
+            fields.setdefault('guid', text)
+        elif name in _DATE_TAGS and text:
+            fields.setdefault(name, text)
+    if 'url' not in fields and fields.get('guid', '').startswith('http'):
+        fields['url'] = fields['guid']
+    fields['published'] = next((fields[name] for name in _DATE_TAGS if name in fields), None)
+    return fields
+
+
+def parse_feed(data: Union[str, bytes], source: Dict, category: str, max_items: int = 50,
+               known_urls: Set[str] = None, verbose: bool = True) -> Optional[ListingPage]:
+    """피드 / 사이트맵 XML에서 기사 목록 추출 (XML이 아니거나 항목이 없으면 None)
+
+    extract_listing과 같은 형식의 ListingPage를 반환하며, known_urls에 있는 기사는 결과에서 제외합니다.
+    항목에 발행 시각이 있으면 UTC로 변환하여 'published_at'으로 함께 반환합니다.
+    """
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+
+    news_list = []
+    seen_urls = []
+    processed_urls = set()
+    known_count = 0
+    base = source.get('feed_url') or source.get('url')
+    try:
+        for _, element in ET.iterparse(io.BytesIO(data), events=('end',)):
+            if _local_name(element.tag) not in _ITEM_TAGS:
+                continue
+            fields = _parse_item(element)
+            element.clear()
+
+            url = canonicalize_url(fields.get('url'), base)
+            title = fields.get('title')
+            if not url or not title or url in processed_urls:
+                continue
+            processed_urls.add(url)
+            seen_urls.append(url)
+            if known_urls is not None and url in known_urls:
+                known_count += 1
+                continue
+            if len(news_list) < max_items:
+                news_list.append({
+                    'title': title,
+                    'url': url,
+                    'category': category,
+                    'source_name': source['source_name'],
+                    'published_at': parse_published(fields['published']),
+                })
+    except ET.ParseError as e:
+        if verbose:
+            print(f"❌ 피드 파싱 실패: {e}")
+        return None
+
+    if not seen_urls:
+        return None
+    if verbose:
+        print(f"✅ 피드에서 {len(news_list)}개 뉴스 수집 완료" +
+              (f" (기존 기사 {known_count}개 건너뜀)" if known_count else ""))
+    return ListingPage(news_list, seen_urls, known_count)
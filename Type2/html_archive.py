@@ -0,0 +1,306 @@
+"""
+수집한 원본 HTML 보관소 (WARC 형식 레코드를 압축한 세그먼트 파일 + 오프셋 인덱스)
+
+레코드마다 독립된 압축 블롭(text_compression.TextCompressor: 코덱 / 사전 ID 헤더 + zstd 또는 zlib)으로
+기록하므로 인덱스의 (세그먼트, 오프셋, 길이)만으로 해당 레코드를 바로 읽을 수 있습니다.
+같은 언론사 페이지는 머리말 / 메뉴 / 스크립트가 거의 같으므로, 보관된 HTML로 학습한 사전(train_dictionary)을
+쓰면 레코드 단위 압축률이 크게 올라갑니다. 사전은 index.db에 저장되어 다른 프로세스도 함께 씁니다.
+이전 형식(레코드마다 gzip 멤버, .warc.gz) 세그먼트도 그대로 읽습니다.
+"""
+import gzip
+import os
+import sqlite3
+import threading
+import uuid
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from news_records import Record
+from text_compression import TextCompressor, train_dictionary
+
+DEFAULT_ARCHIVE_DIR = "html_archive"
+
+# 사전 학습 샘플 수 / 사전 크기 (zlib은 32KB까지만 사용)
+ARCHIVE_DICTIONARY_MIN_SAMPLES = 20
+ARCHIVE_DICTIONARY_SIZE = 112 * 1024
+
+_GZIP_MAGIC = b"\x1f\x8b"
+
+# 응답 본문은 이미 디코딩된 상태로 보관하므로 전송 관련 헤더는 제외
+_SKIPPED_HEADERS = {'content-encoding', 'transfer-encoding', 'content-length', 'connection'}
+
+
+def _build_record(url: str, body: bytes, status_code: int, headers: Dict[str, str],
+                  extra_fields: Dict[str, str]) -> bytes:
+    """WARC response 레코드 바이트 생성 (HTTP 상태줄 + 헤더 + 본문)"""
+    http_lines = [f"HTTP/1.1 {status_code}"]
+    for name, value in (headers or {}).items():
+        if name.lower() not in _SKIPPED_HEADERS:
+            http_lines.append(f"{name}: {value}")
+    http_lines.append(f"Content-Length: {len(body)}")
+    block = ("\r\n".join(http_lines) + "\r\n\r\n").encode('utf-8') + body
+
+    warc_lines = [
+        "WARC/1.1",
+        "WARC-Type: response",
+        f"WARC-Record-ID: <urn:uuid:{uuid.uuid4()}>",
+        f"WARC-Date: {datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')}",
+        f"WARC-Target-URI: {url}",
+        "Content-Type: application/http; msgtype=response",
+    ]
+    warc_lines.extend(f"{name}: {value}" for name, value in extra_fields.items() if value)
+    warc_lines.append(f"Content-Length: {len(block)}")
+    return ("\r\n".join(warc_lines) + "\r\n\r\n").encode('utf-8') + block + b"\r\n\r\n"
+
+
+def _parse_headers(raw: bytes) -> Dict[str, str]:
+    headers = {}
+    for line in raw.decode('utf-8', errors='replace').split("\r\n")[1:]:
+        name, _, value = line.partition(":")
+        if name:
+            headers[name.strip()] = value.strip()
+    return headers
+
+
+def _load_dictionary(index_path: str, dictionary_id: int) -> Optional[Tuple[int, bytes]]:
+    with sqlite3.connect(index_path) as conn:
+        row = conn.execute("SELECT codec, data FROM archive_dictionaries WHERE id = ?", (dictionary_id,)).fetchone()
+        return (row[0], row[1]) if row else None
+
+
+_compressors: Dict[str, TextCompressor] = {}
+_compressors_lock = threading.Lock()
+
+
+def get_archive_compressor(root: str) -> TextCompressor:
+    """보관소(root)별로 프로세스 안에서 공유하는 압축기 (사전은 index.db에서 필요할 때 읽음)"""
+    key = os.path.abspath(root)
+    with _compressors_lock:
+        compressor = _compressors.get(key)
+        if compressor is None:
+            index_path = os.path.join(root, "index.db")
+            compressor = TextCompressor(
+                dictionary_loader=lambda dictionary_id: _load_dictionary(index_path, dictionary_id))
+            _compressors[key] = compressor
+        return compressor
+
+
+def read_record(root: str, segment: str, offset: int, length: int) -> Dict:
+    """세그먼트 파일의 한 레코드를 읽어 {'url', 'status_code', 'headers', 'warc_headers', 'body'} 반환
+
+    인덱스 없이 경로/오프셋만으로 동작하므로 다른 프로세스(재추출 작업자)에서도 호출할 수 있습니다.
+    """
+    with open(os.path.join(root, segment), 'rb') as f:
+        f.seek(offset)
+        data = f.read(length)
+    if data.startswith(_GZIP_MAGIC):
+        data = gzip.decompress(data)  # 이전 형식 세그먼트
+    else:
+        data = get_archive_compressor(root).decompress_bytes(data)
+
+    warc_head, _, rest = data.partition(b"\r\n\r\n")
+    warc_headers = _parse_headers(warc_head)
+    block = rest[:int(warc_headers.get('Content-Length', len(rest)))]
+    http_head, _, body = block.partition(b"\r\n\r\n")
+    status_line = http_head.split(b"\r\n", 1)[0].decode('ascii', errors='replace')
+    return {
+        'url': warc_headers.get('WARC-Target-URI'),
+        'status_code': int(status_line.split()[1]) if len(status_line.split()) > 1 else None,
+        'headers': _parse_headers(http_head),
+        'warc_headers': warc_headers,
+        'body': body,
+    }
+
+
+class HtmlArchive:
+    def __init__(self, root: str = DEFAULT_ARCHIVE_DIR, max_segment_bytes: int = 64 * 1024 * 1024):
+        """원본 HTML 보관소 초기화 (root 아래에 세그먼트 파일과 index.db 생성)"""
+        self.root = root
+        self.max_segment_bytes = max_segment_bytes
+        self.index_path = os.path.join(root, "index.db")
+        self._lock = threading.Lock()
+        self._segment_name: Optional[str] = None
+        self._segment_file = None
+        self._segment_count = 0
+        os.makedirs(root, exist_ok=True)
+        self.compressor = get_archive_compressor(root)
+        self._init_index()
+
+    def _init_index(self):
+        with sqlite3.connect(self.index_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS archive_records (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    url TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    source_name TEXT,
+                    category TEXT,
+                    status_code INTEGER,
+                    segment TEXT NOT NULL,
+                    offset INTEGER NOT NULL,
+                    length INTEGER NOT NULL,
+                    fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_archive_records_url ON archive_records (url, id)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_archive_records_kind ON archive_records (kind, id)")
+
+            # 레코드 압축 사전 (압축 블롭 헤더의 사전 ID로 참조)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS archive_dictionaries (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    codec INTEGER NOT NULL,
+                    data BLOB NOT NULL,
+                    sample_count INTEGER,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            cursor.execute("""
+                SELECT id, codec, data FROM archive_dictionaries
+                WHERE codec = ? ORDER BY id DESC LIMIT 1
+            """, (self.compressor.codec,))
+            row = cursor.fetchone()
+            if row:
+                self.compressor.add_dictionary(*row)
+            conn.commit()
+
+    def _open_segment(self, incoming: int):
+        """현재 세그먼트가 없거나 max_segment_bytes를 넘으면 새 세그먼트 파일 생성"""
+        if self._segment_file is not None and self._segment_file.tell() + incoming <= self.max_segment_bytes:
+            return
+        if self._segment_file is not None:
+            self._segment_file.close()
+        self._segment_count += 1
+        # 여러 프로세스가 같은 보관소에 써도 섞이지 않도록 PID를 이름에 포함
+        timestamp = datetime.now(timezone.utc).strftime('%Y%m%d-%H%M%S')
+        self._segment_name = f"segment-{timestamp}-{os.getpid()}-{self._segment_count:04d}.warc.cmp"
+        self._segment_file = open(os.path.join(self.root, self._segment_name), 'ab')
+
+    def put(self, url: str, body: bytes, kind: str, source_name: str = None, category: str = None,
+            status_code: int = 200, headers: Dict[str, str] = None) -> Optional[int]:
+        """응답 하나를 보관하고 인덱스 레코드 ID 반환 (kind: 'listing' 또는 'article')"""
+        try:
+            record = self.compressor.compress_bytes(_build_record(url, body, status_code, headers, {
+                'WARC-News-Kind': kind,
+                'WARC-News-Source': source_name,
+                'WARC-News-Category': category,
+            }))
+            with self._lock:
+                self._open_segment(len(record))
+                offset = self._segment_file.tell()
+                self._segment_file.write(record)
+                self._segment_file.flush()
+                segment = self._segment_name
+
+            with sqlite3.connect(self.index_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    INSERT INTO archive_records (url, kind, source_name, category, status_code, segment, offset, length)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """, (url, kind, source_name, category, status_code, segment, offset, len(record)))
+                conn.commit()
+                return cursor.lastrowid
+        except Exception as e:
+            print(f"원본 HTML 보관 실패: {e}")
+            return None
+
+    def put_response(self, response, kind: str, source_name: str = None, category: str = None,
+                     url: str = None) -> Optional[int]:
+        """requests 응답 객체 보관 (HTTP 캐시에서 꺼낸 응답은 이미 보관되어 있으므로 건너뜀)"""
+        if getattr(response, 'from_cache', False):
+            return None
+        return self.put(url or response.url, response.content, kind, source_name, category,
+                        response.status_code, dict(response.headers))
+
+    def entries(self, kind: str = None, latest_only: bool = True, since: str = None) -> List[Dict]:
+        """인덱스 레코드 목록 (latest_only: URL별 가장 최근 레코드만)"""
+        conditions = []
+        params = []
+        if kind:
+            conditions.append("kind = ?")
+            params.append(kind)
+        if since:
+            conditions.append("fetched_at >= ?")
+            params.append(since)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        if latest_only:
+            query = f"""
+                SELECT * FROM archive_records WHERE id IN (
+                    SELECT MAX(id) FROM archive_records {where} GROUP BY url, kind
+                ) ORDER BY id
+            """
+        else:
+            query = f"SELECT * FROM archive_records {where} ORDER BY id"
+
+        with sqlite3.connect(self.index_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            return Record.from_cursor(cursor)
+
+    def get(self, record_id: int) -> Optional[Dict]:
+        """레코드 ID로 보관된 응답 조회"""
+        with sqlite3.connect(self.index_path) as conn:
+            row = conn.execute("SELECT segment, offset, length FROM archive_records WHERE id = ?",
+                               (record_id,)).fetchone()
+        return read_record(self.root, *row) if row else None
+
+    def get_latest(self, url: str, kind: str = None) -> Optional[Dict]:
+        """URL의 가장 최근 보관 응답 조회"""
+        query = "SELECT segment, offset, length FROM archive_records WHERE url = ?"
+        params = [url]
+        if kind:
+            query += " AND kind = ?"
+            params.append(kind)
+        with sqlite3.connect(self.index_path) as conn:
+            row = conn.execute(query + " ORDER BY id DESC LIMIT 1", params).fetchone()
+        return read_record(self.root, *row) if row else None
+
+    def iter_records(self, kind: str = None, latest_only: bool = True) -> Iterator[Dict]:
+        """보관된 응답을 인덱스 순서대로 읽기 (인덱스 정보 + 본문)"""
+        for entry in self.entries(kind, latest_only):
+            record = read_record(self.root, entry['segment'], entry['offset'], entry['length'])
+            record.update(entry)
+            yield record
+
+    def train_dictionary(self, sample_limit: int = 500,
+                         min_samples: int = ARCHIVE_DICTIONARY_MIN_SAMPLES) -> Optional[int]:
+        """최근 보관된 레코드로 압축 사전 학습 (사전 ID 반환, 이후 보관하는 레코드부터 사용)
+
+        세그먼트 파일은 추가 전용이므로 이미 보관된 레코드는 다시 압축하지 않습니다.
+        (maintenance.py --train-archive-dictionary)
+        """
+        try:
+            with sqlite3.connect(self.index_path) as conn:
+                rows = conn.execute("SELECT segment, offset, length FROM archive_records ORDER BY id DESC LIMIT ?",
+                                    (sample_limit,)).fetchall()
+            samples = []
+            for segment, offset, length in rows:
+                record = read_record(self.root, segment, offset, length)
+                if record['body']:
+                    samples.append(record['body'])
+            if len(samples) < min_samples:
+                print(f"ℹ️ 보관소 압축 사전 학습에 필요한 레코드가 부족합니다 ({len(samples)}/{min_samples}개)")
+                return None
+
+            codec = self.compressor.codec
+            data = train_dictionary(samples, codec, ARCHIVE_DICTIONARY_SIZE)
+            if not data:
+                return None
+            with sqlite3.connect(self.index_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute("INSERT INTO archive_dictionaries (codec, data, sample_count) VALUES (?, ?, ?)",
+                               (codec, data, len(samples)))
+                dictionary_id = cursor.lastrowid
+                conn.commit()
+            self.compressor.add_dictionary(dictionary_id, codec, data)
+            return dictionary_id
+        except Exception as e:
+            print(f"보관소 압축 사전 학습 실패: {e}")
+            return None
+
+    def close(self):
+        with self._lock:
+            if self._segment_file is not None:
+                self._segment_file.close()
+                self._segment_file = None
@@ -0,0 +1,392 @@
+"""
+스크래퍼 세션용 HTTP 응답 캐시 (SQLite 디스크 저장소, Cache-Control / Expires 준수, LRU 용량 제한)
+
+캐시는 속도를 위한 보조 수단이므로, 캐시 파일 오류(잠김 등)는 출력만 하고 네트워크 요청으로 대신합니다.
+"""
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from collections import Counter
+from contextlib import closing
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from circuit_breaker import CircuitBreakerRegistry, CircuitOpenError
+from politeness import PolitenessScheduler
+
+DEFAULT_CACHE_PATH = "http_cache.db"
+
+# 본문은 디코딩된 상태로 저장하므로 전송 관련 헤더는 제외
+_SKIPPED_HEADERS = {'content-encoding', 'transfer-encoding', 'content-length', 'connection'}
+
+_COUNTERS = ('hits', 'misses', 'revalidated', 'stored', 'evicted')
+
+
+def _parse_cache_control(value: Optional[str]) -> Dict[str, Optional[str]]:
+    directives = {}
+    for part in (value or "").split(","):
+        name, _, argument = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = argument.strip('"') or None
+    return directives
+
+
+def _http_date(value: Optional[str]) -> Optional[float]:
+    try:
+        return parsedate_to_datetime(value).timestamp() if value else None
+    except (TypeError, ValueError):
+        return None
+
+
+def freshness_lifetime(headers, now: float = None) -> Tuple[Optional[float], bool]:
+    """응답 헤더 기준 신선도 유지 시간(초)과 저장 가능 여부
+
+    Cache-Control max-age가 Expires보다 우선하며, no-store / private이면 저장하지 않고
+    no-cache면 저장하되 매번 재검증(신선도 0)합니다.
+    서버가 신선도를 지정하지 않았으면(캐시 헤더 없음) 유지 시간은 None입니다.
+    """
+    now = now or time.time()
+    directives = _parse_cache_control(headers.get('Cache-Control'))
+    # 캐시 파일은 여러 작업자 프로세스가 공유하므로 private 응답도 저장하지 않음
+    if 'no-store' in directives or 'private' in directives:
+        return 0.0, False
+    if 'no-cache' in directives:
+        return 0.0, True
+    if directives.get('max-age') is not None:
+        try:
+            return max(0.0, float(directives['max-age'])), True
+        except ValueError:
+            return 0.0, True
+    expires = _http_date(headers.get('Expires'))
+    if expires is not None:
+        date = _http_date(headers.get('Date')) or now
+        return max(0.0, expires - date), True
+    if headers.get('Expires') is not None:
+        return 0.0, True  # 해석할 수 없는 Expires는 이미 만료된 것으로 봄
+    return None, True
+
+
+class HttpCacheStore:
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, max_bytes: int = 256 * 1024 * 1024,
+                 timeout: float = 1.0, flush_every: int = 100, flush_interval: float = 30.0):
+        """캐시 저장소 초기화 (max_bytes: 본문 압축 크기 합계 상한, 넘으면 오래 안 쓴 항목부터 삭제)
+
+        timeout: 캐시 파일 잠금 대기 시간(초) - 넘으면 캐시 없이 네트워크로 요청
+        flush_every / flush_interval: 적중 시 LRU 접근 시각과 통계는 메모리에 모았다가
+        이 건수가 쌓이거나 이 시간(초)이 지나면 한 번에 기록
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._pending_access: Dict[str, float] = {}
+        self._pending_counts: Counter = Counter()
+        self._last_flush = time.monotonic()
+        self._total_bytes = 0
+        try:
+            self.init_store()
+            with closing(self._connect()) as conn:
+                self._total_bytes = conn.execute("SELECT COALESCE(SUM(size), 0) FROM http_cache").fetchone()[0]
+        except sqlite3.Error as e:
+            print(f"HTTP 캐시 초기화 실패 (캐시 없이 요청): {e}")
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=self.timeout)
+
+    def init_store(self):
+        with closing(self._connect()) as conn:
+            cursor = conn.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS http_cache (
+                    url TEXT PRIMARY KEY,
+                    status_code INTEGER NOT NULL,
+                    headers TEXT NOT NULL,
+                    body BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    stored_at REAL NOT NULL,
+                    fresh_until REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )
+            """)
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_http_cache_access ON http_cache (last_access)")
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS http_cache_stats (
+                    name TEXT PRIMARY KEY,
+                    value INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            conn.commit()
+
+    def get(self, url: str) -> Optional[Dict]:
+        """캐시 항목 조회 (읽기만 하고, LRU 접근 시각은 모아 두었다가 flush에서 기록 / 오류 시 None)"""
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute("SELECT status_code, headers, body, fresh_until FROM http_cache WHERE url = ?",
+                                   (url,)).fetchone()
+            if row is None:
+                return None
+            cached = {
+                'status_code': row[0],
+                'headers': json.loads(row[1]),
+                'body': zlib.decompress(row[2]),
+                'fresh_until': row[3],
+            }
+        except (sqlite3.Error, ValueError, zlib.error) as e:
+            print(f"HTTP 캐시 조회 실패: {e}")
+            return None
+        with self._lock:
+            self._pending_access[url] = time.time()
+        return cached
+
+    def put(self, url: str, status_code: int, headers: Dict[str, str], body: bytes, fresh_until: float):
+        """응답 저장 후 용량 상한을 넘으면 LRU 삭제"""
+        compressed = zlib.compress(body, 6)
+        stored_headers = {k: v for k, v in headers.items() if k.lower() not in _SKIPPED_HEADERS}
+        now = time.time()
+        try:
+            with self._lock, closing(self._connect()) as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT size FROM http_cache WHERE url = ?", (url,))
+                previous = cursor.fetchone()
+                cursor.execute("""
+                    INSERT OR REPLACE INTO http_cache (url, status_code, headers, body, size, stored_at, fresh_until, last_access)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """, (url, status_code, json.dumps(stored_headers), compressed, len(compressed), now, fresh_until, now))
+                self._increment(cursor, 'stored')
+                # 이미 쓰기 트랜잭션을 열었으므로 모아 둔 접근 시각 / 통계도 함께 기록
+                self._write_pending(cursor)
+                total_bytes = self._total_bytes + len(compressed) - (previous[0] if previous else 0)
+                if total_bytes > self.max_bytes:
+                    total_bytes = self._evict(cursor, total_bytes)
+                conn.commit()
+                self._total_bytes = total_bytes
+                self._pending_access.clear()
+                self._pending_counts.clear()
+                self._last_flush = time.monotonic()
+        except sqlite3.Error as e:
+            print(f"HTTP 캐시 저장 실패: {e}")
+
+    def refresh(self, url: str, headers: Dict[str, str], fresh_until: float):
+        """304 재검증 응답으로 신선도와 헤더 갱신"""
+        try:
+            with closing(self._connect()) as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT headers FROM http_cache WHERE url = ?", (url,))
+                row = cursor.fetchone()
+                if row is None:
+                    return
+                merged = json.loads(row[0])
+                merged.update({k: v for k, v in headers.items() if k.lower() not in _SKIPPED_HEADERS})
+                cursor.execute("UPDATE http_cache SET headers = ?, fresh_until = ?, last_access = ? WHERE url = ?",
+                               (json.dumps(merged), fresh_until, time.time(), url))
+                conn.commit()
+        except (sqlite3.Error, ValueError) as e:
+            print(f"HTTP 캐시 갱신 실패: {e}")
+
+    def _evict(self, cursor, total_bytes: int) -> int:
+        """전체 크기가 상한의 90% 이하가 될 때까지 오래 안 쓴 항목 삭제 (삭제 후 전체 크기 반환)"""
+        target = self.max_bytes * 0.9
+        cursor.execute("SELECT url, size FROM http_cache ORDER BY last_access")
+        victims = []
+        for url, size in cursor.fetchall():
+            if total_bytes <= target:
+                break
+            victims.append((url,))
+            total_bytes -= size
+        cursor.executemany("DELETE FROM http_cache WHERE url = ?", victims)
+        self._increment(cursor, 'evicted', len(victims))
+        return total_bytes
+
+    @staticmethod
+    def _increment(cursor, name: str, amount: int = 1):
+        cursor.execute("""
+            INSERT INTO http_cache_stats (name, value) VALUES (?, ?)
+            ON CONFLICT(name) DO UPDATE SET value = value + excluded.value
+        """, (name, amount))
+
+    def _write_pending(self, cursor):
+        """모아 둔 접근 시각 / 통계 기록 (self._lock을 잡은 상태에서 호출)"""
+        cursor.executemany("UPDATE http_cache SET last_access = MAX(last_access, ?) WHERE url = ?",
+                           [(accessed, url) for url, accessed in self._pending_access.items()])
+        for name, amount in self._pending_counts.items():
+            self._increment(cursor, name, amount)
+
+    def record(self, name: str):
+        """적중 / 실패 / 재검증 횟수 누적 (메모리에 모았다가 일정 건수 / 시간마다 기록)"""
+        with self._lock:
+            self._pending_counts[name] += 1
+            due = (sum(self._pending_counts.values()) >= self.flush_every or
+                   time.monotonic() - self._last_flush >= self.flush_interval)
+        if due:
+            self.flush()
+
+    def flush(self):
+        """모아 둔 LRU 접근 시각과 통계를 한 트랜잭션으로 기록 (실패하면 다음 기회에 다시 시도)"""
+        with self._lock:
+            if not self._pending_access and not self._pending_counts:
+                return
+            try:
+                with closing(self._connect()) as conn:
+                    self._write_pending(conn.cursor())
+                    conn.commit()
+            except sqlite3.Error as e:
+                print(f"HTTP 캐시 통계 기록 실패: {e}")
+                return
+            finally:
+                self._last_flush = time.monotonic()
+            self._pending_access.clear()
+            self._pending_counts.clear()
+
+    def stats(self) -> Dict:
+        """누적 캐시 통계 (적중률 포함)"""
+        self.flush()
+        try:
+            with closing(self._connect()) as conn:
+                counters = dict(conn.execute("SELECT name, value FROM http_cache_stats").fetchall())
+                entries, size = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM http_cache").fetchone()
+        except sqlite3.Error as e:
+            print(f"HTTP 캐시 통계 조회 실패: {e}")
+            counters, entries, size = {}, 0, 0
+        stats = {name: counters.get(name, 0) for name in _COUNTERS}
+        lookups = stats['hits'] + stats['revalidated'] + stats['misses']
+        stats['hit_ratio'] = (stats['hits'] + stats['revalidated']) / lookups if lookups else 0.0
+        stats['entries'] = entries
+        stats['bytes'] = size
+        return stats
+
+
+class CachingAdapter(HTTPAdapter):
+    def __init__(self, store: HttpCacheStore, min_freshness: Dict[str, float] = None,
+                 default_min_freshness: float = 0, scheduler: PolitenessScheduler = None,
+                 breakers: CircuitBreakerRegistry = None, **kwargs):
+        """GET 응답을 캐시하는 전송 어댑터
+
+        min_freshness: 호스트별 최소 신선도(초) - 지정한 호스트만 서버 헤더보다 우선 (no-store / private 응답도 재사용)
+        default_min_freshness: min_freshness에 없는 호스트에서 서버가 신선도를 지정하지 않은 응답(캐시 헤더 없음)의
+        신선도 - max-age / no-cache / Expires / no-store / private가 있으면 서버 헤더를 따름
+        scheduler: 캐시 적중이 아닌 실제 네트워크 요청에 적용할 호스트별 요청 조절기
+        breakers: 호스트별 회로 차단기 - 열려 있으면 네트워크 요청 없이 CircuitOpenError 발생
+        """
+        super().__init__(**kwargs)
+        self.store = store
+        self.scheduler = scheduler
+        self.breakers = breakers
+        self.min_freshness = {host.lower(): seconds for host, seconds in (min_freshness or {}).items()}
+        self.default_min_freshness = default_min_freshness
+        self.counters = {name: 0 for name in _COUNTERS}
+        self._counters_lock = threading.Lock()
+
+    def _min_freshness(self, url: str, lifetime: Optional[float], storable: bool) -> float:
+        host = (urlsplit(url).hostname or "").lower()
+        if host in self.min_freshness:
+            return self.min_freshness[host]
+        return self.default_min_freshness if storable and lifetime is None else 0.0
+
+    def _count(self, name: str):
+        with self._counters_lock:
+            self.counters[name] += 1
+        self.store.record(name)
+
+    def _cached_response(self, request, cached: Dict) -> requests.Response:
+        response = requests.Response()
+        response.status_code = cached['status_code']
+        response.headers = CaseInsensitiveDict(cached['headers'])
+        response._content = cached['body']
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        response.reason = "OK"
+        response.connection = self
+        response.from_cache = True
+        return response
+
+    def send(self, request, **kwargs):
+        if request.method != "GET":
+            return super().send(request, **kwargs)
+
+        url = request.url
+        now = time.time()
+        cached = self.store.get(url)
+        if cached and cached['fresh_until'] > now:
+            self._count('hits')
+            return self._cached_response(request, cached)
+
+        if cached:
+            # 만료된 항목은 검증자(ETag / Last-Modified)로 조건부 요청
+            headers = CaseInsensitiveDict(cached['headers'])
+            if headers.get('ETag'):
+                request.headers['If-None-Match'] = headers['ETag']
+            if headers.get('Last-Modified'):
+                request.headers['If-Modified-Since'] = headers['Last-Modified']
+
+        response = self._send_network(request, **kwargs)
+        if cached and response.status_code == 304:
+            # 304 응답에 캐시 헤더가 없으면 저장해 둔 응답의 헤더 기준
+            lifetime, storable = freshness_lifetime(CaseInsensitiveDict({**cached['headers'], **response.headers}), now)
+            min_freshness = self._min_freshness(url, lifetime, storable)
+            self.store.refresh(url, dict(response.headers), now + max(lifetime or 0.0, min_freshness))
+            self._count('revalidated')
+            cached['headers'].update({k: v for k, v in response.headers.items() if k.lower() not in _SKIPPED_HEADERS})
+            return self._cached_response(request, cached)
+
+        self._count('misses')
+        response.from_cache = False
+        if response.status_code == 200:
+            lifetime, storable = freshness_lifetime(response.headers, now)
+            min_freshness = self._min_freshness(url, lifetime, storable)
+            has_validator = 'ETag' in response.headers or 'Last-Modified' in response.headers
+            if min_freshness > 0 or (storable and ((lifetime or 0.0) > 0 or has_validator)):
+                self.store.put(url, response.status_code, dict(response.headers), response.content,
+                               now + max(lifetime or 0.0, min_freshness))
+        return response
+
+    def _send_network(self, request, **kwargs) -> requests.Response:
+        """회로 차단기 / 요청 조절기를 거쳐 실제 네트워크 요청 (5xx와 연결 오류만 호스트 실패로 집계)"""
+        url = request.url
+        if self.breakers and not self.breakers.allow(url):
+            raise CircuitOpenError(f"{urlsplit(url).hostname} 접속 실패가 반복되어 요청을 잠시 중단했습니다.",
+                                   request=request)
+        try:
+            if self.scheduler:
+                response = self.scheduler.request(url, lambda: super(CachingAdapter, self).send(request, **kwargs))
+            else:
+                response = super().send(request, **kwargs)
+        except Exception:
+            if self.breakers:
+                self.breakers.record_failure(url)
+            raise
+        if self.breakers:
+            if response.status_code >= 500:
+                self.breakers.record_failure(url)
+            else:
+                self.breakers.record_success(url)
+        return response
+
+    def stats(self) -> Dict:
+        """이 어댑터(세션)에서의 적중 통계"""
+        with self._counters_lock:
+            counters = dict(self.counters)
+        lookups = counters['hits'] + counters['revalidated'] + counters['misses']
+        hit_ratio = (counters['hits'] + counters['revalidated']) / lookups if lookups else 0.0
+        return dict(counters, hit_ratio=hit_ratio)
+
+
+def install_cache(session: requests.Session, store: HttpCacheStore = None, min_freshness: Dict[str, float] = None,
+                  default_min_freshness: float = 0, scheduler: PolitenessScheduler = None,
+                  breakers: CircuitBreakerRegistry = None) -> CachingAdapter:
+    """세션의 http / https 전송 어댑터를 캐시 어댑터로 교체"""
+    adapter = CachingAdapter(store or HttpCacheStore(), min_freshness, default_min_freshness, scheduler, breakers)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return adapter
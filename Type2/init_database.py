@@ -27,10 +27,11 @@ def init_default_sources():
         for company in media_companies:
             name = company['name']
             categories = company['categories']
+            feeds = company.get('feeds', {})
             
             for category, url in categories.items():
                 try:
-                    success = db.add_news_source(name, category, url)
+                    success = db.add_news_source(name, category, url, feeds.get(category))
                     if success:
                         added_count += 1
                         print(f"✅ {name} - {category} 추가됨")
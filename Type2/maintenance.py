@@ -0,0 +1,67 @@
+"""
+DB 유지보수 작업 (저장 경로에서 자동으로 실행하지 않는 무거운 작업)
+
+사용 예:
+    python maintenance.py --stats                        # 본문 압축 통계
+    python maintenance.py --train-dictionary             # 최근 본문으로 압축 사전 학습 후 기존 본문 재압축
+    python maintenance.py --recompress                   # 현재 사전으로 압축되지 않은 본문만 재압축
+    python maintenance.py --rebuild-search               # 검색 색인 재생성 (DB를 직접 수정한 뒤 등)
+    python maintenance.py --index-embeddings             # 아직 임베딩되지 않은 요약본 임베딩 (관련 기사 검색용)
+    python maintenance.py --train-archive-dictionary     # 보관된 원본 HTML로 보관소 압축 사전 학습 (이후 보관분부터 사용)
+"""
+import argparse
+
+from database import DICTIONARY_TRAIN_MIN_SAMPLES, NewsDatabase
+from html_archive import ARCHIVE_DICTIONARY_MIN_SAMPLES, DEFAULT_ARCHIVE_DIR, HtmlArchive
+
+
+def print_storage_stats(db: NewsDatabase):
+    stats = db.get_storage_stats()
+    if stats:
+        print(f"📦 본문 {stats['content_rows']}건: 원본 {stats['raw_bytes']:,}바이트 → 저장 {stats['stored_bytes']:,}바이트 "
+              f"({stats['ratio']:.2f}배, 사전 ID {stats['dictionary_id'] or '없음'})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DB 유지보수 작업")
+    parser.add_argument("--db", default="news_assistant.db", help="DB 파일 경로")
+    parser.add_argument("--train-dictionary", action="store_true", help="압축 사전 학습 후 기존 본문 재압축")
+    parser.add_argument("--min-samples", type=int, default=DICTIONARY_TRAIN_MIN_SAMPLES,
+                        help="압축 사전 학습에 필요한 최소 본문 수")
+    parser.add_argument("--recompress", action="store_true", help="현재 사전으로 압축되지 않은 본문 재압축")
+    parser.add_argument("--rebuild-search", action="store_true", help="검색 색인 재생성")
+    parser.add_argument("--index-embeddings", action="store_true", help="아직 임베딩되지 않은 요약본 임베딩")
+    parser.add_argument("--train-archive-dictionary", action="store_true", help="원본 HTML 보관소 압축 사전 학습")
+    parser.add_argument("--archive", default=DEFAULT_ARCHIVE_DIR, help="원본 HTML 보관소 경로")
+    parser.add_argument("--stats", action="store_true", help="본문 압축 통계 출력")
+    args = parser.parse_args()
+
+    db = NewsDatabase(args.db)
+    if args.train_dictionary:
+        dictionary_id = db.train_compression_dictionary(min_samples=args.min_samples)
+        if dictionary_id:
+            print(f"📚 압축 사전 #{dictionary_id} 학습 완료")
+            args.recompress = True
+        else:
+            print("ℹ️ 압축 사전을 만들지 못했습니다.")
+    if args.recompress:
+        print(f"🗜️ 본문 {db.recompress_contents()}건 재압축")
+    if args.rebuild_search:
+        print(f"🔎 {db.rebuild_search_index()}건 검색 색인 재생성")
+    if args.index_embeddings:
+        print(f"🧭 요약본 {db.index_summary_embeddings()}건 임베딩")
+    if args.train_archive_dictionary:
+        archive = HtmlArchive(args.archive)
+        dictionary_id = archive.train_dictionary(min_samples=min(args.min_samples, ARCHIVE_DICTIONARY_MIN_SAMPLES))
+        archive.close()
+        if dictionary_id:
+            print(f"📚 보관소 압축 사전 #{dictionary_id} 학습 완료")
+        else:
+            print("ℹ️ 보관소 압축 사전을 만들지 못했습니다.")
+    if args.stats or not (args.train_dictionary or args.recompress or args.rebuild_search or args.index_embeddings
+                          or args.train_archive_dictionary):
+        print_storage_stats(db)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,18 +2,44 @@
 뉴스 URL의 전체 내용을 스크래핑하는 모듈
 """
 import requests
-from bs4 import BeautifulSoup
 import time
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.common.by import By
-import re
+from html_archive import HtmlArchive
+from circuit_breaker import CircuitBreakerRegistry, get_breakers
+from extraction_pool import ExtractionPool, get_extraction_pool
+from http_cache import HttpCacheStore, install_cache
+from politeness import PolitenessScheduler, get_scheduler
+from news_extractors import extract_title, clean_text
+from url_canonicalizer import canonicalize_url
+
+# 캐시 헤더 없이 오는 기사 페이지를 다시 내려받지 않고 재사용하는 시간(초) - 기사는 게시 후 거의 바뀌지 않음
+ARTICLE_DEFAULT_MIN_FRESHNESS = 3600
 
 class NewsContentScraper:
-    def __init__(self):
+    def __init__(self, archive: HtmlArchive = None, http_cache: HttpCacheStore = None, min_freshness=None,
+                 scheduler: PolitenessScheduler = None, breakers: CircuitBreakerRegistry = None, db=None,
+                 extraction_pool: ExtractionPool = None,
+                 default_min_freshness: float = ARTICLE_DEFAULT_MIN_FRESHNESS):
+        """db: 실패 URL 기록(네거티브 캐시)을 저장할 NewsDatabase (없으면 기록하지 않음)
+        archive: 원본 HTML 보관소 (기본값은 html_archive/, False이면 보관하지 않음)
+        http_cache: HTTP 응답 캐시 저장소 (기본값은 http_cache.db)
+        min_freshness: 서버 캐시 헤더 대신 쓸 호스트별 최소 신선도(초) {'www.khan.co.kr': 3600, ...} (기본값은 서버 헤더 준수)
+        default_min_freshness: 서버가 캐시 헤더를 보내지 않은 응답의 신선도(초) (no-store / private 등 헤더가 있으면 따름)
+        scheduler: 호스트별 요청 조절기 (기본값은 프로세스 공용 스케줄러)
+        breakers: 호스트별 회로 차단기 (기본값은 프로세스 공용 차단기)
+        extraction_pool: 기사 본문 파싱 프로세스 풀 (기본값은 프로세스 공용 풀)
+        """
+        self.db = db
+        self.archive = HtmlArchive() if archive is None else archive
         self.session = requests.Session()
+        self.scheduler = scheduler or get_scheduler()
+        self.breakers = breakers or get_breakers()
+        self.extraction_pool = extraction_pool or get_extraction_pool()
+        self.http_cache = install_cache(self.session, http_cache, min_freshness, default_min_freshness,
+                                        scheduler=self.scheduler, breakers=self.breakers)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -26,99 +52,52 @@ class NewsContentScraper:
     def scrape_news_content(self, url):
         """뉴스 URL의 전체 내용을 스크래핑"""
         try:
+            url = canonicalize_url(url) or url
+            failure = self.db.get_url_failure(url) if self.db else None
+            if failure:
+                print(f"⛔ 최근 추출에 실패한 URL이라 {failure['retry_at']}(UTC)까지 건너뜁니다: {url}")
+                return None
             print(f"📰 뉴스 내용 스크래핑 시작: {url}")
-            
-            # 1단계: requests + BeautifulSoup 시도
-            content = self._scrape_with_requests(url)
-            if content:
-                return content
-            
-            # 2단계: Selenium 시도
-            content = self._scrape_with_selenium(url)
-            if content:
-                return content
-            
-            return None
+            return self.extract_content(url, self.fetch_page(url))
             
         except Exception as e:
             print(f"❌ 뉴스 내용 스크래핑 실패: {e}")
             return None
-    
-    def _scrape_with_requests(self, url):
-        """requests를 사용한 뉴스 내용 스크래핑"""
+
+    def extract_content(self, url, page):
+        """fetch_page로 내려받은 페이지에서 본문 추출
+
+        추출하지 못하면 Selenium으로 다시 시도하고, 결과에 따라 실패 URL 기록을 갱신합니다.
+        """
+        # 1단계: requests로 받은 페이지 파싱 (작업자 프로세스에서)
+        content = None
+        if page is not None:
+            content = self.extraction_pool.extract_article(page, url)
+            if content:
+                content['method'] = 'requests'
+
+        # 2단계: Selenium 시도 (호스트 회로가 열렸으면 브라우저도 띄우지 않음)
+        if not content and self.breakers.available(url):
+            content = self._scrape_with_selenium(url)
+
+        if self.db:
+            if content:
+                self.db.clear_url_failure(url)
+            elif self.breakers.available(url):
+                # 호스트 장애(회로 열림)는 URL 문제가 아니므로 기록하지 않음
+                self.db.record_url_failure(url, "본문 추출 실패")
+        return content or None
+
+    def fetch_page(self, url):
+        """requests로 기사 페이지 원본 HTML 내려받기 (파싱하지 않음, 실패하면 None)"""
         try:
             print(f"📡 requests로 {url} 접속 중...")
             response = self.session.get(url, timeout=15)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # 사이트별 최적화된 셀렉터
-            content_selectors = {
-                '한국일보': [
-                    '.news-content', '.article-content', '.content',
-                    'article .text', '.news-text', '.article-text'
-                ],
-                '연합뉴스': [
-                    '.news-con', '.article-content', '.content',
-                    'article .text', '.news-text', '.article-text'
-                ],
-                'ZDNet': [
-                    '.newsPost .content', '.article-content', '.content',
-                    'article .text', '.news-text', '.article-text'
-                ],
-                '조선일보': [
-                    '.story-content', '.article-content', '.content',
-                    'article .text', '.news-text', '.article-text'
-                ],
-                '중앙일보': [
-                    '.story-content', '.article-content', '.content',
-                    'article .text', '.news-text', '.article-text'
-                ]
-            }
-            
-            # 일반적인 뉴스 내용 셀렉터
-            general_selectors = [
-                'article', '.article-content', '.news-content', '.content',
-                '.story-content', '.post-content', '.entry-content',
-                '[class*="article"]', '[class*="content"]', '[class*="story"]',
-                'main', '.main-content', '.text-content'
-            ]
-            
-            # 모든 셀렉터 시도
-            all_selectors = []
-            for site_selectors in content_selectors.values():
-                all_selectors.extend(site_selectors)
-            all_selectors.extend(general_selectors)
-            
-            content_text = ""
-            
-            for selector in all_selectors:
-                try:
-                    elements = soup.select(selector)
-                    if elements:
-                        for element in elements:
-                            text = element.get_text(strip=True)
-                            if len(text) > 100:  # 충분한 길이의 텍스트만
-                                content_text = text
-                                print(f"✅ 뉴스 내용 발견 (셀렉터: {selector}): {len(text)}자")
-                                break
-                        if content_text:
-                            break
-                except Exception as e:
-                    continue
-            
-            if content_text:
-                # 텍스트 정리
-                content_text = self._clean_text(content_text)
-                return {
-                    'title': self._extract_title(soup),
-                    'content': content_text,
-                    'url': url,
-                    'method': 'requests'
-                }
-            
-            return None
+            if self.archive:
+                self.archive.put_response(response, 'article', url=url)
+            return response.content
             
         except Exception as e:
             print(f"❌ requests 스크래핑 실패: {e}")
@@ -152,93 +131,39 @@ class NewsContentScraper:
                     return None
             
             try:
-                driver.get(url)
+                # 브라우저 요청도 같은 호스트별 한도 적용 (상태 코드를 알 수 없으므로 로드 성공을 정상 응답으로 집계)
+                with self.scheduler.slot(url) as outcome:
+                    try:
+                        driver.get(url)
+                    except Exception:
+                        self.breakers.record_failure(url)
+                        raise
+                    outcome['status'] = 200
                 time.sleep(5)  # JS 렌더링 대기
                 print(f"✅ 페이지 로드 완료: {url}")
                 
-                # 뉴스 내용 셀렉터들
-                content_selectors = [
-                    'article', '.article-content', '.news-content', '.content',
-                    '.story-content', '.post-content', '.entry-content',
-                    '[class*="article"]', '[class*="content"]', '[class*="story"]',
-                    'main', '.main-content', '.text-content'
-                ]
-                
-                content_text = ""
-                title = ""
-                
-                for selector in content_selectors:
-                    try:
-                        elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                        if elements:
-                            for element in elements:
-                                text = element.text.strip()
-                                if len(text) > 100:  # 충분한 길이의 텍스트만
-                                    content_text = text
-                                    print(f"✅ 뉴스 내용 발견 (셀렉터: {selector}): {len(text)}자")
-                                    break
-                            if content_text:
-                                break
-                    except Exception as e:
-                        continue
-                
-                # 제목 추출
-                try:
-                    title_element = driver.find_element(By.TAG_NAME, 'h1')
-                    title = title_element.text.strip()
-                except:
-                    try:
-                        title_element = driver.find_element(By.CSS_SELECTOR, '.title, .headline, h1, h2')
-                        title = title_element.text.strip()
-                    except:
-                        title = "제목을 찾을 수 없습니다."
-                
-                if content_text:
-                    # 텍스트 정리
-                    content_text = self._clean_text(content_text)
-                    return {
-                        'title': title,
-                        'content': content_text,
-                        'url': url,
-                        'method': 'selenium'
-                    }
-                
-                return None
-                
+                # 요소마다 WebDriver를 호출하지 않도록 렌더링된 HTML을 한 번에 받아 requests 경로와 같은 추출기로 파싱
+                html = driver.page_source
+
             finally:
                 driver.quit()
                 print("🔚 WebDriver 종료")
-                
+
+            if self.archive:
+                self.archive.put(url, html.encode('utf-8'), 'article')
+            content = self.extraction_pool.extract_article(html, url)
+            if content:
+                content['method'] = 'selenium'
+            return content
+
         except Exception as e:
             print(f"❌ Selenium 스크래핑 실패: {e}")
             return None
     
     def _extract_title(self, soup):
         """BeautifulSoup에서 제목 추출"""
-        try:
-            # 다양한 제목 셀렉터 시도
-            title_selectors = [
-                'h1', '.title', '.headline', '.article-title', '.news-title',
-                'title', '.post-title', '.entry-title'
-            ]
-            
-            for selector in title_selectors:
-                element = soup.select_one(selector)
-                if element:
-                    title = element.get_text(strip=True)
-                    if title and len(title) > 5:
-                        return title
-            
-            return "제목을 찾을 수 없습니다."
-        except:
-            return "제목을 찾을 수 없습니다."
+        return extract_title(soup)
     
     def _clean_text(self, text):
         """텍스트 정리"""
-        # 불필요한 공백 제거
-        text = re.sub(r'\s+', ' ', text)
-        # 특수 문자 정리
-        text = re.sub(r'[^\w\s가-힣.,!?]', '', text)
-        # 연속된 줄바꿈 제거
-        text = re.sub(r'\n+', '\n', text)
-        return text.strip()
+        return clean_text(text)
@@ -0,0 +1,248 @@
+"""
+HTML에서 뉴스 목록 / 기사 본문을 추출하는 순수 함수 (네트워크 접근 없음)
+
+실시간 스크래핑과 보관된 HTML 재추출(reextract.py)이 같은 추출 로직을 사용합니다.
+"""
+import re
+from typing import Dict, List, Optional, Set, Union
+
+from bs4 import BeautifulSoup
+
+from date_parser import find_published, parse_published
+from structured_data import extract_structured_data
+from url_canonicalizer import canonicalize_url
+
+# 목록 페이지 뉴스 링크 셀렉터
+LISTING_SELECTORS = [
+    'a[href*="/News/"]', 'a[href*="/news/"]', 'a[href*="/article/"]',
+    'a[href*="/story/"]', 'a[href*="/view/"]', 'a[href*="/read/"]',
+    '.news-item a', '.article-item a', 'article a',
+    '.list-item a', '.item a', '[class*="news"] a',
+    '[class*="article"] a', '[class*="story"] a',
+    'h1 a', 'h2 a', 'h3 a', 'h4 a'
+]
+
+# 사이트별 최적화된 목록 셀렉터 (Selenium 렌더링 페이지용, 없으면 LISTING_SELECTORS)
+LISTING_SITE_SELECTORS = {
+    '연합뉴스': ['ul > li strong a', 'ul > li a', '.news-con a', 'article a'],
+    'ZDNet': ['.newsPost a', '.newsPost h3 a', 'article a'],
+    '한국일보': ['.news-item a', 'article a', '.list-item a'],
+    '조선일보': ['.story-item a', 'article a', '.list-item a'],
+    '중앙일보': ['.story-item a', 'article a', '.list-item a'],
+}
+
+# 사이트별 최적화된 본문 셀렉터
+CONTENT_SELECTORS = {
+    '한국일보': [
+        '.news-content', '.article-content', '.content',
+        'article .text', '.news-text', '.article-text'
+    ],
+    '연합뉴스': [
+        '.news-con', '.article-content', '.content',
+        'article .text', '.news-text', '.article-text'
+    ],
+    'ZDNet': [
+        '.newsPost .content', '.article-content', '.content',
+        'article .text', '.news-text', '.article-text'
+    ],
+    '조선일보': [
+        '.story-content', '.article-content', '.content',
+        'article .text', '.news-text', '.article-text'
+    ],
+    '중앙일보': [
+        '.story-content', '.article-content', '.content',
+        'article .text', '.news-text', '.article-text'
+    ]
+}
+
+# 일반적인 뉴스 본문 셀렉터
+GENERAL_CONTENT_SELECTORS = [
+    'article', '.article-content', '.news-content', '.content',
+    '.story-content', '.post-content', '.entry-content',
+    '[class*="article"]', '[class*="content"]', '[class*="story"]',
+    'main', '.main-content', '.text-content'
+]
+
+TITLE_SELECTORS = [
+    'h1', '.title', '.headline', '.article-title', '.news-title',
+    'title', '.post-title', '.entry-title'
+]
+
+NO_TITLE = "제목을 찾을 수 없습니다."
+
+
+class ListingPage(list):
+    """목록 페이지 추출 결과 (새 기사 list) + 이미 알고 있던 기사 정보"""
+
+    def __init__(self, items=(), seen_urls: List[str] = None, known_count: int = 0, stopped_early: bool = False):
+        super().__init__(items)
+        self.seen_urls = seen_urls or []  # 페이지에서 확인한 모든 기사 URL (새 기사 + 기존 기사, 페이지 순서)
+        self.known_count = known_count
+        self.stopped_early = stopped_early
+
+
+def extract_listing(html: Union[str, bytes], source: Dict, category: str,
+                    max_items: int = 15, verbose: bool = True,
+                    known_urls: Set[str] = None, stop_after_known: int = 3,
+                    selectors: List[str] = None) -> ListingPage:
+    """뉴스 목록 페이지 HTML에서 기사 링크 추출 (첫 번째로 결과가 나온 셀렉터 사용)
+
+    selectors: 시도할 셀렉터 목록 (기본값: LISTING_SELECTORS)
+    known_urls: 이전 수집에서 본 URL - 결과에서 제외하고, 최신순 목록에서 연속으로
+    stop_after_known개를 만나면 이후 링크는 이미 수집한 기사로 보고 탐색을 멈춥니다.
+    (상단 고정 기사 때문에 첫 번째 기존 기사에서 바로 멈추지는 않음)
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    news_list = []
+    processed_urls = set()
+    seen_urls = []
+    known_count = 0
+    stopped_early = False
+    selectors = selectors or LISTING_SELECTORS
+
+    if verbose:
+        print(f"🔍 {len(selectors)}개 셀렉터로 뉴스 검색 중...")
+
+    for i, selector in enumerate(selectors):
+        try:
+            links = soup.select(selector)
+            if verbose:
+                print(f"셀렉터 {i+1}/{len(selectors)}: '{selector}' -> {len(links)}개 링크 발견")
+
+            consecutive_known = 0
+            for link in links[:20]:  # 최대 20개까지
+                try:
+                    # URL 정규화 (목록 페이지 기준 절대 URL, 추적 파라미터 제거)
+                    href = canonicalize_url(link.get('href'), source['url'])
+                    if not href:
+                        continue
+
+                    if href in processed_urls:
+                        continue
+                    processed_urls.add(href)
+
+                    # 제목 추출
+                    title = link.get_text(strip=True)
+                    if not title:
+                        title_elem = link.find(['h1', 'h2', 'h3', 'h4', 'span', 'div', 'strong'])
+                        if title_elem:
+                            title = title_elem.get_text(strip=True)
+
+                    if title and len(title) > 5:
+                        seen_urls.append(href)
+                        if known_urls is not None and href in known_urls:
+                            known_count += 1
+                            consecutive_known += 1
+                            if consecutive_known >= stop_after_known:
+                                stopped_early = True
+                                break
+                            continue
+                        consecutive_known = 0
+                        # 목록 항목 주변에 표시된 날짜 (예: '2024.05.01 14:32', '3시간 전')
+                        context = link.parent.get_text(' ', strip=True)[:300] if link.parent else title
+                        news_list.append({
+                            'title': title,
+                            'url': href,
+                            'category': category,
+                            'source_name': source['source_name'],
+                            'published_at': find_published(context)
+                        })
+                        if verbose:
+                            print(f"📰 뉴스 추가: {title[:50]}...")
+
+                        if len(news_list) >= max_items:
+                            break
+                except Exception:
+                    continue
+
+            if seen_urls:
+                if verbose:
+                    print(f"✅ {len(news_list)}개 뉴스 수집 완료" +
+                          (f" (기존 기사 {known_count}개 건너뜀)" if known_count else ""))
+                break
+
+        except Exception as e:
+            if verbose:
+                print(f"셀렉터 {selector} 처리 중 오류: {e}")
+            continue
+
+    return ListingPage(news_list, seen_urls, known_count, stopped_early)
+
+
+def extract_article(html: Union[str, bytes], url: str, verbose: bool = True) -> Optional[Dict]:
+    """기사 페이지 HTML에서 제목 / 본문 / 발행 시각(UTC) / 기자 추출 (본문을 찾지 못하면 None)
+
+    JSON-LD articleBody가 있으면 DOM을 파싱하지 않고 바로 사용하고,
+    없을 때만 셀렉터로 본문을 찾습니다. (제목 / 발행 시각 / 기자는 구조화 데이터 우선)
+    """
+    structured = extract_structured_data(html)
+    article = {
+        'url': url,
+        'published_at': parse_published(structured['published']),
+        'authors': structured['authors'],
+    }
+    if structured['content'] and len(structured['content']) > 100:
+        if verbose:
+            print(f"✅ 뉴스 내용 발견 (JSON-LD): {len(structured['content'])}자")
+        article.update(title=structured['title'] or NO_TITLE, content=clean_text(structured['content']),
+                       extraction='json-ld')
+        return article
+
+    soup = BeautifulSoup(html, 'html.parser')
+
+    # 모든 셀렉터 시도
+    all_selectors = []
+    for site_selectors in CONTENT_SELECTORS.values():
+        all_selectors.extend(site_selectors)
+    all_selectors.extend(GENERAL_CONTENT_SELECTORS)
+
+    content_text = ""
+    for selector in all_selectors:
+        try:
+            for element in soup.select(selector):
+                text = element.get_text(strip=True)
+                if len(text) > 100:  # 충분한 길이의 텍스트만
+                    content_text = text
+                    if verbose:
+                        print(f"✅ 뉴스 내용 발견 (셀렉터: {selector}): {len(text)}자")
+                    break
+            if content_text:
+                break
+        except Exception:
+            continue
+
+    if not content_text:
+        return None
+
+    if not article['published_at']:
+        time_element = soup.select_one('time[datetime]')
+        article['published_at'] = (parse_published(time_element['datetime']) if time_element else None) or \
+            find_published(soup.get_text(' ', strip=True), labeled_only=True)
+    article.update(title=structured['title'] or extract_title(soup), content=clean_text(content_text),
+                   extraction='dom')
+    return article
+
+
+def extract_title(soup: BeautifulSoup) -> str:
+    """BeautifulSoup에서 제목 추출"""
+    try:
+        for selector in TITLE_SELECTORS:
+            element = soup.select_one(selector)
+            if element:
+                title = element.get_text(strip=True)
+                if title and len(title) > 5:
+                    return title
+        return NO_TITLE
+    except Exception:
+        return NO_TITLE
+
+
+def clean_text(text: str) -> str:
+    """텍스트 정리"""
+    # 불필요한 공백 제거
+    text = re.sub(r'\s+', ' ', text)
+    # 특수 문자 정리
+    text = re.sub(r'[^\w\s가-힣.,!?]', '', text)
+    # 연속된 줄바꿈 제거
+    text = re.sub(r'\n+', '\n', text)
+    return text.strip()
@@ -0,0 +1,167 @@
+"""
+DB 조회 결과 행 객체 (__slots__ 기반, dict와 같은 방식으로 접근 가능)
+"""
+from collections.abc import MutableMapping
+from typing import Any, Callable, Dict, Iterator, List, Sequence, Tuple
+
+# (레코드 클래스, 컬럼 튜플)별로 만든 행 변환 함수
+_makers: Dict[Tuple[type, Tuple[str, ...]], Callable[[Sequence], 'Record']] = {}
+
+
+class Record(MutableMapping):
+    """__slots__ 기반 행 객체
+
+    dict를 행마다 만드는 대신 컬럼을 슬롯에 저장하여 메모리와 생성 비용을 줄입니다.
+    news['url'], news.get('summary'), news['is_summarized'] = True 처럼 기존 dict 코드와 호환되며,
+    슬롯에 없는 키(유사도, 스니펫 등)는 _extra에 보관합니다.
+    조회하지 않은 컬럼은 키 목록에 나타나지 않습니다.
+    """
+    __slots__ = ('_extra',)
+    fields: Tuple[str, ...] = ()
+    _field_set: frozenset = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        own = tuple(name for name in cls.__dict__.get('__slots__', ()) if name != '_extra')
+        cls.fields = cls.fields + own
+        cls._field_set = frozenset(cls.fields)
+
+    def __init__(self, **values):
+        self._extra = None
+        for key, value in values.items():
+            self[key] = value
+
+    @classmethod
+    def _maker(cls, columns: Tuple[str, ...]) -> Callable[[Sequence], 'Record']:
+        """컬럼 튜플에 맞춘 행 변환 함수 (컬럼별 __setitem__ 대신 슬롯에 바로 대입, 컬럼 튜플마다 한 번만 생성)
+
+        namedtuple / dataclasses처럼 코드를 생성합니다. 슬롯 컬럼은 `record.<이름> = 값`으로 대입하고,
+        슬롯에 없는 컬럼만 _extra에 넣습니다. 컬럼 이름은 생성 코드에 넣지 않고 변수로 넘깁니다.
+        """
+        maker = _makers.get((cls, columns))
+        if maker is not None:
+            return maker
+
+        namespace = {'new': cls.__new__, 'cls': cls}
+        values = [f"v{i}" for i in range(len(columns))]
+        body = [f"record = new(cls)", f"{', '.join(values)}, = row" if columns else "pass"]
+        extra = []
+        for i, column in enumerate(columns):
+            if column in cls._field_set:
+                body.append(f"record.{column} = v{i}")
+            else:
+                namespace[f"k{i}"] = column
+                extra.append(f"k{i}: v{i}")
+        body.append(f"record._extra = {{{', '.join(extra)}}}" if extra else "record._extra = None")
+        body.append("return record")
+        exec("def make(row):\n    " + "\n    ".join(body), namespace)
+        maker = _makers[(cls, columns)] = namespace['make']
+        return maker
+
+    @classmethod
+    def _make(cls, columns: Tuple[str, ...], row: Sequence) -> 'Record':
+        return cls._maker(columns)(row)
+
+    @classmethod
+    def from_row(cls, cursor, row: Sequence) -> 'Record':
+        """cursor.fetchone() 결과 한 행을 레코드로 변환"""
+        return cls._make(tuple(d[0] for d in cursor.description), row)
+
+    @classmethod
+    def from_cursor(cls, cursor) -> List['Record']:
+        """cursor의 남은 모든 행을 레코드 목록으로 변환"""
+        make = cls._maker(tuple(d[0] for d in cursor.description))
+        return [make(row) for row in cursor.fetchall()]
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._field_set:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                pass
+        elif self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any):
+        if key in self._field_set:
+            setattr(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key: str):
+        if key in self._field_set:
+            try:
+                delattr(self, key)
+                return
+            except AttributeError:
+                pass
+        elif self._extra is not None and key in self._extra:
+            del self._extra[key]
+            return
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        for name in self.fields:
+            if hasattr(self, name):
+                yield name
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __contains__(self, key) -> bool:
+        if key in self._field_set:
+            return hasattr(self, key)
+        return self._extra is not None and key in self._extra
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self._field_set:
+            return getattr(self, key, default)
+        if self._extra is not None:
+            return self._extra.get(key, default)
+        return default
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self.items())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+    def __getstate__(self):
+        return self.to_dict()
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self._extra = None
+        for key, value in state.items():
+            self[key] = value
+
+
+class NewsSource(Record):
+    """news_sources 행"""
+    __slots__ = ('source_name', 'category', 'url', 'feed_url', 'created_at', 'updated_at')
+
+
+class ScrapedNews(Record):
+    """scraped_news 행 (화면에서 덧붙이는 요약 상태 필드 포함)"""
+    __slots__ = ('id', 'title', 'url', 'source_name', 'category', 'scraped_at', 'published_at', 'cluster_id',
+                 'is_summarized', 'summary_id', 'summary_content')
+
+
+class NewsSummary(Record):
+    """news_summaries 행"""
+    __slots__ = ('id', 'title', 'url', 'category', 'source_name', 'created_at', 'published_at', 'is_favorite',
+                 'summary', 'content')
+
+
+class FavoriteNews(NewsSummary):
+    """관심 뉴스 (news_summaries + favorite_news) 행"""
+    __slots__ = ('user_notes', 'favorite_date')
+
+
+class SearchHit(Record):
+    """전문 검색 결과 행 (type: 'scraped' 또는 'summary')"""
+    __slots__ = ('id', 'title', 'url', 'source_name', 'category', 'created_at', 'snippet', 'rank', 'type')
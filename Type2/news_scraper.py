@@ -2,18 +2,45 @@
 뉴스 스크래핑 관련 기능
 """
 import requests
-from bs4 import BeautifulSoup
 import time
 from selenium import webdriver
-from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.options import Options
 from database import NewsDatabase
+from feed_reader import parse_feed
+from html_archive import HtmlArchive
+from circuit_breaker import CircuitBreakerRegistry, get_breakers
+from extraction_pool import ExtractionPool, get_extraction_pool
+from http_cache import HttpCacheStore, install_cache
+from politeness import PolitenessScheduler, get_scheduler
+from news_extractors import LISTING_SITE_SELECTORS, ListingPage
+
+# 캐시 헤더 없이 오는 목록 페이지를 다시 내려받지 않고 재사용하는 시간(초) - 화면 새로고침 / 연속 수집 대비
+LISTING_DEFAULT_MIN_FRESHNESS = 60
 
 class NewsScraper:
-    def __init__(self):
+    def __init__(self, archive: HtmlArchive = None, http_cache: HttpCacheStore = None, min_freshness=None,
+                 db: NewsDatabase = None, scheduler: PolitenessScheduler = None,
+                 breakers: CircuitBreakerRegistry = None, extraction_pool: ExtractionPool = None,
+                 default_min_freshness: float = LISTING_DEFAULT_MIN_FRESHNESS):
+        """db: 뉴스 소스 / 최근 수집 URL을 읽을 DB (기본값은 news_assistant.db)
+        archive: 원본 HTML 보관소 (기본값은 html_archive/, False이면 보관하지 않음)
+        http_cache: HTTP 응답 캐시 저장소 (기본값은 http_cache.db)
+        min_freshness: 서버 캐시 헤더 대신 쓸 호스트별 최소 신선도(초) {'www.khan.co.kr': 300, ...} (기본값은 서버 헤더 준수)
+        default_min_freshness: 서버가 캐시 헤더를 보내지 않은 응답의 신선도(초) (no-store / private 등 헤더가 있으면 따름)
+        scheduler: 호스트별 요청 조절기 (기본값은 프로세스 공용 스케줄러)
+        breakers: 호스트별 회로 차단기 (기본값은 프로세스 공용 차단기)
+        extraction_pool: 목록 페이지 파싱 프로세스 풀 (기본값은 프로세스 공용 풀)
+        """
+        self.db = db
+        self.archive = HtmlArchive() if archive is None else archive
         self.session = requests.Session()
+        self.scheduler = scheduler or get_scheduler()
+        self.breakers = breakers or get_breakers()
+        self.extraction_pool = extraction_pool or get_extraction_pool()
+        self.http_cache = install_cache(self.session, http_cache, min_freshness, default_min_freshness,
+                                        scheduler=self.scheduler, breakers=self.breakers)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -24,10 +51,16 @@ class NewsScraper:
         })
         
     def get_news_by_category(self, category, source_name=None):
-        """카테고리별 뉴스를 가져오는 함수"""
+        """카테고리별 뉴스를 가져오는 함수
+
+        마지막 수집 이후 새로 올라온 기사만 반환하며, 새 기사가 없으면 빈 목록을 반환합니다.
+        샘플 데이터는 모든 소스 수집이 실패했을 때만 사용합니다.
+        """
         try:
             # DB에서 뉴스 소스 확인
-            db = NewsDatabase()
+            if self.db is None:
+                self.db = NewsDatabase()
+            db = self.db
             sources = db.get_news_sources(category)
             
             if not sources:
@@ -42,46 +75,92 @@ class NewsScraper:
             
             # 모든 소스에서 뉴스 수집
             all_news = []
+            succeeded = 0
             for source in sources:
                 try:
                     news_list = self._scrape_from_source(source, category)
-                    all_news.extend(news_list)
+                    if news_list is not None:
+                        succeeded += 1
+                        all_news.extend(news_list)
                 except Exception as e:
                     print(f"{source['source_name']} 스크래핑 실패: {e}")
                     continue
             
-            return all_news if all_news else self._get_sample_news(category)
+            return all_news if succeeded else self._get_sample_news(category)
             
         except Exception as e:
             print(f"스크래핑 중 오류 발생: {e}")
             return self._get_sample_news(category)
     
+    def scrape_source(self, source):
+        """news_sources 행 하나에서 새 뉴스 수집 (실패하면 None, 새 기사가 없으면 빈 목록)"""
+        if self.db is None:
+            self.db = NewsDatabase()
+        return self._scrape_from_source(source, source['category'])
+
     def _scrape_from_source(self, source, category):
-        """특정 소스에서 뉴스 스크래핑"""
+        """특정 소스에서 새 뉴스 스크래핑 (실패하면 None, 새 기사가 없으면 빈 목록)
+
+        반환하는 ListingPage의 seen_urls는 목록 페이지에서 본 모든 URL로, 저장할 때 source와 함께 넘깁니다.
+        """
         try:
             print(f"🔍 {source['source_name']}에서 뉴스 스크래핑 시작...")
+            if not self.breakers.available(source['url']):
+                print(f"⛔ {source['source_name']}: 접속 실패가 반복되어 잠시 건너뜁니다.")
+                return None
+            known_urls = self.db.get_recent_source_urls(source['source_name'], category) if self.db else set()
             
-            # 1단계: requests + BeautifulSoup 시도
-            news_list = self._scrape_with_requests(source, category)
-            if news_list:
-                print(f"✅ requests로 {len(news_list)}개 뉴스 수집 성공")
-                return news_list
+            # 1단계: RSS / Atom / 뉴스 사이트맵 시도 (등록된 경우)
+            news_list = None
+            method = "피드"
+            if source.get('feed_url'):
+                news_list = self._scrape_with_feed(source, category, known_urls)
+
+            # 2단계: requests + BeautifulSoup 시도
+            if news_list is None:
+                news_list = self._scrape_with_requests(source, category, known_urls)
+                method = "requests"
             
-            # 2단계: Selenium 시도
-            news_list = self._scrape_with_selenium(source, category)
-            if news_list:
-                print(f"✅ Selenium으로 {len(news_list)}개 뉴스 수집 성공")
-                return news_list
+            # 3단계: Selenium 시도 (호스트 회로가 열렸으면 브라우저도 띄우지 않음)
+            if news_list is None and self.breakers.available(source['url']):
+                news_list = self._scrape_with_selenium(source, category, known_urls)
+                method = "Selenium"
             
-            print(f"❌ {source['source_name']}에서 뉴스 수집 실패")
-            return []
+            if news_list is None:
+                print(f"❌ {source['source_name']}에서 뉴스 수집 실패")
+                return None
+
+            seen_urls = getattr(news_list, 'seen_urls', None) or [n['url'] for n in news_list]
+            if self.db:
+                # 최근 링에 없던 URL도 전체 수집 이력(블룸 필터 + DB 확인)에 있으면 제외
+                news_list = self.db.filter_new_news(list(news_list))
+            if news_list:
+                print(f"✅ {method}로 새 뉴스 {len(news_list)}개 수집 성공")
+            else:
+                print(f"ℹ️ {source['source_name']}: 마지막 수집 이후 새 뉴스 없음")
+            # 본 URL(seen_urls)은 저장에 성공한 뒤 save_crawled_news(news_list, source)가 최근 링에 기록
+            return ListingPage(news_list, seen_urls)
             
         except Exception as e:
             print(f"❌ 소스 스크래핑 실패: {e}")
-            return []
+            return None
     
-    def _scrape_with_requests(self, source, category):
-        """requests를 사용한 스크래핑"""
+    def _scrape_with_feed(self, source, category, known_urls=None):
+        """RSS / Atom / 뉴스 사이트맵으로 기사 목록 수집 (실패하거나 항목이 없으면 None)"""
+        try:
+            url = source['feed_url']
+            print(f"📡 피드 {url}에 요청 중...")
+
+            response = self.session.get(url, timeout=15)
+            response.raise_for_status()
+            return parse_feed(response.content, source, category, known_urls=known_urls)
+
+        except Exception as e:
+            print(f"❌ 피드 수집 실패: {e}")
+            return None
+
+    def _scrape_with_requests(self, source, category, known_urls=None):
+        """requests를 사용한 스크래핑 (실패하거나 기사 링크를 찾지 못하면 None)"""
         try:
             url = source['url']
             print(f"📡 {url}에 요청 중...")
@@ -90,81 +169,19 @@ class NewsScraper:
             response.raise_for_status()
             print(f"✅ HTTP 응답 성공: {response.status_code}")
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            news_list = []
-            processed_urls = set()
-            
-            # 더 포괄적인 셀렉터로 뉴스 링크 찾기
-            selectors = [
-                'a[href*="/News/"]', 'a[href*="/news/"]', 'a[href*="/article/"]',
-                'a[href*="/story/"]', 'a[href*="/view/"]', 'a[href*="/read/"]',
-                '.news-item a', '.article-item a', 'article a',
-                '.list-item a', '.item a', '[class*="news"] a',
-                '[class*="article"] a', '[class*="story"] a',
-                'h1 a', 'h2 a', 'h3 a', 'h4 a'
-            ]
-            
-            print(f"🔍 {len(selectors)}개 셀렉터로 뉴스 검색 중...")
-            
-            for i, selector in enumerate(selectors):
-                try:
-                    links = soup.select(selector)
-                    print(f"셀렉터 {i+1}/{len(selectors)}: '{selector}' -> {len(links)}개 링크 발견")
-                    
-                    if links:
-                        for link in links[:20]:  # 최대 20개까지
-                            try:
-                                href = link.get('href')
-                                if not href:
-                                    continue
-                                
-                                # URL 정규화
-                                if href.startswith('/'):
-                                    href = source['base_url'].rstrip('/') + href
-                                elif not href.startswith('http'):
-                                    href = source['base_url'] + href
-                                
-                                if href in processed_urls:
-                                    continue
-                                processed_urls.add(href)
-                                
-                                # 제목 추출
-                                title = link.get_text(strip=True)
-                                if not title:
-                                    title_elem = link.find(['h1', 'h2', 'h3', 'h4', 'span', 'div', 'strong'])
-                                    if title_elem:
-                                        title = title_elem.get_text(strip=True)
-                                
-                                if title and len(title) > 5:
-                                    news_list.append({
-                                        'title': title,
-                                        'url': href,
-                                        'category': category,
-                                        'source_name': source['source_name']
-                                    })
-                                    print(f"📰 뉴스 추가: {title[:50]}...")
-                                    
-                                    if len(news_list) >= 15:  # 최대 15개
-                                        break
-                            except Exception as e:
-                                continue
-                    
-                    if news_list:
-                        print(f"✅ {len(news_list)}개 뉴스 수집 완료")
-                        break
-                        
-                except Exception as e:
-                    print(f"셀렉터 {selector} 처리 중 오류: {e}")
-                    continue
-            
-            return news_list
+            if self.archive:
+                self.archive.put_response(response, 'listing', source['source_name'], category, url=url)
+
+            # 파싱은 작업자 프로세스에서 (수집 스레드끼리 GIL을 두고 경쟁하지 않도록)
+            page = self.extraction_pool.extract_listing(response.content, source, category, known_urls=known_urls)
+            return page if page.seen_urls else None
             
         except Exception as e:
             print(f"❌ requests 스크래핑 실패: {e}")
-            return []
+            return None
     
-    def _scrape_with_selenium(self, source, category):
-        """Selenium을 사용한 스크래핑 - 참고프로젝트 기반 개선"""
+    def _scrape_with_selenium(self, source, category, known_urls=None):
+        """Selenium을 사용한 스크래핑 - 참고프로젝트 기반 개선 (실패하거나 기사 링크를 찾지 못하면 None)"""
         try:
             url = source['url']
             print(f"🌐 Selenium으로 {url} 접속 중...")
@@ -203,10 +220,17 @@ class NewsScraper:
                         print("✅ 시스템 PATH의 chromedriver 사용 성공")
                     except Exception as e3:
                         print(f"❌ 모든 WebDriver 초기화 방법 실패: {e3}")
-                        return []
+                        return None
             
             try:
-                driver.get(url)
+                # 브라우저 요청도 같은 호스트별 한도 적용 (상태 코드를 알 수 없으므로 로드 성공을 정상 응답으로 집계)
+                with self.scheduler.slot(url) as outcome:
+                    try:
+                        driver.get(url)
+                    except Exception:
+                        self.breakers.record_failure(url)
+                        raise
+                    outcome['status'] = 200
                 time.sleep(5)  # JS 렌더링 대기
                 print(f"✅ 페이지 로드 완료: {url}")
                 
@@ -216,119 +240,22 @@ class NewsScraper:
                 driver.execute_script("window.scrollTo(0, 0);")
                 time.sleep(2)
                 
-                news_list = []
-                processed_urls = set()
-                
-                # 참고프로젝트 기반 셀렉터 (사이트별 최적화)
-                site_selectors = {
-                    '연합뉴스': [
-                        '//ul/li//strong/a',  # XPath 방식
-                        '//ul/li//a',
-                        '.news-con a',
-                        'article a'
-                    ],
-                    'ZDNet': [
-                        '.newsPost a',  # 참고프로젝트에서 사용한 셀렉터
-                        '.newsPost h3 a',
-                        'article a'
-                    ],
-                    '한국일보': [
-                        '.news-item a',
-                        'article a',
-                        '.list-item a'
-                    ],
-                    '조선일보': [
-                        '.story-item a',
-                        'article a',
-                        '.list-item a'
-                    ],
-                    '중앙일보': [
-                        '.story-item a',
-                        'article a',
-                        '.list-item a'
-                    ]
-                }
-                
-                # 사이트별 최적화된 셀렉터 사용
-                selectors = site_selectors.get(source['source_name'], [
-                    'a[href*="/News/"]', 'a[href*="/news/"]', 'a[href*="/article/"]',
-                    '.news-item a', '.article-item a', 'article a',
-                    '.list-item a', '.item a', '[class*="news"] a'
-                ])
-                
-                print(f"🔍 {len(selectors)}개 셀렉터로 뉴스 검색 중...")
-                
-                for i, selector in enumerate(selectors):
-                    try:
-                        if selector.startswith('//'):
-                            # XPath 사용
-                            elements = driver.find_elements(By.XPATH, selector)
-                        else:
-                            # CSS 셀렉터 사용
-                            elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                        
-                        print(f"셀렉터 {i+1}/{len(selectors)}: '{selector}' -> {len(elements)}개 요소 발견")
-                        
-                        for element in elements[:20]:  # 최대 20개
-                            try:
-                                href = element.get_attribute('href')
-                                if not href or href in processed_urls:
-                                    continue
-                                
-                                processed_urls.add(href)
-                                
-                                # URL 정규화
-                                if href.startswith('/'):
-                                    href = source['base_url'].rstrip('/') + href
-                                elif not href.startswith('http'):
-                                    href = source['base_url'] + href
-                                
-                                # 제목 추출 (참고프로젝트 방식)
-                                title = element.text.strip()
-                                if not title:
-                                    try:
-                                        # h3 태그에서 제목 찾기 (ZDNet 방식)
-                                        title_elem = element.find_element(By.TAG_NAME, 'h3')
-                                        title = title_elem.text.strip()
-                                    except:
-                                        try:
-                                            # strong 태그에서 제목 찾기
-                                            title_elem = element.find_element(By.TAG_NAME, 'strong')
-                                            title = title_elem.text.strip()
-                                        except:
-                                            continue
-                                
-                                if title and len(title) > 5:
-                                    news_list.append({
-                                        'title': title,
-                                        'url': href,
-                                        'category': category,
-                                        'source_name': source['source_name']
-                                    })
-                                    print(f"📰 뉴스 추가: {title[:50]}...")
-                                    
-                                    if len(news_list) >= 15:  # 최대 15개
-                                        break
-                            except Exception as e:
-                                continue
-                        
-                        if news_list:
-                            print(f"✅ {len(news_list)}개 뉴스 수집 완료")
-                            break
-                            
-                    except Exception as e:
-                        print(f"셀렉터 {selector} 처리 중 오류: {e}")
-                        continue
-                        
+                # 요소마다 WebDriver를 호출하지 않도록 렌더링된 HTML을 한 번에 받아 requests 경로와 같은 추출기로 파싱
+                html = driver.page_source
+
             finally:
                 driver.quit()
                 print("🔚 WebDriver 종료")
                 
-            return news_list
+            if self.archive:
+                self.archive.put(url, html.encode('utf-8'), 'listing', source['source_name'], category)
+            page = self.extraction_pool.extract_listing(html, source, category, known_urls=known_urls,
+                                                        selectors=LISTING_SITE_SELECTORS.get(source['source_name']))
+            return page if page.seen_urls else None
             
         except Exception as e:
             print(f"❌ Selenium 스크래핑 실패: {e}")
-            return []
+            return None
     
     def _get_sample_news(self, category):
         """샘플 뉴스 데이터"""
@@ -0,0 +1,141 @@
+"""
+크기가 제한된 큐로 단계를 연결한 파이프라인 (예: 가져오기 → 파싱 → 저장 → 요약)
+
+단계마다 병목(네트워크, CPU, DB 쓰기, API 할당량)에 맞춰 작업 스레드 수를 따로 정하고,
+단계 사이 큐의 크기를 제한하여 뒤 단계가 느리면 앞 단계가 기다리도록(backpressure) 합니다.
+입력이 몇 개이든 동시에 메모리에 올라오는 작업은 큐 크기와 작업자 수의 합을 넘지 않으며,
+결과는 호출한 스레드(Streamlit 화면 갱신 등)에서 끝나는 순서대로 받습니다.
+"""
+import queue
+import threading
+import time
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+# 단계 입력이 끝났음을 알리는 표시
+_DONE = object()
+# 큐 대기 중 중단 요청을 확인하는 간격(초)
+_POLL_INTERVAL = 0.1
+
+
+class Stage:
+    def __init__(self, name: str, func: Callable[[Dict], Optional[Dict]], workers: int = 1, queue_size: int = None):
+        """func(job): 작업(dict)을 처리하여 다음 단계로 넘길 작업 반환 (None이면 결과 없이 버림, 예외면 실패)
+        workers: 이 단계의 작업 스레드 수
+        queue_size: 이 단계 입력 큐 크기 (기본값: 작업자 수의 2배)
+        """
+        self.name = name
+        self.func = func
+        self.workers = max(1, workers)
+        self.queue_size = queue_size or self.workers * 2
+        self.processed = 0
+        self.failed = 0
+        self.busy_seconds = 0.0
+
+
+class Pipeline:
+    def __init__(self, stages: List[Stage], output_size: int = None):
+        """output_size: 호출한 쪽이 아직 받지 않은 결과를 쌓아 두는 큐 크기 (기본값: 마지막 단계 작업자 수의 2배)"""
+        self.stages = stages
+        self.output_size = output_size or stages[-1].workers * 2
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def _put(self, target: queue.Queue, item) -> bool:
+        """큐가 찰 때는 기다리되, 중단 요청이 오면 포기 (False)"""
+        while not self._stop.is_set():
+            try:
+                target.put(item, timeout=_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, source: queue.Queue):
+        while not self._stop.is_set():
+            try:
+                return source.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                continue
+        return _DONE
+
+    def _feed(self, jobs: Iterable[Dict], first: queue.Queue):
+        try:
+            for job in jobs:
+                if not self._put(first, job):
+                    return
+        except Exception as e:
+            print(f"❌ 파이프라인 입력 오류: {e}")
+        for _ in range(self.stages[0].workers):
+            self._put(first, _DONE)
+
+    def _work(self, index: int, inbox: queue.Queue, outbox: queue.Queue, output: queue.Queue, remaining: List[int]):
+        stage = self.stages[index]
+        while True:
+            job = self._get(inbox)
+            if job is _DONE:
+                break
+            started = time.monotonic()
+            try:
+                result = stage.func(job)
+                failed = False
+            except Exception as e:
+                # 실패한 작업은 이후 단계를 건너뛰고 바로 결과로 보냄
+                job['error'] = str(e) or type(e).__name__
+                job['failed_stage'] = stage.name
+                result = job
+                failed = True
+            with self._lock:
+                stage.busy_seconds += time.monotonic() - started
+                stage.processed += 1
+                stage.failed += failed
+            if result is not None:
+                self._put(output if failed else outbox, result)
+
+        # 이 단계의 마지막 작업자가 다음 단계에 입력 종료를 알림
+        with self._lock:
+            remaining[index] -= 1
+            last = remaining[index] == 0
+        if last:
+            following = self.stages[index + 1].workers if index + 1 < len(self.stages) else 1
+            for _ in range(following):
+                self._put(outbox, _DONE)
+
+    def run(self, jobs: Iterable[Dict]) -> Iterator[Dict]:
+        """작업을 흘려보내고 마지막 단계까지 끝났거나 실패한 작업을 끝나는 순서대로 반환
+
+        실패한 작업은 'error'(메시지)와 'failed_stage'(단계 이름)가 채워져 반환됩니다.
+        받는 도중에 멈추면(generator close) 처리 중인 작업만 마치고 큐에 남은 작업은 버립니다.
+        """
+        self._stop.clear()
+        inboxes = [queue.Queue(maxsize=stage.queue_size) for stage in self.stages]
+        output = queue.Queue(maxsize=self.output_size)
+        outboxes = inboxes[1:] + [output]
+        remaining = [stage.workers for stage in self.stages]
+
+        threads = [threading.Thread(target=self._feed, args=(jobs, inboxes[0]), daemon=True)]
+        for index, stage in enumerate(self.stages):
+            for _ in range(stage.workers):
+                threads.append(threading.Thread(target=self._work, daemon=True,
+                                                args=(index, inboxes[index], outboxes[index], output, remaining)))
+        for thread in threads:
+            thread.start()
+
+        try:
+            while True:
+                job = self._get(output)
+                if job is _DONE:
+                    break
+                yield job
+        finally:
+            self._stop.set()
+            for thread in threads:
+                thread.join()
+
+    def stats(self) -> Dict[str, Dict]:
+        """단계별 처리 건수 / 실패 건수 / 작업 시간 합계"""
+        with self._lock:
+            return {
+                stage.name: {'workers': stage.workers, 'processed': stage.processed, 'failed': stage.failed,
+                             'busy_seconds': stage.busy_seconds}
+                for stage in self.stages
+            }
@@ -0,0 +1,211 @@
+"""
+호스트별 요청 예절(politeness) 스케줄러
+
+- 호스트별 토큰 버킷: 초당 요청 수(rate)와 순간 허용량(burst) 제한
+- AIMD 동시 요청 한도: 정상 응답이면 조금씩(덧셈) 늘리고, 429/503·지연·오류면 절반으로(곱셈) 줄임
+- Retry-After: 지정된 시간 동안 해당 호스트 요청 중단 후 재시도
+
+같은 언론사의 여러 카테고리를 병렬로 수집해도 호스트 하나에 요청이 몰리지 않도록,
+스크래퍼들이 모듈 수준 기본 스케줄러(get_scheduler)를 공유합니다.
+"""
+import threading
+import time
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Optional
+from urllib.parse import urlsplit
+
+# 서버가 요청을 줄이라는 의미로 보내는 상태 코드
+THROTTLE_STATUSES = {429, 503}
+
+
+def parse_retry_after(value: Optional[str], now: float = None) -> Optional[float]:
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 대기 시간(초)으로 변환"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - (now or time.time()))
+    except (TypeError, ValueError):
+        return None
+
+
+class _HostState:
+    __slots__ = ('max_rate', 'rate', 'burst', 'tokens', 'refilled_at', 'limit', 'in_flight', 'blocked_until',
+                 'consecutive_throttles', 'requests', 'throttled', 'errors', 'latency')
+
+    def __init__(self, rate: float, burst: int, limit: float):
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.refilled_at = time.monotonic()
+        self.limit = limit
+        self.in_flight = 0
+        self.blocked_until = 0.0
+        self.consecutive_throttles = 0
+        self.requests = 0
+        self.throttled = 0
+        self.errors = 0
+        self.latency = None  # 응답 시간 지수 이동 평균(초)
+
+
+class PolitenessScheduler:
+    def __init__(self, rate: float = 2.0, burst: int = 4, initial_concurrency: int = 2, max_concurrency: int = 8,
+                 min_rate: float = 0.1, target_latency: float = 3.0, max_retry_after: float = 120.0,
+                 host_rates: Dict[str, float] = None):
+        """rate / burst: 호스트별 기본 초당 요청 수와 순간 허용량 (host_rates로 호스트별 재정의)
+        initial_concurrency / max_concurrency: 호스트별 동시 요청 한도 시작값 / 상한
+        target_latency: 평균 응답 시간이 이보다 길면 서버 부하로 보고 한도를 줄임
+        max_retry_after: 이보다 긴 Retry-After는 기다리지 않고 응답을 그대로 반환
+        """
+        self.rate = rate
+        self.burst = burst
+        self.initial_concurrency = initial_concurrency
+        self.max_concurrency = max_concurrency
+        self.min_rate = min_rate
+        self.target_latency = target_latency
+        self.max_retry_after = max_retry_after
+        self.host_rates = {host.lower(): value for host, value in (host_rates or {}).items()}
+        self._hosts: Dict[str, _HostState] = {}
+        self._condition = threading.Condition()
+
+    @staticmethod
+    def _host(url: str) -> str:
+        return (urlsplit(url).hostname or "").lower()
+
+    def _state(self, host: str) -> _HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            state = _HostState(self.host_rates.get(host, self.rate), self.burst, self.initial_concurrency)
+            self._hosts[host] = state
+        return state
+
+    @staticmethod
+    def _refill(state: _HostState, now: float):
+        state.tokens = min(state.burst, state.tokens + (now - state.refilled_at) * state.rate)
+        state.refilled_at = now
+
+    def acquire(self, url: str, timeout: float = None) -> bool:
+        """호스트의 동시 요청 한도 / 토큰 / Retry-After 대기 조건을 만족할 때까지 기다린 뒤 요청 슬롯 확보
+
+        timeout 안에 확보하지 못하면 False
+        """
+        host = self._host(url)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while True:
+                state = self._state(host)
+                now = time.monotonic()
+                self._refill(state, now)
+                if state.blocked_until > now:
+                    wait = state.blocked_until - now
+                elif state.in_flight >= int(state.limit):
+                    wait = None  # 다른 요청이 끝나면 notify
+                elif state.tokens < 1:
+                    wait = (1 - state.tokens) / state.rate
+                else:
+                    state.tokens -= 1
+                    state.in_flight += 1
+                    state.requests += 1
+                    return True
+
+                if deadline is not None:
+                    remaining = deadline - now
+                    if remaining <= 0:
+                        return False
+                    wait = remaining if wait is None else min(wait, remaining)
+                self._condition.wait(wait)
+
+    def release(self, url: str, status: int = None, latency: float = None, retry_after: float = None):
+        """요청 결과를 반영하여 슬롯 반환 (status=None은 연결 오류 / 타임아웃)"""
+        host = self._host(url)
+        with self._condition:
+            state = self._state(host)
+            now = time.monotonic()
+            state.in_flight = max(0, state.in_flight - 1)
+            if latency is not None:
+                state.latency = latency if state.latency is None else 0.8 * state.latency + 0.2 * latency
+
+            if status in THROTTLE_STATUSES or retry_after is not None:
+                # 곱셈 감소 + Retry-After(없으면 지수 백오프) 동안 호스트 요청 중단
+                state.throttled += 1
+                state.consecutive_throttles += 1
+                state.limit = max(1.0, state.limit / 2)
+                state.rate = max(self.min_rate, state.rate / 2)
+                state.tokens = min(state.tokens, 0.0)
+                pause = retry_after if retry_after is not None else 2.0 ** min(state.consecutive_throttles, 6)
+                state.blocked_until = max(state.blocked_until, now + min(pause, self.max_retry_after))
+            elif status is None or status >= 500:
+                state.errors += 1
+                state.limit = max(1.0, state.limit / 2)
+            elif state.latency is not None and state.latency > self.target_latency:
+                state.limit = max(1.0, state.limit / 2)
+            else:
+                # 덧셈 증가: 현재 한도만큼 성공하면 한도 +1, 속도도 설정값까지 회복
+                state.consecutive_throttles = 0
+                state.limit = min(self.max_concurrency, state.limit + 1 / state.limit)
+                state.rate = min(state.max_rate, state.rate + state.max_rate / 10)
+            self._condition.notify_all()
+
+    @contextmanager
+    def slot(self, url: str):
+        """요청 슬롯 컨텍스트 - 블록 안에서 outcome['status'] / outcome['retry_after']를 채우면 결과에 반영
+
+        status를 채우지 않고 끝나거나 예외가 나면 오류로 집계합니다.
+        """
+        self.acquire(url)
+        outcome = {'status': None, 'retry_after': None}
+        started = time.monotonic()
+        try:
+            yield outcome
+        finally:
+            self.release(url, outcome['status'], time.monotonic() - started, outcome['retry_after'])
+
+    def request(self, url: str, send: Callable, retries: int = 2):
+        """send()로 요청하고 429/503이면 Retry-After만큼 기다렸다가 최대 retries번 재시도"""
+        for attempt in range(retries + 1):
+            with self.slot(url) as outcome:
+                response = send()
+                outcome['status'] = response.status_code
+                outcome['retry_after'] = parse_retry_after(response.headers.get('Retry-After'))
+            if response.status_code not in THROTTLE_STATUSES or attempt == retries:
+                return response
+            if outcome['retry_after'] is not None and outcome['retry_after'] > self.max_retry_after:
+                return response
+            print(f"⏳ {self._host(url)} 요청 제한 응답({response.status_code}) - 대기 후 재시도")
+            response.close()
+        return response
+
+    def stats(self) -> Dict[str, Dict]:
+        """호스트별 현재 한도 / 속도 / 누적 요청 통계"""
+        with self._condition:
+            now = time.monotonic()
+            return {
+                host: {
+                    'concurrency_limit': int(state.limit),
+                    'in_flight': state.in_flight,
+                    'rate': state.rate,
+                    'requests': state.requests,
+                    'throttled': state.throttled,
+                    'errors': state.errors,
+                    'avg_latency': state.latency,
+                    'blocked_for': max(0.0, state.blocked_until - now),
+                }
+                for host, state in self._hosts.items()
+            }
+
+
+_default_scheduler: Optional[PolitenessScheduler] = None
+_default_lock = threading.Lock()
+
+
+def get_scheduler() -> PolitenessScheduler:
+    """프로세스 전체에서 공유하는 기본 스케줄러"""
+    global _default_scheduler
+    with _default_lock:
+        if _default_scheduler is None:
+            _default_scheduler = PolitenessScheduler()
+        return _default_scheduler
@@ -0,0 +1,97 @@
+"""
+보관된 원본 HTML을 현재 추출 로직으로 다시 처리 (네트워크 접근 없음)
+
+사용 예:
+    python reextract.py                       # 목록/기사 모두 재추출 후 결과 요약 출력
+    python reextract.py --kind article --save # 기사 본문을 재추출하여 요약본 본문(content) 갱신
+    python reextract.py --kind listing --save --output listing.jsonl
+"""
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, Tuple
+
+from html_archive import DEFAULT_ARCHIVE_DIR, HtmlArchive, read_record
+from news_extractors import extract_article, extract_listing
+
+
+def _extract_entry(task: Tuple[str, Dict]) -> Optional[Dict]:
+    """작업자 프로세스에서 레코드 하나를 읽어 추출 (세그먼트 경로/오프셋만 전달받음)"""
+    root, entry = task
+    try:
+        record = read_record(root, entry['segment'], entry['offset'], entry['length'])
+        if entry['kind'] == 'listing':
+            source = {'source_name': entry['source_name'], 'url': entry['url']}
+            items = extract_listing(record['body'], source, entry['category'], verbose=False)
+            return {'id': entry['id'], 'kind': 'listing', 'url': entry['url'], 'items': items}
+        article = extract_article(record['body'], entry['url'], verbose=False)
+        return {'id': entry['id'], 'kind': 'article', 'url': entry['url'], 'article': article}
+    except Exception as e:
+        return {'id': entry['id'], 'kind': entry['kind'], 'url': entry['url'], 'error': str(e)}
+
+
+def reextract(archive_dir: str = DEFAULT_ARCHIVE_DIR, kind: str = None, workers: int = None,
+              all_versions: bool = False, save: bool = False, db_path: str = "news_assistant.db",
+              output: str = None, chunksize: int = 16) -> Dict:
+    """보관소 전체를 프로세스 풀로 재추출하고 통계 반환"""
+    archive = HtmlArchive(archive_dir)
+    entries = []
+    for entry_kind in ([kind] if kind else ['listing', 'article']):
+        # 목록 페이지는 시점마다 다른 기사가 있으므로 기본적으로 모든 버전을 처리
+        entries.extend(archive.entries(entry_kind, latest_only=not (all_versions or entry_kind == 'listing')))
+
+    stats = {'records': len(entries), 'listing_items': 0, 'articles': 0, 'failed': 0, 'saved': 0}
+    listing_items = []
+    contents = {}
+    started = time.time()
+
+    out = open(output, 'w', encoding='utf-8') if output else None
+    try:
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+            tasks = ((archive_dir, entry) for entry in entries)
+            for result in executor.map(_extract_entry, tasks, chunksize=chunksize):
+                if result is None or result.get('error') or (result['kind'] == 'article' and not result['article']):
+                    stats['failed'] += 1
+                elif result['kind'] == 'listing':
+                    stats['listing_items'] += len(result['items'])
+                    listing_items.extend(result['items'])
+                else:
+                    stats['articles'] += 1
+                    contents[result['url']] = result['article']['content']
+                if out:
+                    out.write(json.dumps(result, ensure_ascii=False) + "\n")
+    finally:
+        if out:
+            out.close()
+
+    if save:
+        from database import NewsDatabase
+        db = NewsDatabase(db_path)
+        stats['saved'] += len(db.insert_crawled_news(listing_items) or [])
+        stats['saved'] += db.update_news_contents(contents)
+
+    stats['elapsed'] = time.time() - started
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="보관된 원본 HTML 재추출")
+    parser.add_argument("--archive", default=DEFAULT_ARCHIVE_DIR, help="원본 HTML 보관소 디렉터리")
+    parser.add_argument("--kind", choices=["listing", "article"], help="재추출할 레코드 종류 (기본값: 모두)")
+    parser.add_argument("--workers", type=int, help="작업자 프로세스 수 (기본값: CPU 수)")
+    parser.add_argument("--all-versions", action="store_true", help="기사 페이지도 URL별 최신본이 아닌 모든 버전 처리")
+    parser.add_argument("--save", action="store_true", help="결과를 DB에 반영 (목록: 새 기사 저장, 기사: 요약본 본문 갱신)")
+    parser.add_argument("--db", default="news_assistant.db", help="DB 파일 경로")
+    parser.add_argument("--output", help="추출 결과를 JSON Lines로 저장할 파일")
+    args = parser.parse_args()
+
+    stats = reextract(args.archive, args.kind, args.workers, args.all_versions, args.save, args.db, args.output)
+    print(f"🔁 재추출 완료: 레코드 {stats['records']}개, 목록 기사 {stats['listing_items']}개, "
+          f"기사 본문 {stats['articles']}개, 실패 {stats['failed']}개, DB 반영 {stats['saved']}건 "
+          f"({stats['elapsed']:.1f}초)")
+
+
+if __name__ == "__main__":
+    main()
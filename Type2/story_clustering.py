@@ -0,0 +1,156 @@
+"""
+언론사 간 동일 사건 기사 묶기 (제목 문자 n-gram TF-IDF 기반 점진적 클러스터링)
+"""
+import re
+import zlib
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+# 제목 앞뒤의 말머리 ([속보], [단독], (종합) 등) 제거용
+_TAG_PATTERN = re.compile(r'[\[\(【<][^\]\)】>]{1,10}[\]\)】>]')
+_NON_WORD_PATTERN = re.compile(r'[^\w가-힣]')
+
+
+class StoryClusterer:
+    def __init__(self, dim: int = 2048, ngram_range: Tuple[int, int] = (2, 3),
+                 threshold: float = 0.5, window: int = 2000):
+        """점진적 클러스터러 초기화 (window: 메모리에 유지할 최근 클러스터 수)"""
+        self.dim = dim
+        self.ngram_range = ngram_range
+        self.threshold = threshold
+        self.window = window
+
+        self.num_docs = 0
+        self.doc_freq = np.zeros(dim, dtype=np.float32)
+        self.cluster_ids: List[int] = []
+        self.centroids = np.zeros((0, dim), dtype=np.float32)  # 클러스터별 n-gram 빈도 합
+
+    def _term_counts(self, title: str) -> np.ndarray:
+        """제목의 문자 n-gram을 해싱하여 빈도 벡터 생성"""
+        text = _NON_WORD_PATTERN.sub('', _TAG_PATTERN.sub('', title or '')).lower()
+        buckets = []
+        low, high = self.ngram_range
+        for n in range(low, high + 1):
+            buckets.extend(zlib.crc32(text[i:i + n].encode('utf-8')) % self.dim
+                           for i in range(len(text) - n + 1))
+        return np.bincount(buckets, minlength=self.dim).astype(np.float32)
+
+    def _idf(self) -> np.ndarray:
+        return np.log((1.0 + self.num_docs) / (1.0 + self.doc_freq)) + 1.0
+
+    @staticmethod
+    def _normalize(matrix: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+
+    def _trim(self):
+        """window를 넘는 오래된 클러스터는 메모리에서 제외"""
+        overflow = len(self.cluster_ids) - self.window
+        if overflow > 0:
+            self.cluster_ids = self.cluster_ids[overflow:]
+            self.centroids = self.centroids[overflow:]
+
+    def load(self, rows: Iterable[Tuple[int, str, int]]):
+        """DB에 저장된 (id, title, cluster_id) 목록으로 상태 복원 (id 오름차순)"""
+        positions: Dict[int, int] = {}
+        vectors = []
+        ids = []
+        for _, title, cluster_id in rows:
+            counts = self._term_counts(title)
+            self.num_docs += 1
+            self.doc_freq += counts > 0
+            if cluster_id in positions:
+                vectors[positions[cluster_id]] += counts
+            else:
+                positions[cluster_id] = len(ids)
+                ids.append(cluster_id)
+                vectors.append(counts)
+
+        if ids:
+            self.cluster_ids.extend(ids)
+            self.centroids = np.vstack([self.centroids, np.stack(vectors)])
+            self._trim()
+
+    def assign(self, rows: List[Tuple[int, str]], chunk_size: int = 256) -> Dict[int, int]:
+        """새로 저장된 (id, title) 목록에 클러스터 ID 부여
+
+        클러스터 ID는 해당 사건을 처음 보도한 기사의 scraped_news.id 입니다.
+        대량 저장 시에도 빠르도록 chunk_size개씩 행렬 곱으로 유사도를 계산합니다.
+        """
+        assignments: Dict[int, int] = {}
+        if not rows:
+            return assignments
+
+        vectors = np.stack([self._term_counts(title) for _, title in rows])
+        self.num_docs += len(rows)
+        self.doc_freq += (vectors > 0).sum(axis=0)
+
+        # IDF는 배치 단위로 고정
+        idf = self._idf()
+
+        for start in range(0, len(rows), chunk_size):
+            chunk_rows = rows[start:start + chunk_size]
+            counts = vectors[start:start + chunk_size]
+            queries = self._normalize(counts * idf)
+
+            # 기존 클러스터 / 청크 내 기사 간 유사도를 한 번에 계산
+            existing_count = len(self.cluster_ids)
+            existing_scores = queries @ self._normalize(self.centroids * idf).T if existing_count else None
+            chunk_scores = queries @ queries.T
+
+            seeds: List[int] = []  # 이번 청크에서 새 클러스터를 만든 기사의 청크 내 위치
+            new_centroids: List[np.ndarray] = []
+            for i, (row_id, _) in enumerate(chunk_rows):
+                best, best_score = -1, self.threshold
+                if existing_scores is not None:
+                    j = int(np.argmax(existing_scores[i]))
+                    if existing_scores[i, j] >= best_score:
+                        best, best_score = j, existing_scores[i, j]
+                if seeds:
+                    k = int(np.argmax(chunk_scores[i, seeds]))
+                    if chunk_scores[i, seeds[k]] >= best_score:
+                        best, best_score = existing_count + k, chunk_scores[i, seeds[k]]
+
+                if best < 0:
+                    seeds.append(i)
+                    new_centroids.append(counts[i].copy())
+                    self.cluster_ids.append(row_id)
+                    assignments[row_id] = row_id
+                elif best < existing_count:
+                    self.centroids[best] += counts[i]
+                    assignments[row_id] = self.cluster_ids[best]
+                else:
+                    new_centroids[best - existing_count] += counts[i]
+                    assignments[row_id] = self.cluster_ids[best]
+
+            if new_centroids:
+                self.centroids = np.vstack([self.centroids, np.stack(new_centroids)])
+            self._trim()
+
+        return assignments
+
+
+def collapse_story_clusters(news_list: List[Dict]) -> List[Dict]:
+    """같은 cluster_id의 기사는 첫 번째 기사(대표)만 남기고 관련 언론사 정보를 덧붙임"""
+    representatives: List[Dict] = []
+    by_cluster: Dict[int, Dict] = {}
+    for news in news_list:
+        cluster_id: Optional[int] = news.get('cluster_id')
+        if cluster_id is None:
+            representatives.append(news)
+            continue
+        if cluster_id in by_cluster:
+            rep = by_cluster[cluster_id]
+            rep['cluster_size'] += 1
+            source_name = news.get('source_name')
+            if source_name and source_name not in rep['related_sources']:
+                rep['related_sources'].append(source_name)
+            continue
+        rep = dict(news)
+        rep['cluster_size'] = 1
+        rep['related_sources'] = [news['source_name']] if news.get('source_name') else []
+        by_cluster[cluster_id] = rep
+        representatives.append(rep)
+    return representatives
@@ -0,0 +1,131 @@
+"""
+기사 페이지의 구조화 데이터(JSON-LD NewsArticle, OpenGraph / article: meta 태그) 추출
+
+DOM 전체를 파싱하지 않고 <script type="application/ld+json"> 블록과 <head>의 meta 태그만 정규식으로 읽습니다.
+"""
+import html
+import json
+import re
+from typing import Dict, List, Optional, Union
+
+# 기사로 취급하는 JSON-LD @type
+ARTICLE_TYPES = {
+    'NewsArticle', 'Article', 'ReportageNewsArticle', 'AnalysisNewsArticle', 'OpinionNewsArticle',
+    'BackgroundNewsArticle', 'ReviewNewsArticle', 'BlogPosting', 'Report',
+}
+
+_LD_JSON = re.compile(
+    r'<script[^>]*type\s*=\s*["\']application/ld\+json["\'][^>]*>(.*?)</script\s*>',
+    re.IGNORECASE | re.DOTALL
+)
+_META = re.compile(r'<meta\s[^>]*>', re.IGNORECASE)
+_ATTRIBUTE = re.compile(r'([\w:-]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s>]+))')
+_HEAD_END = re.compile(r'</head\s*>', re.IGNORECASE)
+_TAG = re.compile(r'<[^>]+>')
+_CHARSET = re.compile(rb'charset\s*=\s*["\']?([\w-]+)', re.IGNORECASE)
+
+
+def decode_page(page: bytes) -> str:
+    """meta charset 선언(없으면 UTF-8)으로 HTML 디코딩"""
+    match = _CHARSET.search(page[:4096])
+    encoding = match.group(1).decode('ascii') if match else 'utf-8'
+    try:
+        return page.decode(encoding, errors='replace')
+    except LookupError:
+        return page.decode('utf-8', errors='replace')
+
+
+def _text(value) -> Optional[str]:
+    if isinstance(value, list):
+        value = next((v for v in value if isinstance(v, str)), None)
+    if not isinstance(value, str):
+        return None
+    value = html.unescape(_TAG.sub(' ', value)).strip()
+    return value or None
+
+
+def _names(value) -> List[str]:
+    """author / creator 값(문자열, Person 객체, 목록)에서 이름 목록 추출"""
+    if value is None:
+        return []
+    if not isinstance(value, list):
+        value = [value]
+    names = []
+    for item in value:
+        name = _text(item.get('name') if isinstance(item, dict) else item)
+        if name and name not in names:
+            names.append(name)
+    return names
+
+
+def _iter_nodes(data):
+    """JSON-LD 문서의 모든 객체 (목록, @graph, mainEntity 포함)"""
+    if isinstance(data, list):
+        for item in data:
+            yield from _iter_nodes(item)
+    elif isinstance(data, dict):
+        yield data
+        for key in ('@graph', 'mainEntity', 'mainEntityOfPage'):
+            if isinstance(data.get(key), (list, dict)):
+                yield from _iter_nodes(data[key])
+
+
+def _is_article(node: Dict) -> bool:
+    types = node.get('@type')
+    types = types if isinstance(types, list) else [types]
+    return any(t in ARTICLE_TYPES for t in types if isinstance(t, str))
+
+
+def parse_json_ld(page: str) -> Optional[Dict]:
+    """첫 번째 기사형 JSON-LD 객체 (없으면 None)"""
+    for match in _LD_JSON.finditer(page):
+        try:
+            # 본문에 이스케이프되지 않은 줄바꿈이 들어 있는 사이트가 많아 strict=False
+            data = json.loads(match.group(1).strip(), strict=False)
+        except ValueError:
+            continue
+        for node in _iter_nodes(data):
+            if _is_article(node):
+                return node
+    return None
+
+
+def parse_meta_tags(page: str) -> Dict[str, str]:
+    """<head>의 meta 태그 (property / name -> content, 먼저 나온 값 우선)"""
+    head_end = _HEAD_END.search(page)
+    head = page[:head_end.start()] if head_end else page
+    tags = {}
+    for tag in _META.finditer(head):
+        attributes = {name.lower(): double or single or bare
+                      for name, double, single, bare in _ATTRIBUTE.findall(tag.group(0))}
+        key = (attributes.get('property') or attributes.get('name') or '').lower()
+        if key and 'content' in attributes:
+            tags.setdefault(key, html.unescape(attributes['content']).strip())
+    return tags
+
+
+def extract_structured_data(page: Union[str, bytes]) -> Dict:
+    """구조화 데이터에서 기사 정보 추출
+
+    반환: {'title', 'content', 'description', 'published', 'modified', 'authors', 'source'}
+    (content는 JSON-LD articleBody가 있을 때만, source는 'json-ld' / 'opengraph' / None)
+    """
+    if isinstance(page, bytes):
+        page = decode_page(page)
+
+    article = parse_json_ld(page) or {}
+    meta = parse_meta_tags(page)
+
+    result = {
+        'title': _text(article.get('headline')) or _text(article.get('name'))
+                 or meta.get('og:title') or meta.get('twitter:title'),
+        'content': _text(article.get('articleBody')),
+        'description': _text(article.get('description')) or meta.get('og:description') or meta.get('description'),
+        'published': _text(article.get('datePublished')) or meta.get('article:published_time')
+                     or meta.get('og:article:published_time'),
+        'modified': _text(article.get('dateModified')) or meta.get('article:modified_time'),
+        'authors': _names(article.get('author')) or _names(article.get('creator'))
+                   or _names(meta.get('article:author') or meta.get('author') or meta.get('dable:author')),
+    }
+    result['source'] = 'json-ld' if article else ('opengraph' if result['title'] else None)
+    return result
@@ -0,0 +1,71 @@
+import os
+import sys
+import tempfile
+import threading
+import time
+
+# Type2 경로 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from batch_runner import run_summary_batch, start_summary_run
+from database import NewsDatabase
+
+
+class RecordingDatabase(NewsDatabase):
+    """요약 저장을 호출한 스레드 기록 (fail_url이면 저장 실패)"""
+
+    def __init__(self, db_path: str, fail_url: str = None):
+        super().__init__(db_path)
+        self.fail_url = fail_url
+        self.writers = set()
+
+    def save_news_summary(self, *args, **kwargs):
+        self.writers.add(threading.get_ident())
+        if kwargs.get('url') == self.fail_url:
+            print("뉴스 요약 저장 실패: database is locked")
+            return None
+        return super().save_news_summary(*args, **kwargs)
+
+
+class FakeContentScraper:
+    def fetch_page(self, url):
+        return f"<html>{url}</html>"
+
+    def extract_content(self, url, page):
+        return {'url': url, 'title': "제목", 'content': f"{url} 본문"}
+
+
+class FakeSummarizer:
+    def __init__(self):
+        self.threads = set()
+
+    def summarize_article(self, url, title, content_data):
+        self.threads.add(threading.get_ident())
+        time.sleep(0.01)
+        return {'summary': f"{title} 요약", 'full_content': content_data['content'], 'published_at': None,
+                'scraped_at': "2024-01-01 00:00:00"}
+
+
+def _news(i: int):
+    return {'title': f"기사 {i}", 'url': f"https://example.com/{i}", 'category': "정치", 'source_name': "테스트일보"}
+
+
+def test_summary_batch_single_writer():
+    """요약 작업자는 DB에 쓰지 않고, 요약 저장은 작업자 1개 단계에서만"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db = RecordingDatabase(os.path.join(tmp_dir, "test.db"), fail_url="https://example.com/3")
+        summarizer = FakeSummarizer()
+        run_id = start_summary_run(db, [_news(i) for i in range(8)])
+
+        results = {news['url']: (result, error) for news, result, error in
+                   run_summary_batch(db, run_id, summarizer, summarize_workers=3,
+                                     content_scraper=FakeContentScraper())}
+
+        assert len(results) == 8
+        assert len(db.writers) == 1 and not db.writers & summarizer.threads
+        # 저장하지 못한 요약은 실패로 기록 (결과 없음)
+        assert results["https://example.com/3"] == (None, "요약 저장 실패")
+        assert results["https://example.com/0"][0]['summary_id']
+        states = {item['item_key']: item['state'] for item in db.get_batch_run_items(run_id)}
+        assert states["https://example.com/3"] == "failed"
+        assert list(states.values()).count("summarized") == 7
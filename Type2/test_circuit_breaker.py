@@ -0,0 +1,128 @@
+import os
+import sys
+import tempfile
+
+import pytest
+
+# Type2 경로 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import circuit_breaker
+from circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitBreakerRegistry
+from database import NewsDatabase
+
+
+class FakeClock:
+    """time 모듈 대신 쓰는 시계 (advance로만 시간이 흐름)"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(circuit_breaker, "time", fake)
+    return fake
+
+
+def test_breaker_opens_after_threshold(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+    for _ in range(2):
+        assert breaker.allow()
+        breaker.record_failure()
+    assert breaker.state == CLOSED
+
+    # 중간에 성공하면 연속 실패 횟수 초기화
+    breaker.record_success()
+    for _ in range(3):
+        assert breaker.allow()
+        breaker.record_failure()
+    assert breaker.state == OPEN
+    assert not breaker.allow() and not breaker.available()
+    assert breaker.stats() == {'state': OPEN, 'failures': 3, 'retry_in': 60.0, 'rejected': 1}
+
+
+def test_breaker_half_open_trial(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    breaker.record_failure()
+    clock.advance(59)
+    assert not breaker.allow()
+
+    # 대기 시간이 지나면 시험 요청 하나만 허용
+    clock.advance(1)
+    assert breaker.available()
+    assert breaker.allow()
+    assert breaker.state == HALF_OPEN
+    assert not breaker.available() and not breaker.allow()
+
+    # 시험 요청 성공 - 닫힘
+    breaker.record_success()
+    assert breaker.state == CLOSED and breaker.allow()
+
+
+def test_breaker_open_timeout_doubles(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60, max_reset_timeout=200)
+    breaker.record_failure()
+    timeouts = []
+    for _ in range(4):
+        clock.advance(breaker.opened_until - clock.now)
+        assert breaker.allow() and breaker.state == HALF_OPEN
+        breaker.record_failure()  # 시험 요청 실패 - 대기 시간을 두 배로 늘려 다시 열림
+        assert breaker.state == OPEN
+        timeouts.append(breaker.opened_until - clock.now)
+    assert timeouts == [120, 200, 200, 200]
+
+    # 성공하면 대기 시간도 처음 값으로
+    clock.advance(200)
+    assert breaker.allow()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.opened_until - clock.now == 60
+
+
+def test_registry_per_host(clock):
+    registry = CircuitBreakerRegistry(failure_threshold=1)
+    registry.record_failure("https://down.example.com/a")
+    assert not registry.allow("https://DOWN.example.com/b")
+    assert registry.allow("https://up.example.com/a")
+    assert registry.stats()["down.example.com"]['state'] == OPEN
+
+
+def _retry_delay(db: NewsDatabase, url: str) -> int:
+    with db._connect() as conn:
+        row = conn.execute("""
+            SELECT CAST(strftime('%s', retry_at) AS INTEGER) - CAST(strftime('%s', last_failed_at) AS INTEGER)
+            FROM failed_urls WHERE url = ?
+        """, (url,)).fetchone()
+    return row[0]
+
+
+def test_url_failure_backoff():
+    """실패 URL 재시도 대기 시간 = min(base_delay * 2^(실패 횟수 - 1), max_delay)"""
+    url = "https://example.com/a"
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db = NewsDatabase(os.path.join(tmp_dir, "test.db"))
+        assert db.get_url_failure(url) is None
+
+        delays = []
+        for _ in range(4):
+            assert db.record_url_failure(url, "본문 없음", base_delay=100, max_delay=350)
+            delays.append(_retry_delay(db, url))
+        assert delays == [100, 200, 350, 350]
+
+        # 정규화 이전 URL로도 조회, 성공하면 기록 삭제
+        failure = db.get_url_failure(url + "?utm_source=rss")
+        assert failure['failures'] == 4 and failure['last_error'] == "본문 없음"
+        assert db.clear_url_failure(url + "?utm_source=rss")
+        assert db.get_url_failure(url) is None
+
+        # 재시도 시각이 지난 기록은 조회되지 않음
+        db.record_url_failure(url, base_delay=0)
+        assert db.get_url_failure(url) is None
@@ -0,0 +1,89 @@
+import os
+import sys
+import tempfile
+
+# Type2 경로 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from database import NewsDatabase
+
+
+def _status(db: NewsDatabase, task_id: int):
+    with db._connect() as conn:
+        return conn.execute("SELECT status, attempts FROM crawl_tasks WHERE id = ?", (task_id,)).fetchone()
+
+
+def test_claim_complete_and_dedupe():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db = NewsDatabase(os.path.join(tmp_dir, "test.db"))
+        assert db.enqueue_crawl_tasks("article", {"https://example.com/1": {"url": "https://example.com/1"}}) == 1
+        # 같은 키의 작업이 대기 중이면 다시 등록하지 않음
+        assert db.enqueue_crawl_tasks("article", {"https://example.com/1": {"url": "https://example.com/1"}}) == 0
+
+        assert db.claim_crawl_task("w1", kinds=["source"]) is None
+        task = db.claim_crawl_task("w1")
+        assert task['payload'] == {"url": "https://example.com/1"} and task['attempts'] == 1
+        assert db.claim_crawl_task("w2") is None  # 임대 중인 작업은 다른 작업자가 가져가지 않음
+
+        assert not db.complete_crawl_task(task['id'], "w2")
+        assert db.complete_crawl_task(task['id'], "w1")
+        assert tuple(_status(db, task['id'])) == ("done", 1)
+
+
+def test_fail_retry_and_quarantine():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db = NewsDatabase(os.path.join(tmp_dir, "test.db"))
+        db.enqueue_crawl_tasks("source", {"경향신문": {"source_name": "경향신문"}}, max_attempts=2)
+
+        task = db.claim_crawl_task("w1")
+        assert db.fail_crawl_task(task['id'], "w1", "timeout", base_delay=0) == "pending"
+        task = db.claim_crawl_task("w1")
+        assert task['attempts'] == 2
+        assert db.fail_crawl_task(task['id'], "w1", "timeout", base_delay=0) == "quarantined"
+        assert db.claim_crawl_task("w1") is None
+
+        assert db.requeue_quarantined_tasks("source") == 1
+        assert db.claim_crawl_task("w1")['attempts'] == 1
+
+
+def test_expired_lease():
+    """작업자가 처리 중에 죽으면(임대 만료) 다른 작업자가 가져가고, 시도 횟수를 넘으면 격리"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db = NewsDatabase(os.path.join(tmp_dir, "test.db"))
+        db.enqueue_crawl_tasks("article", {"k": {}}, max_attempts=2)
+
+        first = db.claim_crawl_task("w1", lease_seconds=0)
+        second = db.claim_crawl_task("w2", lease_seconds=0)
+        assert second['id'] == first['id'] and second['attempts'] == 2
+        # 임대를 잃은 작업자의 완료 / 실패 / 연장은 반영되지 않음
+        assert not db.complete_crawl_task(first['id'], "w1")
+        assert db.fail_crawl_task(first['id'], "w1", "late") is None
+        assert not db.heartbeat_crawl_task(first['id'], "w1")
+
+        assert db.claim_crawl_task("w3") is None
+        assert tuple(_status(db, first['id'])) == ("quarantined", 2)
+
+
+def test_worker_fails_task_when_save_fails():
+    """목록을 가져왔어도 DB 저장에 실패하면 완료가 아니라 재시도 대상"""
+    from crawl_worker import CrawlWorker
+
+    class FailingSaveDatabase(NewsDatabase):
+        def insert_crawled_news(self, news_list, source=None):
+            print("크롤링된 뉴스 목록 저장 실패: database is locked")
+            return None
+
+    class StubScraper:
+        def scrape_source(self, source):
+            return [{"title": "새 기사", "url": "https://example.com/1", "category": source['category']}]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db = FailingSaveDatabase(os.path.join(tmp_dir, "test.db"))
+        db.enqueue_crawl_tasks("source", {"테스트일보:정치": {"source_name": "테스트일보", "category": "정치"}})
+        worker = CrawlWorker(db, worker_id="w1", kinds=["source"])
+        worker._local.scraper, worker._local.content_scraper = StubScraper(), None
+
+        worker._work_loop(max_tasks=1)
+        with db._connect() as conn:
+            status, last_error = conn.execute("SELECT status, last_error FROM crawl_tasks").fetchone()
+        assert status == "pending" and last_error == "목록 저장 실패"
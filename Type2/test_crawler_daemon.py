@@ -0,0 +1,91 @@
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import Future
+
+# Type2 경로 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import crawler_daemon
+from crawler_daemon import CrawlerDaemon
+from database import NewsDatabase
+
+KEY = ("테스트일보", "정치")
+NEWS = [{"title": "새 기사", "url": "https://example.com/1", "category": "정치", "source_name": "테스트일보"}]
+
+
+class FailingSaveDatabase(NewsDatabase):
+    def insert_crawled_news(self, news_list, source=None):
+        print("크롤링된 뉴스 목록 저장 실패: database is locked")
+        return None
+
+
+def _daemon(db: NewsDatabase) -> CrawlerDaemon:
+    daemon = CrawlerDaemon(db, scraper=object(), min_interval=60, max_interval=3600, jitter=0)
+    daemon.states[KEY] = {'interval': 600, 'rate': 2.0, 'last_polled': 1000.0, 'failures': 0, 'due': 0}
+    return daemon
+
+
+def _result(news_list) -> Future:
+    future = Future()
+    future.set_result(news_list)
+    return future
+
+
+def test_daemon_counts_save_failure_as_failure():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        daemon = _daemon(FailingSaveDatabase(os.path.join(tmp_dir, "test.db")))
+        daemon._handle_result(KEY, _result(NEWS))
+
+        state = daemon.states[KEY]
+        assert daemon.stats == {'polls': 1, 'failures': 1, 'save_failures': 1, 'saved': 0}
+        # 빈도 학습은 건너뛰고 실패처럼 백오프
+        assert state['failures'] == 1 and state['rate'] == 2.0 and state['last_polled'] == 1000.0
+        assert daemon.db.get_source_poll_states()[KEY]['consecutive_failures'] == 1
+
+
+def test_daemon_saves_successful_poll():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        daemon = _daemon(NewsDatabase(os.path.join(tmp_dir, "test.db")))
+        daemon._handle_result(KEY, _result(NEWS))
+        daemon._handle_result(KEY, _result(None))  # 목록 수집 실패
+
+        assert daemon.stats == {'polls': 2, 'failures': 1, 'save_failures': 0, 'saved': 1}
+        assert daemon.db.get_recent_source_urls(*KEY) == {"https://example.com/1"}
+
+
+class SlowScraper:
+    def scrape_source(self, source):
+        time.sleep(0.2)
+        return []
+
+
+def test_daemon_waits_while_workers_are_busy(monkeypatch):
+    """동시 수집 예산이 찼을 때 폴링 시각이 지난 소스가 있어도 wait를 헛돌리지 않아야 함"""
+    calls = []
+    real_wait = crawler_daemon.wait
+
+    def counting_wait(*args, **kwargs):
+        calls.append(kwargs.get('timeout'))
+        return real_wait(*args, **kwargs)
+
+    monkeypatch.setattr(crawler_daemon, "wait", counting_wait)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        daemon = CrawlerDaemon(NewsDatabase(os.path.join(tmp_dir, "test.db")), scraper=SlowScraper(),
+                               concurrency=1, jitter=0)
+        for i in range(4):
+            key = (f"테스트일보{i}", "정치")
+            daemon.sources[key] = {'source_name': key[0], 'category': key[1]}
+            daemon.states[key] = {'interval': 60, 'rate': None, 'last_polled': None, 'failures': 0, 'due': 0}
+
+        # 시그널 핸들러를 바꾸지 않도록 별도 스레드에서 실행
+        runner = threading.Thread(target=daemon.run, kwargs={'once': True})
+        runner.start()
+        runner.join(10)
+
+        assert not runner.is_alive()
+        assert daemon.stats['polls'] == 4
+        # 수집이 하나 끝날 때마다 한 번씩만 기다림
+        assert len(calls) <= 8, f"wait {len(calls)}회 호출"
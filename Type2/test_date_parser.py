@@ -0,0 +1,42 @@
+import os
+import sys
+from datetime import datetime, timezone
+
+# Type2 경로 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from date_parser import find_published, parse_published
+
+NOW = datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def test_parse_published_formats():
+    # ISO 8601 / RFC 822 (시간대 포함)
+    assert parse_published("2024-05-01T09:30:00+09:00", NOW) == "2024-05-01 00:30:00"
+    assert parse_published("2024-04-30T23:00:00Z", NOW) == "2024-04-30 23:00:00"
+    assert parse_published("Wed, 01 May 2024 18:00:00 +0900", NOW) == "2024-05-01 09:00:00"
+    # 한국어 표기 (시간대가 없으면 KST)
+    assert parse_published("2024.05.01 14:32", NOW) == "2024-05-01 05:32:00"
+    assert parse_published("2024-05-01 오후 2:32", NOW) == "2024-05-01 05:32:00"
+    assert parse_published("2024년 5월 1일 오전 12시 5분", NOW) == "2024-04-30 15:05:00"
+    assert parse_published("2024/04/30(화) 09:00:10", NOW) == "2024-04-30 00:00:10"
+    # 상대 표기
+    assert parse_published("3시간 전", NOW) == "2024-05-01 09:00:00"
+    assert parse_published("10분 전", NOW) == "2024-05-01 11:50:00"
+
+
+def test_parse_published_rejects():
+    assert parse_published(None, NOW) is None
+    assert parse_published("", NOW) is None
+    assert parse_published("날짜 없음", NOW) is None
+    assert parse_published("2024.13.40 10:00", NOW) is None
+    # 1시간 넘게 미래인 시각은 버림
+    assert parse_published("2024-05-02T00:00:00+00:00", NOW) is None
+    assert parse_published("2024-05-01T12:30:00+00:00", NOW) == "2024-05-01 12:30:00"
+
+
+def test_find_published():
+    text = "관련 기사 2023.01.02 보도 ... 입력 2024.05.01 14:32 수정 2024.05.01 15:00"
+    assert find_published(text, now=NOW) == "2024-05-01 05:32:00"
+    assert find_published("2023년 1월 2일 발표된 자료에 따르면", labeled_only=True, now=NOW) is None
+    assert find_published("2023년 1월 2일 발표된 자료에 따르면", now=NOW) == "2023-01-01 15:00:00"
@@ -1,6 +1,8 @@
 import os
 import sys
 import sqlite3
+import tempfile
+import time
 
 # Type2 경로 추가
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -8,31 +10,113 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from database import NewsDatabase
 
 def test_type2_bulk_save():
-    db_path = "news_assistant.db"
-    db = NewsDatabase(db_path)
-    
-    # 1. 기존 테이블 및 메서드 확인
-    print("Checking database structure...")
-    
-    # 2. Bulk 저장 테스트
-    test_news = [
-        {"title": "Type2 테스트 뉴스 1", "url": "https://type2-test.com/1", "category": "정치", "source_name": "Type2테스터"},
-        {"title": "Type2 테스트 뉴스 2", "url": "https://type2-test.com/2", "category": "경제", "source_name": "Type2테스터"}
-    ]
-    
-    added_count = db.save_crawled_news(test_news)
-    print(f"✅ {added_count}개의 뉴스가 대량 저장되었습니다.")
-    
-    # 3. 중복 확인
-    added_count_retry = db.save_crawled_news(test_news)
-    print(f"ℹ️ 중복 저장 시도 결과: {added_count_retry}개 추가됨 (0이어야 함)")
-    
-    # 4. 데이터 조회
-    scraped = db.get_scraped_news(limit=5)
-    print(f"✅ 최근 수집된 뉴스 (상위 5개):")
-    for item in scraped:
-        if item['source_name'] == 'Type2테스터':
-            print(f"   - {item['title']} [{item['source_name']}]")
+    """일괄 저장 / 중복 건너뛰기 (임시 DB 사용 - 저장소의 news_assistant.db는 건드리지 않음)"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db = NewsDatabase(os.path.join(tmp_dir, "test.db"))
+        
+        # 1. 기존 테이블 및 메서드 확인
+        print("Checking database structure...")
+        
+        # 2. Bulk 저장 테스트
+        test_news = [
+            {"title": "Type2 테스트 뉴스 1", "url": "https://type2-test.com/1", "category": "정치", "source_name": "Type2테스터"},
+            {"title": "Type2 테스트 뉴스 2", "url": "https://type2-test.com/2", "category": "경제", "source_name": "Type2테스터"}
+        ]
+        
+        added_count = db.save_crawled_news(test_news)
+        print(f"✅ {added_count}개의 뉴스가 대량 저장되었습니다.")
+        assert added_count == 2
+        
+        # 3. 중복 확인
+        added_count_retry = db.save_crawled_news(test_news)
+        print(f"ℹ️ 중복 저장 시도 결과: {added_count_retry}개 추가됨 (0이어야 함)")
+        assert added_count_retry == 0
+        
+        # 4. 데이터 조회
+        scraped = db.get_scraped_news(limit=5)
+        print(f"✅ 최근 수집된 뉴스 (상위 5개):")
+        for item in scraped:
+            if item['source_name'] == 'Type2테스터':
+                print(f"   - {item['title']} [{item['source_name']}]")
+
+def test_type2_bulk_throughput(batch_size=10000):
+    """executemany 기반 일괄 저장 처리량 벤치마크 (임시 DB 사용)"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db = NewsDatabase(os.path.join(tmp_dir, "bench.db"))
+        test_news = [
+            {"title": f"벤치마크 뉴스 {i} 정부 예산안 국회 심의", "url": f"https://bench.example.com/{i}",
+             "category": "정치", "source_name": f"벤치마크{i % 5}"}
+            for i in range(batch_size)
+        ]
+
+        # 1. 신규 저장 (한 번의 호출, 한 트랜잭션)
+        start = time.perf_counter()
+        inserted = db.insert_crawled_news(test_news)
+        elapsed = time.perf_counter() - start
+        print(f"✅ {len(inserted)}건 신규 저장: {elapsed:.2f}초 ({len(inserted) / elapsed:,.0f}건/초)")
+        assert len(inserted) == batch_size
+        assert inserted[0]['url'] == test_news[0]['url'] and inserted[0]['id']
+
+        # 2. 전부 중복인 재저장
+        start = time.perf_counter()
+        added_count_retry = db.save_crawled_news(test_news)
+        elapsed = time.perf_counter() - start
+        print(f"ℹ️ 중복 {batch_size}건 재저장: {elapsed:.2f}초, {added_count_retry}건 추가됨 (0이어야 함)")
+        assert added_count_retry == 0
+
+        # 3. 신규 / 중복 혼합
+        mixed = test_news[:batch_size // 2] + [
+            {"title": f"추가 뉴스 {i}", "url": f"https://bench.example.com/extra/{i}", "category": "경제"}
+            for i in range(batch_size // 2)
+        ]
+        inserted = db.insert_crawled_news(mixed)
+        print(f"✅ 혼합 배치에서 {len(inserted)}건 신규 저장")
+        assert [item['url'] for item in inserted] == [news['url'] for news in mixed[batch_size // 2:]]
+
+def test_seen_urls_recorded_after_save():
+    """목록에서 본 URL은 저장과 같은 트랜잭션에서만 소스별 최근 링에 기록"""
+    from news_extractors import ListingPage
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db = NewsDatabase(os.path.join(tmp_dir, "test.db"))
+        source = {"source_name": "테스트일보", "category": "정치"}
+        page = ListingPage([{"title": "새 기사", "url": "https://example.com/new", "category": "정치",
+                             "source_name": "테스트일보"}],
+                           seen_urls=["https://example.com/new", "https://example.com/old"])
+
+        # 저장 실패 (다른 연결이 쓰기 잠금 보유) - 링에 남지 않아야 다음 수집에서 다시 시도
+        locker = sqlite3.connect(db.db_path)
+        locker.execute("BEGIN IMMEDIATE")
+        connect = db._connect
+        db._connect = lambda: sqlite3.connect(db.db_path, timeout=0.1)
+        assert db.save_crawled_news(page, source) is None
+        db._connect = connect
+        locker.rollback()
+        locker.close()
+        assert db.get_recent_source_urls("테스트일보", "정치") == set()
+
+        assert db.save_crawled_news(page, source) == 1
+        assert db.get_recent_source_urls("테스트일보", "정치") == {"https://example.com/new", "https://example.com/old"}
+
+        # 새 기사가 없어도 본 URL은 기록
+        assert db.save_crawled_news(ListingPage([], seen_urls=["https://example.com/older"]), source) == 0
+        assert "https://example.com/older" in db.get_recent_source_urls("테스트일보", "정치")
+
+def test_get_news_by_urls():
+    """요약본 일괄 조회 - 정규화 이전 URL로 요청해도 찾고, 같은 URL은 최신 요약본"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db = NewsDatabase(os.path.join(tmp_dir, "test.db"))
+        db.save_news_summary("첫 요약", "https://example.com/a", "정치", "테스트", "이전 요약")
+        latest = db.save_news_summary("다시 요약", "https://example.com/a?utm_source=x", "정치", "테스트", "최신 요약")
+        db.save_news_summary("다른 기사", "https://example.com/b", "경제", "테스트", "요약")
+
+        requested = ["https://example.com/a?utm_medium=rss", "https://example.com/b", "https://example.com/none"]
+        found = db.get_news_by_urls(requested)
+        assert set(found) == set(requested[:2])
+        assert found[requested[0]]['id'] == latest and found[requested[0]]['summary'] == "최신 요약"
+        assert found["https://example.com/b"]['title'] == "다른 기사"
+        assert db.get_news_by_urls([]) == {}
 
 if __name__ == "__main__":
     test_type2_bulk_save()
+    test_type2_bulk_throughput()
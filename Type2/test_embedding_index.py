@@ -0,0 +1,148 @@
+import os
+import sys
+import tempfile
+from types import SimpleNamespace
+from typing import List
+
+import numpy as np
+
+# Type2 경로 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from database import NewsDatabase
+from embedding_index import HashingEmbedder, OpenAIEmbedder, VectorIndex
+
+
+class FakeEmbeddingsClient:
+    """OpenAI 클라이언트의 embeddings.create 응답 형식을 흉내내는 대체 객체 (네트워크 호출 없음)"""
+
+    def __init__(self, dim: int = 1536):
+        self._embedder = HashingEmbedder(dim=dim)
+        self.embeddings = self
+        self.calls = 0
+
+    def create(self, model: str, input: List[str]):
+        self.calls += 1
+        vectors = self._embedder.embed(list(input))
+        return SimpleNamespace(
+            model=model,
+            data=[SimpleNamespace(index=i, embedding=vector.tolist()) for i, vector in enumerate(vectors)]
+        )
+
+
+class FailingEmbedder(HashingEmbedder):
+    """API 장애를 흉내내는 임베딩 생성기"""
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        raise RuntimeError("임베딩 API 오류")
+
+
+def _random_vectors(count: int, dim: int, seed: int = 0) -> np.ndarray:
+    vectors = np.random.RandomState(seed).randn(count, dim).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def test_vector_index_search():
+    """전체 탐색: 자기 자신이 최상위, exclude하면 제외"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        vectors = _random_vectors(200, 32)
+        index = VectorIndex(os.path.join(tmp_dir, "test.vectors"), 32, grow_step=64)
+        for row, vector in enumerate(vectors):
+            index.write(row, vector)
+
+        hits = index.search(vectors[7], k=5)
+        assert hits[0][0] == 7 and abs(hits[0][1] - 1.0) < 1e-5
+        assert [score for _, score in hits] == sorted([score for _, score in hits], reverse=True)
+
+        expected = np.argsort(-(vectors @ vectors[7]))[1:6].tolist()
+        assert [row for row, _ in index.search(vectors[7], k=5, exclude=7)] == expected
+
+
+def test_vector_index_ivf():
+    """IVF: 모든 파티션을 탐색하면 전체 탐색과 같은 결과, IVF 생성 이후 추가된 행도 검색"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        vectors = _random_vectors(500, 16, seed=1)
+        index = VectorIndex(os.path.join(tmp_dir, "test.vectors"), 16)
+        for row, vector in enumerate(vectors[:400]):
+            index.write(row, vector)
+        brute_force = index.search(vectors[3], k=10)
+
+        index.build_ivf(n_lists=8)
+        assert sum(len(rows) for rows in index._ivf_lists) == 400
+        assert index.search(vectors[3], k=10, nprobe=8) == brute_force
+        assert index.search(vectors[3], k=1, nprobe=1)[0][0] == 3
+
+        for row, vector in enumerate(vectors[400:], start=400):
+            index.write(row, vector)
+        assert index.search(vectors[450], k=1, nprobe=1)[0][0] == 450
+
+
+def test_openai_embedder_with_fake_client():
+    client = FakeEmbeddingsClient(dim=64)
+    embedder = OpenAIEmbedder(client, dim=64)
+    vectors = embedder.embed(["국회 예산안 통과", ""])
+    assert vectors.shape == (2, 64) and client.calls == 1
+    assert abs(np.linalg.norm(vectors[0]) - 1.0) < 1e-5
+
+
+def test_related_summaries_indexed_in_batch_step():
+    """요약 저장은 임베딩하지 않고, 일괄 단계에서 임베딩한 뒤 관련 기사 조회"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, "test.db")
+        client = FakeEmbeddingsClient(dim=64)
+        db = NewsDatabase(db_path, embedder=OpenAIEmbedder(client, dim=64))
+        ids = [
+            db.save_news_summary(title, f"https://example.com/{i}", "정치", "테스트", summary)
+            for i, (title, summary) in enumerate([
+                ("국회 예산안 본회의 통과", "내년도 예산안이 국회 본회의를 통과했다."),
+                ("예산안 국회 본회의 통과 여야 합의", "여야 합의로 예산안이 본회의를 통과했다."),
+                ("프로야구 개막전 매진", "프로야구 개막전 티켓이 모두 팔렸다."),
+            ])
+        ]
+        assert client.calls == 0
+        assert db.get_related_summaries(ids[0]) == []
+
+        # 임베딩 API가 실패하면 행 번호를 예약하지 않음
+        failing = NewsDatabase(db_path, embedder=FailingEmbedder(dim=64))
+        failing.embedder.name = db.embedder.name
+        assert failing.index_summary_embeddings() == 0
+
+        assert db.index_summary_embeddings() == 3
+        related = db.get_related_summaries(ids[0], k=2)
+        assert [item['id'] for item in related] == [ids[1], ids[2]]
+        assert db.index_summary_embeddings() == 0
+
+
+def test_vector_index_concurrent_write_and_search():
+    """한 스레드가 파일을 늘리며 기록하는 동안 다른 스레드들이 검색해도 오류 없음"""
+    import threading
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        vectors = _random_vectors(600, 16, seed=2)
+        index = VectorIndex(os.path.join(tmp_dir, "test.vectors"), 16, grow_step=8)
+        index.write(0, vectors[0])
+        errors = []
+        done = threading.Event()
+
+        def writer():
+            for row in range(1, len(vectors)):
+                index.write(row, vectors[row])
+            done.set()
+
+        def searcher():
+            try:
+                while not done.is_set():
+                    index.search(vectors[0], k=3)
+                    index.ensure_ivf(min_rows=100, rebuild_ratio=1.5)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=writer)] + [threading.Thread(target=searcher) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert index.count == 600
+        assert index.search(vectors[599], k=1, nprobe=64)[0][0] == 599
@@ -0,0 +1,56 @@
+import json
+import os
+import sys
+
+import pytest
+
+# Type2 경로 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from extraction_pool import ExtractionPool
+from news_extractors import extract_article
+
+SOURCE = {'source_name': '테스트일보', 'url': 'https://example.com/news'}
+LISTING = """<html><body><ul class="news_list">
+<li><a href="/article/1">정부 내년도 예산안 국회 본회의 통과</a></li>
+<li><a href="/article/2">프로야구 개막전 전 구장 매진 기록</a></li>
+</ul></body></html>"""
+ARTICLE = """<html><head><title>예산안 통과</title></head><body>
+<div class="article-content">""" + "정부가 제출한 내년도 예산안이 국회 본회의를 통과했다. " * 10 + """</div>
+</body></html>"""
+JSON_LD_ARTICLE = """<html><head><script type="application/ld+json">%s</script></head><body></body></html>""" % \
+    json.dumps({"@type": "NewsArticle", "headline": "예산안 통과", "articleBody": "예산안이 통과했다. " * 20},
+               ensure_ascii=False)
+
+
+class ParserError:
+    """작업자 프로세스 안에서 RuntimeError를 내는 인자 (spawn 작업자가 이 모듈을 import하여 복원)"""
+
+    def __bool__(self):
+        raise RuntimeError("파서 오류")
+
+
+def test_inline_pool():
+    """workers=0이면 프로세스를 만들지 않고 현재 프로세스에서 파싱"""
+    pool = ExtractionPool(workers=0)
+    page = pool.extract_listing(LISTING, SOURCE, "정치", verbose=False)
+
+    assert [news['url'] for news in page] == ["https://example.com/article/1", "https://example.com/article/2"]
+    assert pool.stats == {'tasks': 0, 'inline': 1}
+    assert pool._executor is None
+
+
+def test_spawn_pool_round_trip():
+    """spawn 작업자 프로세스에서 파싱한 결과가 현재 프로세스에서 파싱한 결과와 같아야 함"""
+    pool = ExtractionPool(workers=1)
+    try:
+        article = pool.extract_article(ARTICLE, "https://example.com/article/1", verbose=False)
+        assert article == extract_article(ARTICLE, "https://example.com/article/1", verbose=False)
+        assert article['content'].startswith("정부가 제출한")
+
+        # 작업자에서 난 추출 오류는 현재 프로세스에서 다시 파싱하지 않고 그대로 전달
+        with pytest.raises(RuntimeError, match="파서 오류"):
+            pool.extract_article(JSON_LD_ARTICLE, "https://example.com/article/1", verbose=ParserError())
+        assert pool.stats == {'tasks': 2, 'inline': 0}
+    finally:
+        pool.shutdown()
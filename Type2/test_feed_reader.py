@@ -0,0 +1,60 @@
+import os
+import sys
+
+# Type2 경로 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from feed_reader import parse_feed
+
+SOURCE = {'source_name': '테스트일보', 'url': 'https://www.example.com/news'}
+
+RSS = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><title>테스트일보</title>
+  <item><title>첫 번째 기사</title><link>https://www.example.com/a/1?utm_source=rss</link>
+        <pubDate>Wed, 01 May 2024 18:00:00 +0900</pubDate></item>
+  <item><title>두 번째 기사</title><guid>https://www.example.com/a/2</guid></item>
+  <item><title>중복 기사</title><link>https://www.example.com/a/1#comments</link></item>
+  <item><title>링크 없는 기사</title></item>
+</channel></rss>"""
+
+ATOM = """<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom"><title>피드</title>
+  <entry><title>아톰 기사</title><link rel="alternate" href="/a/3"/>
+         <updated>2024-05-01T09:00:00+09:00</updated></entry>
+</feed>"""
+
+SITEMAP = """<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
+        xmlns:news="http://www.google.com/schemas/sitemap-news/0.9">
+  <url><loc>https://www.example.com/a/4</loc>
+    <news:news><news:publication_date>2024-05-01T10:00:00+09:00</news:publication_date>
+      <news:title>사이트맵 기사</news:title></news:news></url>
+</urlset>"""
+
+
+def test_parse_rss():
+    page = parse_feed(RSS, SOURCE, "정치", verbose=False)
+    assert [item['url'] for item in page] == ["https://www.example.com/a/1", "https://www.example.com/a/2"]
+    assert page[0]['published_at'] == "2024-05-01 09:00:00"
+    assert page[1]['published_at'] is None
+    assert page[0]['source_name'] == '테스트일보' and page[0]['category'] == "정치"
+
+
+def test_parse_atom_and_sitemap():
+    page = parse_feed(ATOM, SOURCE, "경제", verbose=False)
+    assert page[0]['url'] == "https://www.example.com/a/3"
+    assert page[0]['published_at'] == "2024-05-01 00:00:00"
+
+    page = parse_feed(SITEMAP.encode('utf-8'), SOURCE, "사회", verbose=False)
+    assert page[0]['title'] == "사이트맵 기사"
+    assert page[0]['published_at'] == "2024-05-01 01:00:00"
+
+
+def test_parse_feed_known_urls_and_invalid():
+    page = parse_feed(RSS, SOURCE, "정치", known_urls={"https://www.example.com/a/1"}, verbose=False)
+    assert [item['url'] for item in page] == ["https://www.example.com/a/2"]
+    assert page.known_count == 1 and len(page.seen_urls) == 2
+
+    assert parse_feed(RSS, SOURCE, "정치", max_items=1, verbose=False)[0]['title'] == "첫 번째 기사"
+    assert parse_feed("<html><body>뉴스</body></html>", SOURCE, "정치", verbose=False) is None
+    assert parse_feed("<rss><channel>", SOURCE, "정치", verbose=False) is None
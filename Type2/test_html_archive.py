@@ -0,0 +1,97 @@
+import gzip
+import os
+import sqlite3
+import struct
+import sys
+import tempfile
+
+# Type2 경로 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import text_compression
+from html_archive import HtmlArchive, _build_record, read_record
+from text_compression import CODEC_ZLIB, default_codec
+
+
+def _page(i: int) -> bytes:
+    return ("<html><head><title>테스트일보</title><script src='/static/common.js'></script></head><body>"
+            "<nav class='gnb'><a href='/politics'>정치</a><a href='/economy'>경제</a><a href='/society'>사회</a></nav>"
+            f"<div class='article-content'>{i}번째 기사 본문입니다.</div>"
+            "<footer>Copyright 테스트일보. All rights reserved.</footer></body></html>").encode('utf-8')
+
+
+def _header(record: dict) -> tuple:
+    """레코드가 기록된 압축 블롭 헤더 (매직, 코덱, 사전 ID)"""
+    with open(os.path.join(record['root'], record['segment']), 'rb') as f:
+        f.seek(record['offset'])
+        return struct.unpack(">BBI", f.read(6))
+
+
+def test_round_trip():
+    """UTF-8이 아닌 본문도 그대로 보관 / 조회"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        archive = HtmlArchive(tmp_dir)
+        body = "<html>한글 본문</html>".encode('euc-kr')
+        record_id = archive.put("https://example.com/a/1", body, "article", "테스트일보", "정치",
+                                headers={'Content-Type': "text/html; charset=euc-kr"})
+        archive.put("https://example.com/a/1", _page(1), "article")
+
+        record = archive.get(record_id)
+        assert record['body'] == body and record['status_code'] == 200
+        assert record['headers']['Content-Type'] == "text/html; charset=euc-kr"
+        assert record['warc_headers']['WARC-News-Source'] == "테스트일보"
+        assert archive.get_latest("https://example.com/a/1")['body'] == _page(1)
+
+        # 재추출 작업자처럼 보관소 경로와 인덱스 정보만으로 읽기
+        entry = archive.entries()[0]
+        assert read_record(tmp_dir, entry['segment'], entry['offset'], entry['length'])['body'] == _page(1)
+        assert entry['segment'].endswith(".warc.cmp")
+        archive.close()
+
+
+def test_train_dictionary():
+    """학습한 사전은 이후 보관분부터 쓰고, 이전 레코드는 사전 없이 그대로 읽음"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        archive = HtmlArchive(tmp_dir)
+        assert archive.train_dictionary(min_samples=5) is None  # 레코드 부족
+
+        for i in range(10):
+            archive.put(f"https://example.com/a/{i}", _page(i), "article")
+        dictionary_id = archive.train_dictionary(min_samples=5)
+        assert dictionary_id
+        new_id = archive.put("https://example.com/a/100", _page(100), "article")
+        archive.close()
+
+        entries = {entry['url']: dict(entry, root=tmp_dir) for entry in HtmlArchive(tmp_dir).entries()}
+        assert _header(entries["https://example.com/a/0"])[2] == 0
+        assert _header(entries["https://example.com/a/100"])[2] == dictionary_id
+
+        # 다시 연 보관소도 최신 사전으로 압축, 사전 레코드는 압축 전보다 작아야 함
+        reopened = HtmlArchive(tmp_dir)
+        assert reopened.compressor.current_dictionary_id == dictionary_id
+        assert reopened.get(new_id)['body'] == _page(100)
+        assert entries["https://example.com/a/100"]['length'] < entries["https://example.com/a/9"]['length']
+        reopened.close()
+
+
+def test_legacy_gzip_segment():
+    """이전 형식(레코드마다 gzip 멤버) 세그먼트도 읽을 수 있어야 함"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        archive = HtmlArchive(tmp_dir)
+        record = gzip.compress(_build_record("https://example.com/old", _page(0), 200, None, {}))
+        with open(os.path.join(tmp_dir, "segment-old.warc.gz"), 'wb') as f:
+            f.write(record)
+        with sqlite3.connect(archive.index_path) as conn:
+            conn.execute("""
+                INSERT INTO archive_records (url, kind, status_code, segment, offset, length)
+                VALUES (?, 'article', 200, 'segment-old.warc.gz', 0, ?)
+            """, ("https://example.com/old", len(record)))
+
+        assert archive.get_latest("https://example.com/old")['body'] == _page(0)
+        archive.close()
+
+
+def test_default_codec(monkeypatch):
+    """zstandard가 없으면 zlib"""
+    monkeypatch.setattr(text_compression, "zstandard", None)
+    assert default_codec() == CODEC_ZLIB
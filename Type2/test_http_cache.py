@@ -0,0 +1,120 @@
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+
+import requests
+
+# Type2 경로 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from http_cache import CachingAdapter, HttpCacheStore
+from news_content_scraper import ARTICLE_DEFAULT_MIN_FRESHNESS, NewsContentScraper
+from news_scraper import LISTING_DEFAULT_MIN_FRESHNESS, NewsScraper
+
+
+class StubAdapter(CachingAdapter):
+    """네트워크 대신 정해 둔 응답을 돌려주는 캐시 어댑터"""
+
+    def __init__(self, store, headers, **kwargs):
+        super().__init__(store, **kwargs)
+        self.headers = headers
+        self.network_calls = 0
+
+    def _send_network(self, request, **kwargs):
+        self.network_calls += 1
+        response = requests.Response()
+        response.status_code = 200
+        response.headers.update(self.headers)
+        response._content = "<html>기사 본문</html>".encode('utf-8')
+        response.url = request.url
+        response.request = request
+        return response
+
+
+def _session(adapter):
+    session = requests.Session()
+    session.mount("https://", adapter)
+    return session
+
+
+def test_cache_honors_server_headers_by_default():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        store = HttpCacheStore(os.path.join(tmp_dir, "cache.db"))
+        for cache_control, expected_calls in [("max-age=600", 1), ("no-store", 3), ("private, max-age=600", 3)]:
+            adapter = StubAdapter(store, {'Cache-Control': cache_control}, default_min_freshness=3600)
+            session = _session(adapter)
+            for _ in range(3):
+                session.get(f"https://news.example.com/{len(cache_control)}")
+            assert adapter.network_calls == expected_calls, cache_control
+
+        # 호스트별로 명시한 경우에만 no-store 응답도 재사용
+        adapter = StubAdapter(store, {'Cache-Control': 'no-store'}, min_freshness={'news.example.com': 60})
+        session = _session(adapter)
+        assert not session.get("https://news.example.com/forced").from_cache
+        assert session.get("https://news.example.com/forced").from_cache
+        assert adapter.network_calls == 1
+
+
+def test_default_min_freshness_only_without_cache_headers():
+    """캐시 헤더가 없는 페이지만 default_min_freshness 동안 재사용 (곧바로 다시 수집해도 내려받지 않음)"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        store = HttpCacheStore(os.path.join(tmp_dir, "cache.db"))
+        cases = [({}, 1), ({'Cache-Control': 'public'}, 1), ({'Cache-Control': 'no-cache'}, 3),
+                 ({'Cache-Control': 'max-age=0'}, 3), ({'Expires': '0'}, 3), ({'Cache-Control': 'no-store'}, 3)]
+        for i, (headers, expected_calls) in enumerate(cases):
+            adapter = StubAdapter(store, headers, default_min_freshness=60)
+            session = _session(adapter)
+            for _ in range(3):
+                session.get(f"https://news.example.com/page/{i}")
+            assert adapter.network_calls == expected_calls, headers
+
+        # 스크래퍼 세션은 기본값으로 캐시 헤더 없는 목록 / 기사 페이지를 재사용
+        scraper = NewsScraper(archive=False, http_cache=store)
+        content_scraper = NewsContentScraper(archive=False, http_cache=store)
+        assert scraper.http_cache.default_min_freshness == LISTING_DEFAULT_MIN_FRESHNESS > 0
+        assert content_scraper.http_cache.default_min_freshness == ARTICLE_DEFAULT_MIN_FRESHNESS > 0
+
+
+def test_cache_errors_fall_back_to_network():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # 캐시 파일을 만들 수 없는 경로
+        store = HttpCacheStore(os.path.join(tmp_dir, "missing", "cache.db"))
+        adapter = StubAdapter(store, {'Cache-Control': 'max-age=600'})
+        assert _session(adapter).get("https://news.example.com/a").status_code == 200
+
+        # 다른 프로세스가 쓰기 잠금을 잡고 있는 캐시 파일
+        path = os.path.join(tmp_dir, "cache.db")
+        store = HttpCacheStore(path, timeout=0.1)
+        adapter = StubAdapter(store, {'Cache-Control': 'max-age=600'})
+        locker = sqlite3.connect(path)
+        locker.execute("BEGIN IMMEDIATE")
+        response = _session(adapter).get("https://news.example.com/b")
+        assert response.status_code == 200 and not response.from_cache
+        locker.rollback()
+        locker.close()
+        assert _session(adapter).get("https://news.example.com/b").status_code == 200
+
+
+def test_cache_hits_batch_writes_and_count_safely():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        store = HttpCacheStore(os.path.join(tmp_dir, "cache.db"), flush_every=1000)
+        adapter = StubAdapter(store, {'Cache-Control': 'max-age=600'})
+        session = _session(adapter)
+        session.get("https://news.example.com/c")
+
+        def fetch():
+            for _ in range(50):
+                session.get("https://news.example.com/c")
+
+        threads = [threading.Thread(target=fetch) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert adapter.network_calls == 1
+        assert adapter.stats()['hits'] == 200 and adapter.stats()['misses'] == 1
+        stats = store.stats()
+        assert stats['hits'] == 200 and stats['stored'] == 1 and stats['entries'] == 1
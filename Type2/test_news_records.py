@@ -0,0 +1,50 @@
+import os
+import sqlite3
+import sys
+import time
+
+# Type2 경로 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from news_records import NewsSummary, Record
+
+
+def test_record_from_cursor():
+    """슬롯 컬럼은 슬롯에, 슬롯에 없는 컬럼은 _extra에 저장"""
+    cursor = sqlite3.connect(":memory:").cursor()
+    cursor.execute("SELECT 1 AS id, '제목' AS title, 0.5 AS similarity, NULL AS summary")
+    record = NewsSummary.from_cursor(cursor)[0]
+
+    assert record.to_dict() == {'id': 1, 'title': '제목', 'summary': None, 'similarity': 0.5}
+    assert record['similarity'] == 0.5 and record._extra == {'similarity': 0.5}
+    # 조회하지 않은 컬럼은 키 목록에 없음
+    assert 'url' not in record and record.get('url', '-') == '-'
+
+    cursor.execute("SELECT 2 AS id, 'x' AS \"snippet text\"")
+    record = Record.from_row(cursor, cursor.fetchone())
+    assert record.to_dict() == {'id': 2, 'snippet text': 'x'}
+
+
+def test_record_throughput(rows=100000):
+    """행 객체 생성 비용 벤치마크 (dict(zip(columns, row))와 비교)"""
+    columns = NewsSummary.fields
+    data = [tuple(range(len(columns)))] * rows
+
+    start = time.perf_counter()
+    dicts = [dict(zip(columns, row)) for row in data]
+    dict_elapsed = time.perf_counter() - start
+
+    # from_cursor와 같이 컬럼 튜플당 변환 함수를 한 번만 찾음
+    start = time.perf_counter()
+    make = NewsSummary._maker(columns)
+    records = [make(row) for row in data]
+    record_elapsed = time.perf_counter() - start
+
+    print(f"✅ {rows:,}행 변환: dict {dict_elapsed:.3f}초, 레코드 {record_elapsed:.3f}초")
+    assert records[-1].to_dict() == dicts[-1]
+    assert record_elapsed < dict_elapsed * 1.5
+
+
+if __name__ == "__main__":
+    test_record_from_cursor()
+    test_record_throughput()
@@ -0,0 +1,59 @@
+import os
+import sys
+import threading
+import time
+
+# Type2 경로 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from pipeline import Pipeline, Stage
+
+
+def test_pipeline_results_and_failures():
+    def fetch(job):
+        if job['n'] == 3:
+            raise ValueError("fetch 실패")
+        job['fetched'] = True
+        return job
+
+    def parse(job):
+        if job['n'] == 5:
+            return None  # 결과 없이 버림
+        job['parsed'] = job['n'] * 10
+        return job
+
+    pipeline = Pipeline([Stage("fetch", fetch, workers=3), Stage("parse", parse, workers=2)])
+    results = list(pipeline.run({'n': n} for n in range(10)))
+
+    done = sorted(job['n'] for job in results if 'error' not in job)
+    failed = [job for job in results if 'error' in job]
+    assert done == [0, 1, 2, 4, 6, 7, 8, 9]
+    assert all(job['parsed'] == job['n'] * 10 for job in results if 'error' not in job)
+    assert len(failed) == 1 and failed[0]['failed_stage'] == "fetch" and failed[0]['error'] == "fetch 실패"
+
+    stats = pipeline.stats()
+    assert stats['fetch'] == {**stats['fetch'], 'processed': 10, 'failed': 1, 'workers': 3}
+    assert stats['parse']['processed'] == 9 and stats['parse']['failed'] == 0
+
+
+def test_pipeline_backpressure_and_stop():
+    """뒤 단계가 느리면 입력을 끝까지 읽지 않고, 받는 도중 멈추면 작업자가 정리됨"""
+    consumed = []
+
+    def jobs():
+        for n in range(1000):
+            consumed.append(n)
+            yield {'n': n}
+
+    def slow(job):
+        time.sleep(0.01)
+        return job
+
+    pipeline = Pipeline([Stage("fast", lambda job: job, workers=1, queue_size=2), Stage("slow", slow, workers=1)])
+    before = threading.active_count()
+    results = pipeline.run(jobs())
+    first = [next(results)['n'] for _ in range(3)]
+    assert first == [0, 1, 2]
+    assert len(consumed) < 20  # 큐 크기 + 작업자 수 정도만 미리 읽음
+    results.close()
+    assert threading.active_count() == before
@@ -0,0 +1,144 @@
+import os
+import sys
+import threading
+
+import pytest
+
+# Type2 경로 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import politeness
+from politeness import PolitenessScheduler, parse_retry_after
+
+URL = "https://news.example.com/article/1"
+HOST = "news.example.com"
+
+
+class FakeClock:
+    """time 모듈 대신 쓰는 시계 (advance로만 시간이 흐름)"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(politeness, "time", fake)
+    return fake
+
+
+def _limit(scheduler: PolitenessScheduler) -> float:
+    return scheduler._hosts[HOST].limit
+
+
+def _complete(scheduler: PolitenessScheduler, clock: FakeClock, status=200, latency=0.1, retry_after=None):
+    """1초 뒤 요청 하나를 보내고 결과 반영 (가짜 시계는 멈춰 있으므로 기다리지 않고 확보해야 함)"""
+    clock.advance(1)
+    assert scheduler.acquire(URL, timeout=0)
+    scheduler.release(URL, status, latency, retry_after)
+
+
+def test_token_bucket_refill(clock):
+    scheduler = PolitenessScheduler(rate=2.0, burst=4, initial_concurrency=8)
+    for _ in range(4):
+        assert scheduler.acquire(URL, timeout=0)
+    # 순간 허용량을 다 쓰면 토큰이 찰 때까지 대기
+    assert not scheduler.acquire(URL, timeout=0)
+
+    clock.advance(0.5)  # 초당 2개 - 토큰 1개
+    assert scheduler.acquire(URL, timeout=0)
+    assert not scheduler.acquire(URL, timeout=0)
+
+    # 오래 쉬어도 burst개까지만 쌓임
+    clock.advance(60)
+    for _ in range(3):
+        assert scheduler.acquire(URL, timeout=0)
+    assert scheduler.stats()[HOST]['in_flight'] == 8
+    assert not scheduler.acquire(URL, timeout=0)  # 이번에는 동시 요청 한도
+
+
+def test_aimd_decrease_and_increase(clock):
+    scheduler = PolitenessScheduler(rate=2.0, initial_concurrency=4, max_concurrency=5, target_latency=3.0)
+
+    # 정상 응답: 현재 한도만큼 성공하면 한도 +1 (덧셈 증가), 상한은 max_concurrency
+    _complete(scheduler, clock)
+    assert _limit(scheduler) == pytest.approx(4.25)
+    for _ in range(10):
+        _complete(scheduler, clock)
+    assert _limit(scheduler) == 5
+
+    # 연결 오류 / 5xx / 느린 응답은 한도 절반 (곱셈 감소), 속도는 유지
+    _complete(scheduler, clock, status=None, latency=None)
+    assert _limit(scheduler) == 2.5
+    _complete(scheduler, clock, status=500)
+    assert _limit(scheduler) == 1.25
+    _complete(scheduler, clock, latency=60)  # 평균 응답 시간이 target_latency 초과
+    assert _limit(scheduler) == 1.0  # 최소 1
+    stats = scheduler.stats()[HOST]
+    assert stats['errors'] == 2 and stats['rate'] == 2.0 and stats['blocked_for'] == 0
+
+
+def test_retry_after_blocks_host(clock):
+    scheduler = PolitenessScheduler(rate=2.0, burst=4, max_retry_after=120)
+    assert scheduler.acquire(URL, timeout=0)
+    scheduler.release(URL, 429, retry_after=30)
+
+    # Retry-After 동안 해당 호스트만 중단, 속도와 한도는 절반
+    stats = scheduler.stats()[HOST]
+    assert stats['blocked_for'] == 30 and stats['rate'] == 1.0 and stats['throttled'] == 1
+    assert not scheduler.acquire(URL, timeout=0)
+    assert scheduler.acquire("https://other.example.com/", timeout=0)
+    clock.advance(29.9)
+    assert not scheduler.acquire(URL, timeout=0)
+    clock.advance(0.1)
+    assert scheduler.acquire(URL, timeout=0)
+
+    # 너무 긴 Retry-After는 max_retry_after까지만, 헤더가 없으면 연속 횟수에 따른 지수 백오프
+    scheduler.release(URL, 503, retry_after=3600)
+    assert scheduler.stats()[HOST]['blocked_for'] == 120
+    clock.advance(120)
+    assert scheduler.acquire(URL, timeout=0)
+    scheduler.release(URL, 503)
+    assert scheduler.stats()[HOST]['blocked_for'] == 8  # 연속 세 번째 - 2^3초
+
+
+def test_concurrency_limit_recovery(clock):
+    scheduler = PolitenessScheduler(rate=100.0, burst=10, initial_concurrency=4, max_concurrency=4)
+    _complete(scheduler, clock, status=429, retry_after=0)
+    _complete(scheduler, clock, status=429, retry_after=0)
+    assert _limit(scheduler) == 1.0 and scheduler.stats()[HOST]['rate'] == 25.0
+
+    # 한도 1에서 하나가 처리 중이면 다음 요청은 반환될 때까지 대기
+    clock.advance(10)
+    assert scheduler.acquire(URL, timeout=0)
+    assert not scheduler.acquire(URL, timeout=0)
+    acquired = []
+    waiter = threading.Thread(target=lambda: acquired.append(scheduler.acquire(URL, timeout=5)))
+    waiter.start()
+    scheduler.release(URL, 200, latency=0.1)
+    waiter.join(5)
+    assert acquired == [True]
+    scheduler.release(URL, 200, latency=0.1)
+
+    # 성공이 이어지면 한도가 다시 늘어 동시 요청 가능 (속도도 설정값까지 회복)
+    for _ in range(6):
+        _complete(scheduler, clock)
+    assert int(_limit(scheduler)) >= 3
+    assert scheduler.acquire(URL, timeout=0) and scheduler.acquire(URL, timeout=0)
+    assert scheduler.stats()[HOST]['rate'] == 100.0
+
+
+def test_parse_retry_after(clock):
+    assert parse_retry_after("120") == 120.0
+    assert parse_retry_after("Thu, 01 Jan 1970 00:17:10 GMT") == 30.0  # 시계 1000초 기준
+    assert parse_retry_after("곧") is None and parse_retry_after(None) is None
@@ -0,0 +1,54 @@
+import os
+import sys
+import tempfile
+
+# Type2 경로 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from database import NewsDatabase
+
+SOURCE = {"source_name": "테스트일보", "category": "정치"}
+
+
+def _news(url: str, title: str, source_name: str = "테스트일보"):
+    return {"title": title, "url": url, "category": "정치", "source_name": source_name}
+
+
+def test_same_story_shares_cluster():
+    """언론사가 달라도 같은 사건 기사는 같은 클러스터, 다른 사건은 별도 클러스터"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db = NewsDatabase(os.path.join(tmp_dir, "test.db"))
+        inserted = db.insert_crawled_news([
+            _news("https://a.example.com/1", "[속보] 정부 내년도 예산안 국회 본회의 통과"),
+            _news("https://b.example.com/1", "정부 내년도 예산안 국회 본회의 통과 (종합)", "다른일보"),
+            _news("https://a.example.com/2", "프로야구 개막전 전 구장 매진 기록"),
+        ])
+        clusters = db.get_cluster_ids([news['url'] for news in inserted])
+
+        first = inserted[0]['id']
+        assert clusters["https://a.example.com/1"] == first
+        assert clusters["https://b.example.com/1"] == first
+        assert clusters["https://a.example.com/2"] == inserted[2]['id']
+
+
+def test_rolled_back_save_leaves_no_clusters():
+    """저장이 롤백되면 그 배치로 만든 클러스터가 메모리에 남지 않아야 함 (롤백된 id는 다음 저장에서 재사용됨)"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db = NewsDatabase(os.path.join(tmp_dir, "test.db"))
+        assert db.save_crawled_news([_news("https://a.example.com/1", "정부 내년도 예산안 국회 본회의 통과")]) == 1
+
+        # 클러스터 배정 후 커밋 전에 실패 - 트랜잭션 전체 롤백
+        def fail(*args, **kwargs):
+            raise RuntimeError("database is locked")
+
+        db._remember_source_urls = fail
+        assert db.save_crawled_news([_news("https://a.example.com/2", "대통령 중동 순방길 올라")], SOURCE) is None
+        del db._remember_source_urls
+
+        # 롤백된 기사의 id를 다른 사건 기사가 이어받음
+        reused = db.insert_crawled_news([_news("https://a.example.com/3", "프로야구 개막전 전 구장 매진 기록")])
+        latest = db.insert_crawled_news([_news("https://a.example.com/4", "대통령 중동 순방길 올라 첫 일정")])
+        clusters = db.get_cluster_ids(["https://a.example.com/3", "https://a.example.com/4"])
+
+        assert clusters["https://a.example.com/3"] == reused[0]['id']
+        assert clusters["https://a.example.com/4"] == latest[0]['id']
@@ -0,0 +1,71 @@
+import multiprocessing
+import os
+import sys
+import tempfile
+
+# Type2 경로 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from url_bloom import ScalableBloomFilter
+
+
+def _add_range(path: str, start: int, count: int) -> int:
+    bloom = ScalableBloomFilter(path, initial_capacity=200)
+    added = sum(1 for i in range(start, start + count) if bloom.add(f"https://example.com/p/{i}"))
+    bloom.close()
+    return added
+
+
+def test_bloom_filter_grows_without_false_negatives():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        bloom = ScalableBloomFilter(os.path.join(tmp_dir, "urls.bloom"), initial_capacity=100, error_rate=0.01)
+        urls = [f"https://example.com/news/{i}" for i in range(1000)]
+        # 추가 시점에 이미 '있음'으로 판정된(오탐) 항목은 새로 추가되지 않음
+        added = bloom.update(urls)
+        assert added > 950
+        assert all(url in bloom for url in urls)
+        assert not bloom.add(urls[0])
+
+        stats = bloom.stats()
+        assert stats['items'] == added and stats['slices'] > 1 and stats['capacity'] >= 1000
+        false_positives = sum(f"https://example.com/other/{i}" in bloom for i in range(2000))
+        print(f"ℹ️ 오탐 {false_positives}/2000건, 예상 오탐률 {stats['expected_fp_rate']:.4f}")
+        assert false_positives / 2000 < 0.05
+        bloom.close()
+
+
+def test_bloom_filter_shared_file():
+    """같은 파일을 연 다른 인스턴스(다른 프로세스 역할)가 추가한 항목과 슬라이스를 봄"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "urls.bloom")
+        writer = ScalableBloomFilter(path, initial_capacity=50)
+        reader = ScalableBloomFilter(path)
+        assert writer.created and not reader.created
+
+        added = writer.update(f"https://example.com/{i}" for i in range(500))
+        assert "https://example.com/499" in reader
+        assert reader.stats()['slices'] == writer.stats()['slices'] > 1
+
+        reader.record_lookups(absent=10, false_positives=1)
+        stats = writer.stats()
+        assert stats['absent_lookups'] == 10 and stats['measured_fp_rate'] == 0.1
+        writer.close()
+        reader.close()
+
+        reopened = ScalableBloomFilter(path)
+        assert "https://example.com/0" in reopened and reopened.stats()['items'] == added
+        reopened.close()
+
+
+def test_bloom_filter_multiple_processes():
+    """여러 프로세스가 동시에 추가하며 슬라이스를 늘려도 항목을 잃지 않음 (파일 잠금)"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "urls.bloom")
+        ScalableBloomFilter(path, initial_capacity=200).close()
+        with multiprocessing.get_context("spawn").Pool(4) as pool:
+            added = sum(pool.starmap(_add_range, [(path, n * 1000, 1000) for n in range(4)]))
+
+        bloom = ScalableBloomFilter(path)
+        assert all(f"https://example.com/p/{i}" in bloom for i in range(4000))
+        assert bloom.stats()['items'] == added > 3900
+        bloom.close()
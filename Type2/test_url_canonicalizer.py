@@ -0,0 +1,35 @@
+import os
+import sys
+
+# Type2 경로 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from url_canonicalizer import canonicalize_url, lookup_urls
+
+
+def test_canonicalize_url():
+    # 상대 경로 / 호스트 대소문자 / 기본 포트 / 프래그먼트
+    assert canonicalize_url("/news/1?b=2&a=1#top", "HTTPS://Example.COM:443/list") == \
+        "https://example.com/news/1?a=1&b=2"
+    assert canonicalize_url("http://example.com:8080/a") == "http://example.com:8080/a"
+    # 추적용 파라미터 제거, 규칙이 없는 모바일 호스트는 그대로 유지
+    assert canonicalize_url("https://m.example.com/a?utm_source=x&id=3&fbclid=y") == \
+        "https://m.example.com/a?id=3"
+    assert canonicalize_url("https://m.news.naver.com/article/001/0014") == \
+        "https://m.news.naver.com/article/001/0014"
+    # 사이트별 규칙 (대표 호스트, https, 추가 제거 파라미터)
+    assert canonicalize_url("http://m.hankookilbo.com/News/Read/A2024?did=NA&rPrev=1") == \
+        "https://www.hankookilbo.com/News/Read/A2024"
+    # 퍼센트 인코딩은 디코딩하지 않고 대문자로만 통일 (EUC-KR 값 보존)
+    assert canonicalize_url("https://example.com/search?q=%b1%b9") == "https://example.com/search?q=%B1%B9"
+    # http(s)가 아니거나 해석할 수 없는 URL
+    assert canonicalize_url("javascript:void(0)") is None
+    assert canonicalize_url("mailto:a@example.com") is None
+    assert canonicalize_url("http://example.com:99999/") is None
+    assert canonicalize_url("") is None
+
+
+def test_lookup_urls():
+    assert lookup_urls("https://example.com/a") == ["https://example.com/a"]
+    assert lookup_urls("https://example.com/a?utm_medium=rss") == \
+        ["https://example.com/a", "https://example.com/a?utm_medium=rss"]
@@ -0,0 +1,180 @@
+"""
+기사 본문 / 원본 HTML 압축 저장 (기본: zstandard가 있으면 zstd, 없으면 zlib 프리셋 사전 압축)
+
+압축 블롭마다 헤더에 코덱과 사전 ID를 기록하므로, 기본 코덱이 바뀌어도 이전에 저장한 블롭은 그대로 읽습니다.
+(zstd로 저장한 블롭을 읽으려면 zstandard 패키지가 필요)
+"""
+import re
+import struct
+import threading
+import zlib
+from collections import Counter
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+try:
+    import zstandard
+except ImportError:  # 선택 의존성 - 없으면 zlib으로 압축
+    zstandard = None
+
+CODEC_ZLIB = 1
+CODEC_ZSTD = 2
+
+# 압축 블롭 헤더: 매직 바이트, 코덱, 사전 ID (0 = 사전 없음)
+_MAGIC = 0xC7
+_HEADER = struct.Struct(">BBI")
+
+# zlib 프리셋 사전은 압축 창 크기(32KB)까지만 의미가 있음
+ZLIB_DICTIONARY_SIZE = 32 * 1024
+
+_SEGMENT_PATTERN = re.compile(rb'[^\n.!?>]*[\n.!?>]')
+
+
+def default_codec() -> int:
+    return CODEC_ZSTD if zstandard is not None else CODEC_ZLIB
+
+
+def train_dictionary(samples: Iterable[Union[str, bytes]], codec: int = None,
+                     size: int = ZLIB_DICTIONARY_SIZE) -> bytes:
+    """샘플 본문/HTML로 압축 사전 생성 (zstd: 내장 학습기, zlib: 반복 구간 빈도 기반)"""
+    codec = codec or default_codec()
+    data = [s.encode('utf-8') if isinstance(s, str) else bytes(s) for s in samples if s]
+    if codec == CODEC_ZSTD:
+        if zstandard is None:
+            raise RuntimeError("zstd 사전을 만들려면 zstandard 패키지가 필요합니다.")
+        return zstandard.train_dictionary(size, data).as_bytes()
+    return _train_zlib_dictionary(data, min(size, ZLIB_DICTIONARY_SIZE))
+
+
+def _train_zlib_dictionary(samples: List[bytes], size: int) -> bytes:
+    """여러 샘플에 반복해서 나오는 문장/태그 구간을 모아 프리셋 사전 구성
+
+    (등장 문서 수 - 1) * 길이가 큰 구간부터 담고, zlib은 가까운 거리의 일치를 더 싸게
+    부호화하므로 가장 유용한 구간이 사전 끝에 오도록 배치합니다.
+    """
+    doc_freq: Counter = Counter()
+    for sample in samples:
+        segments = {segment.strip() for segment in _SEGMENT_PATTERN.findall(sample)}
+        doc_freq.update(segment for segment in segments if 8 <= len(segment) <= 512)
+
+    scored = sorted(((freq - 1) * len(segment), segment) for segment, freq in doc_freq.items() if freq > 1)
+    chosen: List[bytes] = []
+    total = 0
+    for _, segment in reversed(scored):
+        if total + len(segment) + 1 > size:
+            continue
+        chosen.append(segment)
+        total += len(segment) + 1
+    return b"\n".join(reversed(chosen))
+
+
+class TextCompressor:
+    def __init__(self, codec: int = None, level: int = None, min_size: int = 256,
+                 dictionary_loader: Callable[[int], Optional[Tuple[int, bytes]]] = None):
+        """텍스트 압축기 초기화
+
+        min_size: 이 바이트 수 미만의 텍스트는 압축하지 않고 그대로 저장
+        dictionary_loader: 모르는 사전 ID를 만났을 때 (codec, data)를 돌려주는 함수 (다른 프로세스가 학습한 사전용)
+        """
+        self.codec = codec or default_codec()
+        self.level = level if level is not None else (9 if self.codec == CODEC_ZSTD else 6)
+        self.min_size = min_size
+        self.dictionary_loader = dictionary_loader
+        self.dictionaries: Dict[int, Tuple[int, bytes]] = {}
+        self.current_dictionary_id = 0
+        # python-zstandard 압축기 / 해제기는 스레드 간에 공유할 수 없으므로 스레드별로 캐시
+        self._local = threading.local()
+
+    def add_dictionary(self, dictionary_id: int, codec: int, data: bytes, current: bool = True):
+        """사전 등록 (current=True이고 코덱이 같으면 이후 압축에 사용)"""
+        self.dictionaries[dictionary_id] = (codec, bytes(data))
+        if current and codec == self.codec:
+            self.current_dictionary_id = dictionary_id
+
+    def _zstd_cache(self, name: str) -> Dict[int, object]:
+        cache = getattr(self._local, name, None)
+        if cache is None:
+            cache = {}
+            setattr(self._local, name, cache)
+        return cache
+
+    def _dictionary(self, dictionary_id: int) -> Tuple[int, bytes]:
+        if dictionary_id not in self.dictionaries:
+            loaded = self.dictionary_loader(dictionary_id) if self.dictionary_loader else None
+            if loaded is None:
+                raise ValueError(f"압축 사전을 찾을 수 없습니다: {dictionary_id}")
+            self.add_dictionary(dictionary_id, *loaded, current=False)
+        return self.dictionaries[dictionary_id]
+
+    def _compress_payload(self, raw: bytes, dictionary_id: int) -> bytes:
+        if self.codec == CODEC_ZSTD:
+            compressors = self._zstd_cache('compressors')
+            compressor = compressors.get(dictionary_id)
+            if compressor is None:
+                dict_data = (zstandard.ZstdCompressionDict(self._dictionary(dictionary_id)[1])
+                             if dictionary_id else None)
+                compressor = zstandard.ZstdCompressor(level=self.level, dict_data=dict_data)
+                compressors[dictionary_id] = compressor
+            return compressor.compress(raw)
+        if dictionary_id:
+            compressor = zlib.compressobj(self.level, zdict=self._dictionary(dictionary_id)[1])
+        else:
+            compressor = zlib.compressobj(self.level)
+        return compressor.compress(raw) + compressor.flush()
+
+    def compress(self, text: Optional[str]) -> Union[str, bytes, None]:
+        """min_size 이상이면 헤더가 붙은 압축 블롭, 아니면 원래 텍스트 반환"""
+        if text is None:
+            return None
+        raw = text.encode('utf-8')
+        if len(raw) < self.min_size:
+            return text
+
+        dictionary_id = self.current_dictionary_id
+        payload = self._compress_payload(raw, dictionary_id)
+        if len(payload) + _HEADER.size >= len(raw):
+            return text
+        return _HEADER.pack(_MAGIC, self.codec, dictionary_id) + payload
+
+    def compress_bytes(self, raw: bytes) -> bytes:
+        """바이트열을 항상 헤더가 붙은 압축 블롭으로 변환 (원본 HTML처럼 UTF-8이 아닐 수 있는 데이터용)"""
+        dictionary_id = self.current_dictionary_id
+        return _HEADER.pack(_MAGIC, self.codec, dictionary_id) + self._compress_payload(raw, dictionary_id)
+
+    def _decompress_payload(self, codec: int, dictionary_id: int, payload: bytes) -> bytes:
+        if codec == CODEC_ZSTD:
+            if zstandard is None:
+                raise RuntimeError("zstd로 압축된 데이터를 읽으려면 zstandard 패키지가 필요합니다.")
+            decompressors = self._zstd_cache('decompressors')
+            decompressor = decompressors.get(dictionary_id)
+            if decompressor is None:
+                dict_data = (zstandard.ZstdCompressionDict(self._dictionary(dictionary_id)[1])
+                             if dictionary_id else None)
+                decompressor = zstandard.ZstdDecompressor(dict_data=dict_data)
+                decompressors[dictionary_id] = decompressor
+            return decompressor.decompress(payload)
+        if codec == CODEC_ZLIB:
+            if dictionary_id:
+                decompressor = zlib.decompressobj(zdict=self._dictionary(dictionary_id)[1])
+            else:
+                decompressor = zlib.decompressobj()
+            return decompressor.decompress(payload) + decompressor.flush()
+        raise ValueError(f"알 수 없는 압축 코덱입니다: {codec}")
+
+    def decompress(self, value: Union[str, bytes, None]) -> Optional[str]:
+        """compress 결과(또는 압축되지 않은 기존 텍스트)를 원래 텍스트로 복원"""
+        if value is None or isinstance(value, str):
+            return value
+        value = bytes(value)
+        if len(value) < _HEADER.size or value[0] != _MAGIC:
+            return value.decode('utf-8', errors='replace')
+
+        _, codec, dictionary_id = _HEADER.unpack_from(value)
+        return self._decompress_payload(codec, dictionary_id, value[_HEADER.size:]).decode('utf-8')
+
+    def decompress_bytes(self, value: bytes) -> bytes:
+        """compress_bytes 결과를 원래 바이트열로 복원"""
+        value = bytes(value)
+        if len(value) < _HEADER.size or value[0] != _MAGIC:
+            raise ValueError("압축 블롭 헤더가 없습니다.")
+        _, codec, dictionary_id = _HEADER.unpack_from(value)
+        return self._decompress_payload(codec, dictionary_id, value[_HEADER.size:])
@@ -272,6 +272,9 @@ def render_news_table(news_list, category, default_select=False):
     for i, news in enumerate(news_list, 1):
         # 요약 상태 아이콘 설정
         summary_status = "✅ 요약완료" if news.get('is_summarized') else "⏳ 미요약"
+        # 같은 사건 기사를 묶은 대표 기사는 묶인 건수 표시
+        if news.get('cluster_size', 1) > 1:
+            summary_status += f" · 🧩{news['cluster_size']}"
         
         df_data.append({
             '상태': summary_status,
@@ -347,14 +350,26 @@ def render_detailed_news_summary(summary):
     st.markdown(summary)
 
 
+def render_related_summaries(related_news):
+    """요약본 옆에 표시할 관련 기사 목록 렌더링"""
+    if not related_news:
+        return
+    st.markdown("#### 🔗 관련 기사")
+    for news in related_news:
+        st.markdown(
+            f"- [{news['title']}]({news['url']}) "
+            f"({news['source_name']} · {news['category']} · 유사도 {news['similarity']:.2f})"
+        )
+
+
 def render_db_news_selection():
     """DB에 저장된 뉴스 리스트 선택 UI"""
     st.subheader("📚 저장된 뉴스에서 선택")
     
-    # 데이터베이스에서 모든 뉴스 요약본 조회
+    # 데이터베이스에서 모든 뉴스 요약본 목록 조회 (요약 본문은 선택 시 로딩)
     from database import NewsDatabase
     db = NewsDatabase()
-    all_news = db.get_all_news_summaries()
+    all_news = db.list_news_summaries()
     
     if not all_news:
         st.warning("⚠️ 저장된 뉴스가 없습니다. 먼저 뉴스를 요약해주세요.")
@@ -383,14 +398,15 @@ def render_db_news_selection():
     selected_key = st.selectbox("저장된 뉴스를 선택하세요", list(news_options.keys()), index=0)
     
     if selected_key and news_options[selected_key]:
-        selected_news_data = news_options[selected_key]
-        selected_summary = selected_news_data['summary']
+        selected_news_data = db.get_news_summary_detail(news_options[selected_key]['id']) or news_options[selected_key]
+        selected_summary = selected_news_data.get('summary')
         
         st.info(f"**선택된 뉴스**: {selected_news_data['title']}")
         st.info(f"**뉴스 링크**: {selected_news_data['url']}")
         st.info(f"**카테고리**: {selected_news_data['category']}")
         st.info(f"**뉴스 소스**: {selected_news_data['source_name']}")
         st.info(f"**요약 생성일**: {selected_news_data['created_at']}")
+        render_related_summaries(db.get_related_summaries(selected_news_data['id']))
         
         return selected_news_data, selected_summary
     
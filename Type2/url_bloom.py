@@ -0,0 +1,222 @@
+"""
+전체 수집 이력의 URL을 담는 메모리 맵 기반 확장형(Scalable) 블룸 필터
+
+블룸 필터는 '없음'만 확실하므로, '있음' 판정은 DB에서 확인한 뒤 사용해야 합니다.
+파일 하나에 헤더 / 슬라이스 목록 / 비트 배열을 두고 mmap으로 열어 여러 프로세스가 공유합니다.
+쓰기(항목 추가, 슬라이스 추가, 통계 누적)는 옆의 .lock 파일 잠금(fcntl / msvcrt)으로 프로세스 사이에서도
+한 번에 하나만 하고, 조회는 잠금 없이 합니다 (비트는 켜지기만 하고 슬라이스 수는 마지막에 기록하므로).
+"""
+import hashlib
+import math
+import mmap
+import os
+import struct
+import threading
+from typing import Dict, Iterable, List
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+_MAGIC = b"URLBLOOM"
+_VERSION = 1
+# magic, version, 슬라이스 수, 초기 용량, 성장 배수, 목표 오탐률, 축소 비율, 오탐 확인 수, 부재 조회 수
+_HEADER = struct.Struct("<8sIIQIddQQ")
+_SLICE = struct.Struct("<QQIQQ")  # offset, 비트 수, 해시 수, 용량, 추가된 항목 수
+_MAX_SLICES = 32
+_DIRECTORY_OFFSET = 128
+_DATA_OFFSET = _DIRECTORY_OFFSET + _SLICE.size * _MAX_SLICES
+# 헤더 안의 오탐 확인 수 / 부재 조회 수 위치
+_LOOKUPS_OFFSET = struct.calcsize("<8sIIQIdd")
+
+
+def _hash_pair(item: str):
+    digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+    return int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little') | 1
+
+
+class _FileLock:
+    def __init__(self, path: str):
+        """프로세스 사이 배타 잠금 (같은 프로세스의 스레드끼리는 따로 threading.Lock으로 막아야 함)"""
+        self._file = open(path, 'a+b')
+
+    def __enter__(self):
+        if fcntl:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+        else:
+            self._file.seek(0)
+            msvcrt.locking(self._file.fileno(), msvcrt.LK_LOCK, 1)
+        return self
+
+    def __exit__(self, *exc):
+        if fcntl:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        else:
+            self._file.seek(0)
+            msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def close(self):
+        self._file.close()
+
+
+class ScalableBloomFilter:
+    def __init__(self, path: str, initial_capacity: int = 100_000, error_rate: float = 0.001,
+                 growth: int = 2, tightening: float = 0.5):
+        """파일이 없으면 새로 만들고, 있으면 저장된 설정으로 엽니다
+
+        슬라이스가 가득 차면 용량을 growth배로 늘린 새 슬라이스를 추가하고, 슬라이스별 오탐률을
+        tightening배씩 줄여 전체 오탐률이 error_rate 근처로 유지되도록 합니다.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._file_lock = _FileLock(path + ".lock")
+        self._file = None
+        self._mm = None
+        with self._file_lock:
+            self.created = not os.path.exists(path) or os.path.getsize(path) == 0
+            if self.created:
+                with open(path, 'wb') as f:
+                    f.write(_HEADER.pack(_MAGIC, _VERSION, 0, initial_capacity, growth, error_rate, tightening, 0, 0))
+                    f.truncate(_DATA_OFFSET)
+            self._open()
+            if self.created:
+                self._add_slice()
+
+    def _close_map(self):
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _open(self):
+        self._close_map()
+        self._file = open(self.path, 'r+b')
+        self._mm = mmap.mmap(self._file.fileno(), 0)
+        magic, version, *_ = _HEADER.unpack_from(self._mm, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"URL 블룸 필터 파일 형식이 올바르지 않습니다: {self.path}")
+
+    def _header(self):
+        return _HEADER.unpack_from(self._mm, 0)
+
+    def _slices(self) -> List[tuple]:
+        count = self._header()[2]
+        return [_SLICE.unpack_from(self._mm, _DIRECTORY_OFFSET + i * _SLICE.size) for i in range(count)]
+
+    def _sync(self):
+        """다른 프로세스가 슬라이스를 추가해 파일이 커졌으면 다시 매핑"""
+        if os.path.getsize(self.path) != len(self._mm):
+            self._open()
+
+    def _add_slice(self):
+        """새 슬라이스 추가 (파일 잠금을 잡은 상태에서 호출)"""
+        _, _, count, initial_capacity, growth, error_rate, tightening, _, _ = self._header()
+        if count >= _MAX_SLICES:
+            raise RuntimeError("URL 블룸 필터 슬라이스 수가 한도를 넘었습니다.")
+        capacity = initial_capacity * growth ** count
+        slice_error = error_rate * (1 - tightening) * tightening ** count
+        num_hashes = max(1, math.ceil(math.log2(1 / slice_error)))
+        num_bits = math.ceil(capacity * abs(math.log(slice_error)) / (math.log(2) ** 2))
+        num_bits = (num_bits + 63) // 64 * 64
+        offset = len(self._mm)
+
+        # 매핑을 닫은 뒤 파일을 늘려야 Windows에서도 동작
+        self._mm.flush()
+        self._close_map()
+        with open(self.path, 'r+b') as f:
+            f.truncate(offset + num_bits // 8)
+        self._open()
+        _SLICE.pack_into(self._mm, _DIRECTORY_OFFSET + count * _SLICE.size, offset, num_bits, num_hashes, capacity, 0)
+        struct.pack_into("<I", self._mm, 12, count + 1)
+
+    def _positions(self, h1: int, h2: int, num_bits: int, num_hashes: int):
+        return [(h1 + i * h2) % num_bits for i in range(num_hashes)]
+
+    def _contains_hashed(self, h1: int, h2: int) -> bool:
+        mm = self._mm
+        for offset, num_bits, num_hashes, _, _ in self._slices():
+            if all(mm[offset + (bit >> 3)] & (1 << (bit & 7)) for bit in self._positions(h1, h2, num_bits, num_hashes)):
+                return True
+        return False
+
+    def __contains__(self, item: str) -> bool:
+        with self._lock:
+            self._sync()
+            return self._contains_hashed(*_hash_pair(item))
+
+    def _add_hashed(self, h1: int, h2: int) -> bool:
+        """항목 추가 (스레드 / 파일 잠금을 잡고 _sync한 상태에서 호출)"""
+        if self._contains_hashed(h1, h2):
+            return False
+        slices = self._slices()
+        index = len(slices) - 1
+        offset, num_bits, num_hashes, capacity, added = slices[index]
+        if added >= capacity:
+            self._add_slice()
+            index += 1
+            offset, num_bits, num_hashes, capacity, added = self._slices()[index]
+        mm = self._mm
+        for bit in self._positions(h1, h2, num_bits, num_hashes):
+            mm[offset + (bit >> 3)] |= 1 << (bit & 7)
+        struct.pack_into("<Q", mm, _DIRECTORY_OFFSET + index * _SLICE.size + 28, added + 1)
+        return True
+
+    def add(self, item: str) -> bool:
+        """항목 추가 (이미 있다고 판정되면 False)"""
+        hashed = _hash_pair(item)
+        with self._lock, self._file_lock:
+            self._sync()
+            return self._add_hashed(*hashed)
+
+    def update(self, items: Iterable[str]) -> int:
+        """여러 항목 추가 (새로 추가된 수 반환) - 잠금은 한 번만 잡음"""
+        hashed = [_hash_pair(item) for item in items]
+        with self._lock, self._file_lock:
+            self._sync()
+            added = sum(1 for h1, h2 in hashed if self._add_hashed(h1, h2))
+            self._mm.flush()
+        return added
+
+    def record_lookups(self, absent: int, false_positives: int):
+        """DB 확인 결과 누적 (absent: 실제로 없던 URL 조회 수, false_positives: 그중 '있음'으로 잘못 판정된 수)"""
+        with self._lock, self._file_lock:
+            self._sync()
+            header = self._header()
+            struct.pack_into("<QQ", self._mm, _LOOKUPS_OFFSET, header[7] + false_positives, header[8] + absent)
+
+    def stats(self) -> Dict:
+        """항목 수, 용량, 예상 / 실측 오탐률"""
+        with self._lock:
+            self._sync()
+            header = self._header()
+            slices = self._slices()
+        items = sum(s[4] for s in slices)
+        # 슬라이스별 현재 채움 정도 기준 예상 오탐률: 1 - Π(1 - (1 - e^(-k n / m))^k)
+        miss_all = 1.0
+        for _, num_bits, num_hashes, _, added in slices:
+            miss_all *= 1 - (1 - math.exp(-num_hashes * added / num_bits)) ** num_hashes
+        false_positives, absent = header[7], header[8]
+        return {
+            'items': items,
+            'capacity': sum(s[3] for s in slices),
+            'slices': len(slices),
+            'bytes': len(self._mm),
+            'target_error_rate': header[5],
+            'expected_fp_rate': 1 - miss_all,
+            'absent_lookups': absent,
+            'false_positives': false_positives,
+            'measured_fp_rate': false_positives / absent if absent else 0.0,
+        }
+
+    def flush(self):
+        with self._lock:
+            self._mm.flush()
+
+    def close(self):
+        with self._lock:
+            self._close_map()
+            self._file_lock.close()
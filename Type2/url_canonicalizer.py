@@ -0,0 +1,97 @@
+"""
+뉴스 URL 정규화 (스크래퍼, 중복 제거, 요약본 조회가 같은 키를 사용하도록)
+
+- 상대 경로는 목록 페이지 URL 기준으로 urljoin
+- scheme / 호스트 소문자화, 기본 포트 제거, 프래그먼트(#...) 제거
+- 추적용 파라미터(utm_*, fbclid 등) 제거 후 나머지 파라미터 정렬
+- 사이트별 규칙(SITE_RULES) 적용 - 규칙에 대표 호스트가 있는 사이트만 m. / mobile. 호스트를 통일
+  (그 외 모바일 호스트는 www. 호스트가 따로 있다는 보장이 없으므로 그대로 둠)
+"""
+import re
+from typing import Dict, List, Optional
+from urllib.parse import unquote_plus, urljoin, urlsplit, urlunsplit
+
+# 모든 사이트에서 제거하는 추적용 파라미터
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'igshid', 'mc_cid', 'mc_eid', '_ga', 'yclid',
+}
+TRACKING_PARAM_PREFIXES = ('utm_',)
+
+# 사이트별 규칙 (키는 www. / m. 을 뗀 도메인)
+#   host: 대표 호스트, https: https로 통일, drop_params: 추가로 제거할 파라미터,
+#   drop_param_prefixes: 추가로 제거할 파라미터 접두사, keep_params: 지정 시 이 파라미터만 유지
+SITE_RULES: Dict[str, Dict] = {
+    'hankookilbo.com': {'host': 'www.hankookilbo.com', 'https': True, 'drop_params': {'did', 'rPrev'}},
+    'khan.co.kr': {'host': 'www.khan.co.kr', 'https': True, 'drop_params': {'med_id', 'ref'}},
+    'chosun.com': {'host': 'www.chosun.com', 'https': True, 'drop_params': {'ref'}},
+    'hani.co.kr': {'host': 'www.hani.co.kr', 'https': True, 'drop_params': {'_fr', '_ns'}},
+    'seoul.co.kr': {'host': 'www.seoul.co.kr', 'https': True, 'drop_param_prefixes': ('wlog_',)},
+}
+
+_DEFAULT_PORTS = {'http': 80, 'https': 443}
+_MOBILE_PREFIXES = ('m.', 'mobile.')
+_PERCENT_ESCAPE = re.compile(r'%[0-9a-fA-F]{2}')
+
+
+def _normalize_escapes(value: str) -> str:
+    return _PERCENT_ESCAPE.sub(lambda m: m.group(0).upper(), value)
+
+
+def _site_domain(host: str) -> str:
+    for prefix in ('www.',) + _MOBILE_PREFIXES:
+        if host.startswith(prefix):
+            return host[len(prefix):]
+    return host
+
+
+def _is_dropped(name: str, rule: Dict) -> bool:
+    lowered = name.lower()
+    if lowered in TRACKING_PARAMS or lowered.startswith(TRACKING_PARAM_PREFIXES):
+        return True
+    if rule.get('keep_params') is not None:
+        return name not in rule['keep_params']
+    return name in rule.get('drop_params', ()) or name.startswith(rule.get('drop_param_prefixes', ()))
+
+
+def canonicalize_url(url: str, base: str = None) -> Optional[str]:
+    """URL을 정규화된 절대 URL로 변환 (http(s)가 아니거나 해석할 수 없으면 None)
+
+    base: 상대 경로 해석 기준 (목록 페이지 URL)
+    """
+    if not url:
+        return None
+    url = url.strip()
+    if base:
+        url = urljoin(base, url)
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return None
+
+    scheme = original_scheme = parts.scheme.lower()
+    host = (parts.hostname or "").rstrip('.')
+    if scheme not in _DEFAULT_PORTS or not host:
+        return None
+
+    domain = _site_domain(host)
+    rule = SITE_RULES.get(domain, {})
+    if rule.get('host'):
+        host = rule['host']
+    if rule.get('https'):
+        scheme = 'https'
+
+    netloc = host if port in (None, _DEFAULT_PORTS[original_scheme]) else f"{host}:{port}"
+    path = _normalize_escapes(parts.path) or '/'
+    # 값은 디코딩하지 않고 원래 인코딩 그대로 정렬 (EUC-KR 등 UTF-8이 아닌 값 보존)
+    params = [_normalize_escapes(param) for param in parts.query.split('&') if param]
+    query = '&'.join(sorted(param for param in params if not _is_dropped(unquote_plus(param.partition('=')[0]), rule)))
+    return urlunsplit((scheme, netloc, path, query, ''))
+
+
+def lookup_urls(url: str) -> List[str]:
+    """DB 조회용 후보 URL (정규화 URL + 정규화 이전에 저장된 원본 URL)"""
+    canonical = canonicalize_url(url)
+    if not canonical or canonical == url:
+        return [url]
+    return [canonical, url]